@@ -0,0 +1 @@
+"""Benchmarks of the core_website_app pages and REST API"""
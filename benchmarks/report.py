@@ -0,0 +1,193 @@
+"""Benchmark reports"""
+
+import json
+import math
+import statistics
+
+LATENCY_KEYS = ["min", "mean", "median", "p95", "max"]
+
+
+def summarize(
+    name, scenario, durations, query_count, status_code, errors=None
+):
+    """Compute the statistics of a benchmark
+
+    Args:
+        name: name of the scenario
+        scenario: Scenario
+        durations: duration of each iteration, in seconds
+        query_count: number of queries sent by one request
+        status_code: status code of the last response
+        errors: statuses of the responses that were not the expected one
+
+    Returns:
+        dict
+    """
+    durations_ms = sorted(duration * 1000 for duration in durations)
+    total = sum(durations)
+    return {
+        "name": name,
+        "group": scenario.group,
+        "method": scenario.method.upper(),
+        "status_code": status_code,
+        "expected_status": scenario.expected_status,
+        # number of responses without the expected status, and their
+        # statuses
+        "errors": len(errors or []),
+        "error_statuses": sorted(set(errors or [])),
+        "iterations": len(durations_ms),
+        "latency_ms": {
+            "min": durations_ms[0],
+            "mean": statistics.fmean(durations_ms),
+            "median": statistics.median(durations_ms),
+            "p95": durations_ms[
+                max(0, math.ceil(0.95 * len(durations_ms)) - 1)
+            ],
+            "max": durations_ms[-1],
+        },
+        "throughput_rps": len(durations) / total if total else None,
+        "queries": query_count,
+    }
+
+
+def save(report, path):
+    """Write a report as JSON
+
+    Args:
+        report:
+        path:
+
+    Returns:
+
+    """
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
+        report_file.write("\n")
+
+
+def load(path):
+    """Read a JSON report
+
+    Args:
+        path:
+
+    Returns:
+
+    """
+    with open(path, encoding="utf-8") as report_file:
+        return json.load(report_file)
+
+
+def compare(baseline, current, threshold):
+    """Compare a report to a baseline report
+
+    A benchmark regresses when its median latency grows by more than the
+    threshold, when it sends more queries, or when some of its responses
+    did not have the expected status.
+
+    Args:
+        baseline: baseline report
+        current: new report
+        threshold: allowed relative growth of the median latency
+
+    Returns:
+        list of dict, one per benchmark found in both reports
+    """
+    baseline_results = {
+        result["name"]: result for result in baseline["results"]
+    }
+    rows = []
+    for result in current["results"]:
+        baseline_result = baseline_results.get(result["name"])
+        if baseline_result is None:
+            continue
+        baseline_median = baseline_result["latency_ms"]["median"]
+        median = result["latency_ms"]["median"]
+        change = (
+            (median - baseline_median) / baseline_median
+            if baseline_median
+            else 0.0
+        )
+        rows.append(
+            {
+                "name": result["name"],
+                "baseline_median_ms": baseline_median,
+                "median_ms": median,
+                "change": change,
+                "baseline_queries": baseline_result["queries"],
+                "queries": result["queries"],
+                "errors": result.get("errors", 0),
+                "regression": change > threshold
+                or result["queries"] > baseline_result["queries"]
+                or bool(result.get("errors")),
+            }
+        )
+    return rows
+
+
+def format_results(report):
+    """Format the results of a report as a text table
+
+    Args:
+        report:
+
+    Returns:
+        str
+    """
+    lines = [
+        "%-32s %6s %9s %9s %9s %9s %7s"
+        % ("benchmark", "status", "median", "p95", "max", "req/s", "queries")
+    ]
+    for result in report["results"]:
+        latency = result["latency_ms"]
+        lines.append(
+            "%-32s %6s %7.2fms %7.2fms %7.2fms %9.1f %7d%s"
+            % (
+                result["name"],
+                result["status_code"],
+                latency["median"],
+                latency["p95"],
+                latency["max"],
+                result["throughput_rps"] or 0,
+                result["queries"],
+                (
+                    " FAILED (%d)" % result["errors"]
+                    if result.get("errors")
+                    else ""
+                ),
+            )
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows):
+    """Format a comparison as a text table
+
+    Args:
+        rows: result of compare
+
+    Returns:
+        str
+    """
+    lines = [
+        "%-32s %11s %11s %8s %9s"
+        % ("benchmark", "baseline", "current", "change", "queries")
+    ]
+    for row in rows:
+        lines.append(
+            "%-32s %9.2fms %9.2fms %+7.1f%% %4d->%-4d%s"
+            % (
+                row["name"],
+                row["baseline_median_ms"],
+                row["median_ms"],
+                row["change"] * 100,
+                row["baseline_queries"],
+                row["queries"],
+                (
+                    " REGRESSION (%d unexpected statuses)" % row["errors"]
+                    if row["errors"]
+                    else " REGRESSION" if row["regression"] else ""
+                ),
+            )
+        )
+    return "\n".join(lines)
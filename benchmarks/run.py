@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""Run the benchmarks
+
+Seed a test database, send each request of the benchmarks and write the
+latency, throughput and number of queries in a JSON report.
+
+Examples:
+    python -m benchmarks.run
+    python -m benchmarks.run --account-requests 5000 --contact-messages 5000
+    python -m benchmarks.run --output after.json --compare before.json
+"""
+
+import argparse
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import django
+
+
+def parse_args(argv=None):
+    """Parse the command line arguments
+
+    Args:
+        argv:
+
+    Returns:
+
+    """
+    parser = argparse.ArgumentParser(description="Run the benchmarks.")
+    parser.add_argument(
+        "--account-requests",
+        type=int,
+        default=1000,
+        help="Number of pending account requests seeded.",
+    )
+    parser.add_argument(
+        "--contact-messages",
+        type=int,
+        default=1000,
+        help="Number of contact messages seeded.",
+    )
+    parser.add_argument(
+        "--page-sections",
+        type=int,
+        default=20,
+        help="Number of markdown sections of each web page.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=50,
+        help="Number of measured requests per benchmark.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=5,
+        help="Number of requests sent before measuring.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="Only run the benchmarks whose name contains this value.",
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark-report.json",
+        help="Path of the JSON report.",
+    )
+    parser.add_argument(
+        "--compare",
+        help="Path of a JSON report to compare the results with.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative growth of the median latency (default 0.2).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the benchmarks
+
+    Args:
+        argv:
+
+    Returns:
+        exit status, 1 if a regression or an unexpected status was found
+    """
+    args = parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from benchmarks import report
+
+    setup_test_environment()
+    old_database_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        results = run_benchmarks(args)
+    finally:
+        connection.creation.destroy_test_db(old_database_name, verbosity=0)
+
+    current_report = {
+        "meta": _get_meta(args, connection.vendor),
+        "results": results,
+    }
+    report.save(current_report, args.output)
+    print(report.format_results(current_report))
+    print("\nReport written to %s" % args.output)
+
+    failed = [result for result in results if result["errors"]]
+    for result in failed:
+        print(
+            "\n%s: %d responses had an unexpected status (%s)"
+            % (
+                result["name"],
+                result["errors"],
+                ", ".join(map(str, result["error_statuses"])),
+            )
+        )
+
+    if args.compare:
+        rows = report.compare(
+            report.load(args.compare), current_report, args.threshold
+        )
+        print("\nCompared to %s:" % args.compare)
+        print(report.format_comparison(rows))
+        if any(row["regression"] for row in rows):
+            return 1
+    return 1 if failed else 0
+
+
+def run_benchmarks(args):
+    """Seed the database and run the benchmarks
+
+    Args:
+        args:
+
+    Returns:
+        list of results
+    """
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+
+    from benchmarks import report, scenarios, seed
+
+    requests_per_scenario = args.warmup + args.iterations + 1
+    account_requests = seed.seed_account_requests(args.account_requests)
+    accept_pool = seed.seed_account_requests(
+        requests_per_scenario, prefix="accept"
+    )
+    deny_pool = seed.seed_account_requests(
+        requests_per_scenario, prefix="deny"
+    )
+    seed.seed_contact_messages(args.contact_messages)
+    seed.seed_web_pages(args.page_sections)
+    staff_user = seed.seed_staff_user()
+    cache.clear()
+
+    clients = {scenarios.ANONYMOUS: Client(), scenarios.STAFF: Client()}
+    clients[scenarios.STAFF].force_login(staff_user)
+
+    results = []
+    for scenario in scenarios.get_scenarios(
+        account_requests, accept_pool, deny_pool
+    ):
+        if args.only and not any(
+            value in scenario.name for value in args.only
+        ):
+            continue
+        client = clients[scenario.client]
+        # statuses of the responses that differ from the expected one
+        errors = []
+
+        for iteration in range(args.warmup):
+            _check_status(scenario, scenario.send(client, iteration), errors)
+
+        # queries are counted on a single request, to keep the timings
+        # free from the cost of recording them
+        with CaptureQueriesContext(connection) as queries:
+            response = scenario.send(client, args.warmup)
+        _check_status(scenario, response, errors)
+        # the query log is cleared by the next requests
+        query_count = len(queries)
+
+        durations = []
+        for iteration in range(args.warmup + 1, requests_per_scenario):
+            start = time.perf_counter()
+            response = scenario.send(client, iteration)
+            durations.append(time.perf_counter() - start)
+            _check_status(scenario, response, errors)
+
+        results.append(
+            report.summarize(
+                scenario.name,
+                scenario,
+                durations,
+                query_count,
+                response.status_code,
+                errors,
+            )
+        )
+    return results
+
+
+def _check_status(scenario, response, errors):
+    """Record the status of a response if it is not the expected one
+
+    Args:
+        scenario:
+        response:
+        errors: list of the unexpected statuses
+
+    Returns:
+
+    """
+    if response.status_code != scenario.expected_status:
+        errors.append(response.status_code)
+
+
+def _get_meta(args, database_vendor):
+    """Describe the environment of the benchmarks
+
+    Args:
+        args:
+        database_vendor:
+
+    Returns:
+        dict
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": database_vendor,
+        "account_requests": args.account_requests,
+        "contact_messages": args.contact_messages,
+        "page_sections": args.page_sections,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Requests measured by the benchmarks"""
+
+PUBLIC = "public"
+ADMIN = "admin"
+REST = "rest"
+
+ANONYMOUS = "anonymous"
+STAFF = "staff"
+
+
+class Scenario:
+    """HTTP request sent at each iteration of a benchmark"""
+
+    def __init__(
+        self,
+        name,
+        group,
+        path,
+        method="get",
+        client=ANONYMOUS,
+        data=None,
+        content_type=None,
+        expected_status=200,
+    ):
+        """Initialize the scenario
+
+        Args:
+            name: unique name of the scenario in the report
+            group: public, admin or rest
+            path: url, or function of the iteration number returning the url
+            method: HTTP method
+            client: anonymous or staff
+            data: data, or function of the iteration number returning it
+            content_type: content type of the data
+            expected_status: status code of a successful response
+        """
+        self.name = name
+        self.group = group
+        self.path = path
+        self.method = method
+        self.client = client
+        self.data = data
+        self.content_type = content_type
+        self.expected_status = expected_status
+
+    def send(self, client, iteration):
+        """Send the request of an iteration
+
+        Args:
+            client: Django test client
+            iteration: iteration number, unique for the scenario
+
+        Returns:
+            HTTP response
+        """
+        path = self.path(iteration) if callable(self.path) else self.path
+        data = self.data(iteration) if callable(self.data) else self.data
+        kwargs = {}
+        if data is not None:
+            kwargs["data"] = data
+        if self.content_type:
+            kwargs["content_type"] = self.content_type
+        return getattr(client, self.method)(path, **kwargs)
+
+
+def get_scenarios(account_requests, accept_pool, deny_pool):
+    """Get the scenarios of the benchmarks
+
+    Args:
+        account_requests: seeded pending requests, read by the detail views
+        accept_pool: requests consumed by the accept scenarios
+        deny_pool: requests consumed by the deny scenarios
+
+    Returns:
+        list of Scenario
+    """
+    account_request_id = account_requests[0].id
+    return [
+        Scenario("request_new_account_get", PUBLIC, "/account-request/"),
+        Scenario(
+            "request_new_account_post",
+            PUBLIC,
+            "/account-request/",
+            method="post",
+            data=_get_account_request_form,
+            expected_status=302,
+        ),
+        Scenario("contact_get", PUBLIC, "/contact/"),
+        Scenario(
+            "contact_post",
+            PUBLIC,
+            "/contact/",
+            method="post",
+            data=_get_contact_form,
+            expected_status=302,
+        ),
+        Scenario("help", PUBLIC, "/help/"),
+        Scenario("privacy_policy", PUBLIC, "/privacy/"),
+        Scenario("terms_of_use", PUBLIC, "/terms/"),
+        Scenario("rules_of_behavior", PUBLIC, "/rules-of-behavior/"),
+        Scenario(
+            "admin_user_requests",
+            ADMIN,
+            "/core-admin/user-requests",
+            client=STAFF,
+        ),
+        Scenario(
+            "admin_contact_messages",
+            ADMIN,
+            "/core-admin/contact-messages",
+            client=STAFF,
+        ),
+        Scenario(
+            "admin_request_count",
+            ADMIN,
+            "/core-admin/request_count",
+            method="post",
+            client=STAFF,
+        ),
+        Scenario(
+            "admin_message_count",
+            ADMIN,
+            "/core-admin/message_count",
+            method="post",
+            client=STAFF,
+        ),
+        Scenario(
+            "rest_account_request_list",
+            REST,
+            "/website/user-requests/",
+            client=STAFF,
+        ),
+        Scenario(
+            "rest_account_request_detail",
+            REST,
+            "/website/user-requests/%d/" % account_request_id,
+            client=STAFF,
+        ),
+        Scenario(
+            "rest_account_request_accept",
+            REST,
+            lambda iteration: "/website/user-requests/%d/accept/"
+            % accept_pool[iteration].id,
+            method="patch",
+            client=STAFF,
+        ),
+        Scenario(
+            "rest_account_request_deny",
+            REST,
+            lambda iteration: "/website/user-requests/%d/deny/"
+            % deny_pool[iteration].id,
+            method="patch",
+            client=STAFF,
+        ),
+        Scenario(
+            "rest_contact_message_list",
+            REST,
+            "/website/messages/",
+            client=STAFF,
+        ),
+    ]
+
+
+def _get_account_request_form(iteration):
+    """Get the data of the account request form
+
+    Args:
+        iteration:
+
+    Returns:
+
+    """
+    return {
+        "username": "signup%d" % iteration,
+        "firstname": "First",
+        "lastname": "Last",
+        "email": "signup%d@example.com" % iteration,
+        "password1": "Benchmark-password-1",
+        "password2": "Benchmark-password-1",
+        "captcha_0": "benchmark",
+        "captcha_1": "PASSED",
+    }
+
+
+def _get_contact_form(iteration):
+    """Get the data of the contact form
+
+    Args:
+        iteration:
+
+    Returns:
+
+    """
+    return {
+        "name": "Name %d" % iteration,
+        "email": "contact%d@example.com" % iteration,
+        "message": "Message %d" % iteration,
+        "captcha_0": "benchmark",
+        "captcha_1": "PASSED",
+    }
@@ -0,0 +1,112 @@
+"""Seed the benchmark database"""
+
+from django.contrib.auth.models import User
+
+from core_main_app.components.web_page.models import WebPage
+from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.components.contact_message.models import ContactMessage
+
+BATCH_SIZE = 1000
+WEB_PAGE_NAMES = [
+    "help",
+    "privacy_policy",
+    "terms_of_use",
+    "rules_of_behavior",
+]
+
+
+def seed_account_requests(count, prefix="user"):
+    """Create pending account requests and their inactive users
+
+    Args:
+        count: number of requests
+        prefix: prefix of the usernames
+
+    Returns:
+        list of AccountRequest
+    """
+    usernames = ["%s%d" % (prefix, index) for index in range(count)]
+    User.objects.bulk_create(
+        [
+            User(
+                username=username,
+                email="%s@example.com" % username,
+                first_name="First",
+                last_name="Last",
+                is_active=False,
+            )
+            for username in usernames
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    AccountRequest.objects.bulk_create(
+        [
+            AccountRequest(
+                username=username,
+                email="%s@example.com" % username,
+                first_name="First",
+                last_name="Last",
+            )
+            for username in usernames
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    return list(
+        AccountRequest.objects.filter(username__in=usernames).order_by("id")
+    )
+
+
+def seed_contact_messages(count):
+    """Create contact messages
+
+    Args:
+        count: number of messages
+
+    Returns:
+
+    """
+    ContactMessage.objects.bulk_create(
+        [
+            ContactMessage(
+                name="Name %d" % index,
+                email="contact%d@example.com" % index,
+                content="Message %d. " % index * 10,
+            )
+            for index in range(count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def seed_web_pages(sections):
+    """Create the help, privacy policy, terms of use and rules of behavior
+    pages, written in markdown
+
+    Args:
+        sections: number of sections in each page
+
+    Returns:
+
+    """
+    for web_page_name in WEB_PAGE_NAMES:
+        content = "\n\n".join(
+            "## Section %d\n\n%s\n\n* item\n* [link](https://example.com)"
+            % (index, "Lorem ipsum dolor sit amet. " * 20)
+            for index in range(sections)
+        )
+        WebPage.objects.create(
+            type=WEB_PAGE_TYPES[web_page_name],
+            content="# %s\n\n%s" % (web_page_name, content),
+        )
+
+
+def seed_staff_user():
+    """Create the staff user running the admin and REST requests
+
+    Returns:
+        User
+    """
+    return User.objects.create_superuser(
+        "benchmark_admin", "benchmark_admin@example.com", "benchmark"
+    )
@@ -0,0 +1,107 @@
+"""Benchmark settings
+
+The database can be changed with the BENCHMARK_DB_ENGINE, BENCHMARK_DB_NAME,
+BENCHMARK_DB_USER, BENCHMARK_DB_PASSWORD, BENCHMARK_DB_HOST and
+BENCHMARK_DB_PORT environment variables. A test database is created from
+them, an in-memory SQLite database is used by default.
+"""
+
+import os
+
+SECRET_KEY = "fake-key"
+SERVER_URI = "http://localhost"
+DEBUG = False
+ALLOWED_HOSTS = ["testserver", "localhost"]
+
+INSTALLED_APPS = [
+    # Django apps
+    "django.contrib.admin",
+    "django.contrib.messages",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sites",
+    "django.contrib.sessions",
+    "django.contrib.staticfiles",
+    # Extra apps
+    "captcha",
+    "menu",
+    # Local app
+    "core_main_app",
+    "core_website_app",
+]
+
+MIDDLEWARE = (
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+)
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": ["templates"],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+                "core_main_app.utils.custom_context_processors.domain_context_processor",
+                "django.template.context_processors.i18n",
+            ],
+        },
+    },
+]
+
+DATABASES = {
+    "default": {
+        "ENGINE": os.environ.get(
+            "BENCHMARK_DB_ENGINE", "django.db.backends.sqlite3"
+        ),
+        "NAME": os.environ.get("BENCHMARK_DB_NAME", ":memory:"),
+        "USER": os.environ.get("BENCHMARK_DB_USER", ""),
+        "PASSWORD": os.environ.get("BENCHMARK_DB_PASSWORD", ""),
+        "HOST": os.environ.get("BENCHMARK_DB_HOST", ""),
+        "PORT": os.environ.get("BENCHMARK_DB_PORT", ""),
+    },
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": True,
+    "handlers": {
+        "null": {
+            "level": "DEBUG",
+            "class": "logging.NullHandler",
+        },
+    },
+    "loggers": {
+        "": {
+            "handlers": ["null"],
+            "level": "DEBUG",
+        },
+    },
+}
+
+WEBSITE_CONTACTS = [
+    ("admin1", "admin1@example.com"),
+    ("admin2", "admin2@example.com"),
+]
+CUSTOM_NAME = "Curator"
+STATIC_URL = "/static/"
+ROOT_URLCONF = "benchmarks.urls"
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+CELERYBEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+CAPTCHA_TEST_MODE = True
+
+SEND_EMAIL_WHEN_CONTACT_MESSAGE_IS_RECEIVED = True
+SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED = True
+SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_DENIED = True
+
+MONGODB_INDEXING = False
+MONGODB_ASYNC_SAVE = False
+
+# all the benchmark requests come from the same client, they must not be
+# rejected by the limits of the submissions
+RATE_LIMITS = {}
@@ -5,12 +5,15 @@ from django.urls import re_path
 from django.contrib import admin
 from core_main_app.admin import core_admin_site
 from core_main_app.components.web_page.models import WEB_PAGE_TYPES
-from core_main_app.views.admin.views import WebPageView
 import core_website_app.components.help.api as help_api
 import core_website_app.components.privacy_policy.api as privacy_policy_api
 import core_website_app.components.rules_of_behavior.api as rules_of_behavior_api
 import core_website_app.components.terms_of_use.api as terms_of_use_api
 from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.components.admin_notification.models import (
+    AdminNotification,
+)
+from core_website_app.components.outbound_email.models import OutboundEmail
 from core_website_app.views.admin import (
     views as admin_views,
     ajax as admin_ajax,
@@ -32,6 +35,16 @@ admin_urls = [
         admin_ajax.deny_request,
         name="core_website_app_deny_user_request",
     ),
+    re_path(
+        r"^bulk_accept_requests$",
+        admin_ajax.bulk_accept_requests,
+        name="core_website_app_bulk_accept_user_requests",
+    ),
+    re_path(
+        r"^bulk_deny_requests$",
+        admin_ajax.bulk_deny_requests,
+        name="core_website_app_bulk_deny_user_requests",
+    ),
     re_path(
         r"^get_deny_email_template",
         admin_ajax.get_deny_email_template,
@@ -57,10 +70,20 @@ admin_urls = [
         admin_ajax.contact_message_count,
         name="core_website_app_message_count",
     ),
+    re_path(
+        r"^badge_counts$",
+        admin_ajax.badge_counts_view,
+        name="core_website_app_badge_counts",
+    ),
+    re_path(
+        r"^admin_events$",
+        admin_ajax.admin_events_stream,
+        name="core_website_app_admin_events",
+    ),
     re_path(
         r"^privacy-policy$",
         staff_member_required(
-            WebPageView.as_view(
+            admin_views.WebsitePageView.as_view(
                 api=privacy_policy_api,
                 get_redirect="core_website_app/admin/privacy_policy.html",
                 post_redirect="core-admin:core_website_app_privacy",
@@ -72,7 +95,7 @@ admin_urls = [
     re_path(
         r"^terms-of-use$",
         staff_member_required(
-            WebPageView.as_view(
+            admin_views.WebsitePageView.as_view(
                 api=terms_of_use_api,
                 get_redirect="core_website_app/admin/terms_of_use.html",
                 post_redirect="core-admin:core_website_app_terms",
@@ -84,7 +107,7 @@ admin_urls = [
     re_path(
         r"^help$",
         staff_member_required(
-            WebPageView.as_view(
+            admin_views.WebsitePageView.as_view(
                 api=help_api,
                 get_redirect="core_website_app/admin/help.html",
                 post_redirect="core-admin:core_website_app_help",
@@ -96,7 +119,7 @@ admin_urls = [
     re_path(
         r"^rules_of_behavior$",
         staff_member_required(
-            WebPageView.as_view(
+            admin_views.WebsitePageView.as_view(
                 api=rules_of_behavior_api,
                 get_redirect="core_website_app/admin/rules_of_behavior.html",
                 post_redirect="core-admin:core_website_app_rules_of_behavior",
@@ -111,3 +134,5 @@ urls = core_admin_site.get_urls()
 core_admin_site.get_urls = lambda: admin_urls + urls
 
 admin.site.register(AccountRequest)
+admin.site.register(OutboundEmail)
+admin.site.register(AdminNotification)
@@ -8,3 +8,97 @@ class CoreWebsiteAppConfig(AppConfig):
 
     name = "core_website_app"
     verbose_name = "Core Website App"
+
+    def ready(self):
+        """Run when the app is ready
+
+        Returns:
+
+        """
+        _init_account_request_signals()
+        _init_contact_message_signals()
+        _init_web_page_signals()
+        _init_query_stats()
+
+
+def _init_account_request_signals():
+    """Initialize account request signals
+
+    Returns:
+
+    """
+    from core_website_app.components.account_request import (
+        signals as account_request_signals,
+    )
+
+    account_request_signals.connect()
+
+
+def _init_contact_message_signals():
+    """Initialize contact message signals
+
+    Returns:
+
+    """
+    from core_website_app.components.contact_message import (
+        signals as contact_message_signals,
+    )
+
+    contact_message_signals.connect()
+
+
+def _init_web_page_signals():
+    """Initialize web page signals
+
+    Returns:
+
+    """
+    from core_website_app.components.web_page import (
+        signals as web_page_signals,
+    )
+
+    web_page_signals.connect()
+
+
+def _init_query_stats():
+    """Instrument the component APIs, if the query statistics are enabled
+
+    Returns:
+
+    """
+    from core_website_app import settings
+
+    if not settings.QUERY_STATS_ENABLED:
+        return
+
+    from core_website_app.components.account_request import (
+        api as account_request_api,
+    )
+    from core_website_app.components.contact_message import (
+        api as contact_message_api,
+    )
+    from core_website_app.components.help import api as help_api
+    from core_website_app.components.outbound_email import (
+        api as outbound_email_api,
+    )
+    from core_website_app.components.privacy_policy import (
+        api as privacy_policy_api,
+    )
+    from core_website_app.components.rules_of_behavior import (
+        api as rules_of_behavior_api,
+    )
+    from core_website_app.components.terms_of_use import (
+        api as terms_of_use_api,
+    )
+    from core_website_app.utils.query_stats import instrument_module
+
+    for api_module in (
+        account_request_api,
+        contact_message_api,
+        help_api,
+        outbound_email_api,
+        privacy_policy_api,
+        rules_of_behavior_api,
+        terms_of_use_api,
+    ):
+        instrument_module(api_module)
@@ -2,11 +2,11 @@
 
 from core_main_app.commons.enums import WEB_PAGE_TYPES
 
-WEB_PAGE_TYPES.update(
-    {
-        "terms_of_use": 0,
-        "privacy_policy": 1,
-        "help": 2,
-        "rules_of_behavior": 4,
-    }
-)
+WEBSITE_PAGE_TYPES = {
+    "terms_of_use": 0,
+    "privacy_policy": 1,
+    "help": 2,
+    "rules_of_behavior": 4,
+}
+
+WEB_PAGE_TYPES.update(WEBSITE_PAGE_TYPES)
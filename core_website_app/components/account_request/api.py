@@ -3,10 +3,15 @@
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
 
-import core_main_app.utils.notifications.mail as send_mail_api
-from core_main_app.commons.exceptions import ApiError
+from core_main_app.commons.exceptions import ApiError, DoesNotExist
+import core_website_app.components.admin_notification.api as admin_notification_api
+import core_website_app.utils.notifications.mail as send_mail_api
 from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.components.admin_notification.models import (
+    AdminNotification,
+)
 from core_website_app.settings import (
     SERVER_URI,
     EMAIL_DENY_SUBJECT,
@@ -23,6 +28,16 @@ def get_all():
     return AccountRequest.get_all()
 
 
+def get_all_with_user_id():
+    """List of opened account requests, with the id of the associated user
+
+    Returns:
+
+        List of all requests, each having a `user_id` attribute
+    """
+    return AccountRequest.get_all_with_user_id()
+
+
 def get_count():
     """Count number of account request currently in the database
 
@@ -53,6 +68,11 @@ def get(account_request_id):
 def insert(user):
     """Create a new request
 
+    The username and email are checked, then the user and the request are
+    saved in the same transaction. Both are unique among requests, so a
+    concurrent request with the same username or email is rejected by the
+    database.
+
     Args:
 
         user: Django User
@@ -62,47 +82,72 @@ def insert(user):
         New account request
     """
     try:
-        # check if a user with the same username exists
-        _get_user_by_username(user.username)
-        raise ApiError("A user with the same username already exists.")
-    except ObjectDoesNotExist:
-        # no user with the same username, continue
-        pass
-
-    try:
-        # check if a user with the same email exists
-        _get_user_by_email(user.email)
-        raise ApiError("A user with the same email already exists.")
-    except ObjectDoesNotExist:
-        # no user with the same email, continue
-        pass
+        with transaction.atomic():
+            check_conflicts(user.username, user.email)
 
-    user.save()
+            user.save()
 
-    # Create the account request and save it
-    account_request = AccountRequest(
-        username=user.username,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        email=user.email,
-    )
-
-    context = {"URI": SERVER_URI}
-    template_path = (
-        "core_website_app/admin/email/request_account_for_admin.html"
-    )
-    send_mail_api.send_mail_to_website_contacts(
-        subject="New Account Request",
-        path_to_template=template_path,
-        context=context,
+            # Create the account request and save it
+            account_request = AccountRequest(
+                username=user.username,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                email=user.email,
+            )
+            account_request.save()
+    except IntegrityError:
+        # a concurrent request saved the same username or email first
+        check_conflicts(user.username, user.email)
+        raise ApiError(
+            "A request with the same username or email already exists."
+        )
+
+    admin_notification_api.notify(
+        AdminNotification.KIND_ACCOUNT_REQUEST,
+        {
+            "username": account_request.username,
+            "first_name": account_request.first_name,
+            "last_name": account_request.last_name,
+            "email": account_request.email,
+            "date": account_request.date,
+        },
     )
-    account_request.save()
     return account_request
 
 
+def check_conflicts(username, email):
+    """Check that no user or pending request uses the username or the email
+
+    Args:
+
+        username: Given username
+        email: Given email
+
+    Returns:
+
+    """
+    conflicts = AccountRequest.get_conflicts(username, email)
+    # users are reported first, each pending request also has its user
+    for source in ("user", "request"):
+        found = [
+            (conflict_username, conflict_email)
+            for conflict_source, conflict_username, conflict_email in conflicts
+            if conflict_source == source
+        ]
+        if any(found_username == username for found_username, _ in found):
+            raise ApiError(
+                "A %s with the same username already exists." % source
+            )
+        if any(found_email == email for _, found_email in found):
+            raise ApiError("A %s with the same email already exists." % source)
+
+
 def accept(account_request):
     """Accept an account request
 
+    The request and its user are locked until the request is deleted, so
+    the request can only be processed once.
+
     Args:
 
         account_request: Primary key of the request
@@ -111,38 +156,40 @@ def accept(account_request):
 
     """
     user = None
-    try:
-        # check if a user with the same username exists
-        user = _get_user_by_username(account_request.username)
-        user.is_active = True
-        user.save()
-
-        if settings.SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED:
-            # FIXME send_mail should use a User object
-            context = {
-                "lastname": account_request.last_name,
-                "firstname": account_request.first_name,
-                "URI": SERVER_URI,
-            }
-
-            send_mail_api.send_mail_from_template(
-                subject="Account approved",
-                path_to_template="core_website_app/admin/email/request_account_approved.html",
-                context=context,
-                recipient_list=[account_request.email],
+    with transaction.atomic():
+        account_request = _get_for_update(account_request)
+        try:
+            # check if a user with the same username exists
+            user = _get_user_by_username(
+                account_request.username, for_update=True
             )
-    finally:
+            user.is_active = True
+            user.save()
+        except ObjectDoesNotExist:
+            pass
         # delete the user request
         account_request.delete()
-        if user is not None:
-            return user
 
+    if user is None:
         raise ApiError("User does not exist")
 
+    if settings.SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED:
+        # FIXME send_mail should use a User object
+        send_mail_api.send_mail_from_template(
+            subject="Account approved",
+            path_to_template="core_website_app/admin/email/request_account_approved.html",
+            context=_get_email_context(account_request),
+            recipient_list=[account_request.email],
+        )
+    return user
+
 
 def deny(account_request, send_email=True, email_params=None):
     """Delete an account request
 
+    The request and its user are locked until they are deleted, so the
+    request can only be processed once.
+
     Args:
 
         account_request: Primary key of the request
@@ -153,66 +200,236 @@ def deny(account_request, send_email=True, email_params=None):
 
     """
     user = None
-    try:
-        # check if a user with the same username exists
-        user = _get_user_by_username(account_request.username)
-        user.delete()
-    finally:
+    with transaction.atomic():
+        account_request = _get_for_update(account_request)
+        try:
+            # check if a user with the same username exists
+            user = _get_user_by_username(
+                account_request.username, for_update=True
+            )
+            user.delete()
+        except ObjectDoesNotExist:
+            pass
         # delete the user request
         account_request.delete()
 
-        if send_email:
-            # create the context for the email
-            account_request_email = account_request.email
-            context = {
-                "lastname": account_request.last_name,
-                "firstname": account_request.first_name,
-                "URI": SERVER_URI,
-            }
+    if send_email:
+        # create the context for the email
+        account_request_email = account_request.email
+        inline_template = email_params.get("body") if email_params else None
+
+        if inline_template:
+            send_mail_api.send_mail(
+                recipient_list=[account_request_email],
+                subject=(
+                    email_params.get("subject")
+                    if email_params
+                    else EMAIL_DENY_SUBJECT
+                ),
+                body=inline_template,
+            )
+        else:
+            send_mail_api.send_mail_from_template(
+                subject=(
+                    email_params.get("subject")
+                    if email_params
+                    else EMAIL_DENY_SUBJECT
+                ),
+                recipient_list=[account_request_email],
+                path_to_template="core_website_app/admin/email/request_account_denied.html",
+                context=_get_email_context(account_request),
+            )
+    if user is not None:
+        return
+
+    raise ApiError("User does not exist")
+
+
+def accept_all(account_request_id_list):
+    """Accept a list of account requests in one transaction
+
+    Args:
+
+        account_request_id_list: Primary keys of the requests
+
+    Returns:
 
-            inline_template = (
-                email_params.get("body") if email_params else None
+        Number of accepted requests, list of the recipients of the emails
+        that could not be sent
+    """
+    with transaction.atomic():
+        account_requests = _get_all_by_id_list(account_request_id_list)
+        usernames = [
+            account_request.username for account_request in account_requests
+        ]
+        users = User.objects.filter(username__in=usernames)
+        missing_usernames = set(usernames) - set(
+            users.values_list("username", flat=True)
+        )
+        if missing_usernames:
+            raise ApiError(
+                "User does not exist: %s"
+                % ", ".join(sorted(missing_usernames))
             )
 
+        users.update(is_active=True)
+        AccountRequest.get_all_by_id_list(
+            [account_request.id for account_request in account_requests]
+        ).delete()
+
+    failed_recipients = []
+    if settings.SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED:
+        failed_recipients = send_mail_api.send_mass_mail(
+            [
+                {
+                    "recipient_list": [account_request.email],
+                    "subject": "Account approved",
+                    "path_to_template": "core_website_app/admin/email/request_account_approved.html",
+                    "context": _get_email_context(account_request),
+                }
+                for account_request in account_requests
+            ]
+        )
+    return len(account_requests), failed_recipients
+
+
+def deny_all(account_request_id_list, send_email=True, email_params=None):
+    """Deny a list of account requests in one transaction
+
+    Args:
+
+        account_request_id_list: Primary keys of the requests
+        send_email: boolean to indicate if we have to send the emails
+        email_params: { subject: <email subject>, body: <email body> }
+
+    Returns:
+
+        Number of denied requests, list of the recipients of the emails that
+        could not be sent
+    """
+    with transaction.atomic():
+        account_requests = _get_all_by_id_list(account_request_id_list)
+        User.objects.filter(
+            username__in=[
+                account_request.username
+                for account_request in account_requests
+            ]
+        ).delete()
+        AccountRequest.get_all_by_id_list(
+            [account_request.id for account_request in account_requests]
+        ).delete()
+
+    failed_recipients = []
+    if send_email:
+        subject = (
+            email_params.get("subject") if email_params else EMAIL_DENY_SUBJECT
+        )
+        inline_template = email_params.get("body") if email_params else None
+        mail_list = []
+        for account_request in account_requests:
+            mail = {
+                "recipient_list": [account_request.email],
+                "subject": subject,
+            }
             if inline_template:
-                send_mail_api.send_mail(
-                    recipient_list=[account_request_email],
-                    subject=(
-                        email_params.get("subject")
-                        if email_params
-                        else EMAIL_DENY_SUBJECT
-                    ),
-                    body=inline_template,
-                )
+                mail["body"] = inline_template
             else:
-                send_mail_api.send_mail_from_template(
-                    subject=(
-                        email_params.get("subject")
-                        if email_params
-                        else EMAIL_DENY_SUBJECT
-                    ),
-                    recipient_list=[account_request_email],
-                    path_to_template="core_website_app/admin/email/request_account_denied.html",
-                    context=context,
+                mail["path_to_template"] = (
+                    "core_website_app/admin/email/request_account_denied.html"
                 )
-        if user is not None:
-            return
+                mail["context"] = _get_email_context(account_request)
+            mail_list.append(mail)
+        failed_recipients = send_mail_api.send_mass_mail(mail_list)
+    return len(account_requests), failed_recipients
 
-        raise ApiError("User does not exist")
+
+def _get_all_by_id_list(account_request_id_list):
+    """Returns the account requests with the given primary keys, locked until
+    the end of the transaction. Raise an error if one of them does not exist
+
+    Args:
+
+        account_request_id_list: Primary keys of the requests
+
+    Returns:
+
+        list of AccountRequest
+    """
+    try:
+        account_request_id_list = {
+            int(account_request_id)
+            for account_request_id in account_request_id_list
+        }
+    except (TypeError, ValueError):
+        raise ApiError("Invalid account request id.")
+    if not account_request_id_list:
+        raise ApiError("No account request id given.")
+
+    account_requests = list(
+        AccountRequest.get_all_by_id_list(
+            account_request_id_list
+        ).select_for_update()
+    )
+    missing_ids = account_request_id_list - {
+        account_request.id for account_request in account_requests
+    }
+    if missing_ids:
+        raise ApiError(
+            "No request could be found with the given id: %s"
+            % ", ".join(str(missing_id) for missing_id in sorted(missing_ids))
+        )
+    return account_requests
+
+
+def _get_email_context(account_request):
+    """Returns the context of the emails sent about an account request
+
+    Args:
+
+        account_request: Given account request
+
+    Returns:
+
+        dict
+    """
+    return {
+        "lastname": account_request.last_name,
+        "firstname": account_request.first_name,
+        "URI": SERVER_URI,
+    }
+
+
+def _get_for_update(account_request):
+    """Returns the account request, locked until the end of the transaction
+
+    Args:
+
+        account_request: Given account request
+
+    Returns:
+
+        AccountRequest
+    """
+    try:
+        return AccountRequest.get_by_id_for_update(account_request.id)
+    except DoesNotExist:
+        raise ApiError("The account request has already been processed.")
 
 
-def _get_user_by_username(username):
+def _get_user_by_username(username, for_update=False):
     """Returns a user given its username
 
     Args:
 
         username: Given username
+        for_update: lock the user until the end of the transaction
 
     Returns:
 
         User
     """
-    return User.objects.get(username=username)
+    users = User.objects.select_for_update() if for_update else User.objects
+    return users.get(username=username)
 
 
 def _get_user_by_email(email):
@@ -2,8 +2,10 @@
 
 import datetime
 
+from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models import OuterRef, Q, Subquery, Value
 
 from core_main_app.commons import exceptions
 
@@ -12,12 +14,14 @@ class AccountRequest(models.Model):
     """Represents a request sent by a user to get an account"""
 
     username = models.CharField(
-        blank=False, max_length=200
+        blank=False, max_length=200, unique=True
     )  #: Username associated with the request
     first_name = models.CharField(blank=False, max_length=200)
     last_name = models.CharField(blank=False, max_length=200)
-    email = models.CharField(blank=False, max_length=200)
-    date = models.DateTimeField(default=datetime.datetime.now, blank=False)
+    email = models.CharField(blank=False, max_length=200, unique=True)
+    date = models.DateTimeField(
+        default=datetime.datetime.now, blank=False, db_index=True
+    )
 
     @staticmethod
     def get_by_id(request_id):
@@ -36,6 +40,65 @@ class AccountRequest(models.Model):
         except Exception as ex:
             raise exceptions.ModelError(str(ex))
 
+    @staticmethod
+    def get_by_id_for_update(request_id):
+        """Get a request given its primary key, and lock it until the end of
+        the transaction
+
+        Parameters:
+            request_id (str): Primary key of the request
+
+        Returns:
+            Request object corresponding to the given id
+        """
+        try:
+            return AccountRequest.objects.select_for_update().get(
+                pk=str(request_id)
+            )
+        except ObjectDoesNotExist as exception:
+            raise exceptions.DoesNotExist(str(exception))
+        except Exception as ex:
+            raise exceptions.ModelError(str(ex))
+
+    @staticmethod
+    def get_conflicts(username, email):
+        """Get the users and pending requests using a username or an email
+
+        Users and requests are searched in a single query.
+
+        Parameters:
+            username (str): Username to look for
+            email (str): Email to look for
+
+        Returns:
+            list of (source, username, email), source being "user" or
+            "request"
+        """
+        lookup = Q(username=username) | Q(email=email)
+        users = (
+            User.objects.filter(lookup)
+            .annotate(source=Value("user"))
+            .values_list("source", "username", "email")
+        )
+        account_requests = (
+            AccountRequest.objects.filter(lookup)
+            .annotate(source=Value("request"))
+            .values_list("source", "username", "email")
+        )
+        return list(users.union(account_requests, all=True))
+
+    @staticmethod
+    def get_all_by_id_list(request_id_list):
+        """Get all Account Request from a list of primary keys
+
+        Parameters:
+            request_id_list (list): Primary keys of the requests
+
+        Returns:
+
+        """
+        return AccountRequest.objects.filter(pk__in=request_id_list)
+
     @staticmethod
     def get_all():
         """Get all Account Request
@@ -45,6 +108,25 @@ class AccountRequest(models.Model):
         """
         return AccountRequest.objects.all()
 
+    @staticmethod
+    def get_all_with_user_id():
+        """Get all Account Request, annotated with the id of their user
+
+        The id of the user having the same username is fetched in the same
+        query, and set as `user_id` on each request (None if not found).
+        Requests are sorted by date, oldest first.
+
+        Returns:
+
+        """
+        return AccountRequest.objects.annotate(
+            user_id=Subquery(
+                User.objects.filter(username=OuterRef("username")).values(
+                    "pk"
+                )[:1]
+            )
+        ).order_by("date")
+
     def __str__(self):
         """Account request as string
 
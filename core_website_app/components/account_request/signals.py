@@ -0,0 +1,68 @@
+"""Signals to attach to Account Request"""
+
+import logging
+
+from django.db import transaction
+from django.db.models import signals as models_signals
+
+from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.utils import admin_events, badge_counts
+
+logger = logging.getLogger(__name__)
+
+
+def connect():
+    """Connect signals for account requests"""
+    models_signals.post_save.connect(
+        post_save_account_request, sender=AccountRequest
+    )
+    models_signals.post_delete.connect(
+        post_delete_account_request, sender=AccountRequest
+    )
+    logger.info("Registered signals for account requests")
+
+
+def post_save_account_request(sender, instance, created=False, **kwargs):
+    """Signal triggered after saving an account request
+
+    Args:
+        sender:
+        instance:
+        created:
+        kwargs:
+    """
+    if created:
+        _clear_badge_counts_cache()
+        admin_events.publish(
+            admin_events.ACCOUNT_REQUEST_CREATED,
+            {
+                "id": instance.id,
+                "username": instance.username,
+                "first_name": instance.first_name,
+                "last_name": instance.last_name,
+                "email": instance.email,
+                "date": instance.date,
+            },
+        )
+
+
+def post_delete_account_request(sender, instance, **kwargs):
+    """Signal triggered after deleting an account request
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    _clear_badge_counts_cache()
+    admin_events.publish(
+        admin_events.ACCOUNT_REQUEST_DELETED, {"id": instance.id}
+    )
+
+
+def _clear_badge_counts_cache():
+    """Clear the cached badge counts now, and again once the transaction
+    commits, so counts read before the commit can not stay in the cache.
+    """
+    badge_counts.clear_cache()
+    transaction.on_commit(badge_counts.clear_cache)
@@ -0,0 +1 @@
+"""Admin notifications waiting for the next digest email"""
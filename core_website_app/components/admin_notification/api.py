@@ -0,0 +1,127 @@
+"""Admin notification API"""
+
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+import core_website_app.utils.notifications.mail as send_mail_api
+from core_website_app import settings
+from core_website_app.components.admin_notification.models import (
+    AdminNotification,
+)
+
+logger = logging.getLogger(
+    "core_website_app.components.admin_notification.api"
+)
+
+NOTIFICATION_EMAILS = {
+    AdminNotification.KIND_ACCOUNT_REQUEST: (
+        "New Account Request",
+        "New Account Requests",
+        "core_website_app/admin/email/request_account_for_admin.html",
+    ),
+    AdminNotification.KIND_CONTACT_MESSAGE: (
+        "New Contact Message",
+        "New Contact Messages",
+        "core_website_app/admin/email/contact_message_for_admin.html",
+    ),
+}
+
+
+def notify(kind, item):
+    """Notify the website contacts of a new item, right away or in the next
+    digest if the digest mode is enabled
+
+    Args:
+        kind: kind of the item
+        item: dict of the fields of the item listed in the digest
+
+    Returns:
+
+    """
+    if settings.ADMIN_NOTIFICATION_DIGEST_ENABLED:
+        AdminNotification.objects.create(kind=kind, item=item)
+        return
+
+    subject, _, template_path = NOTIFICATION_EMAILS[kind]
+    send_mail_api.send_mail_to_website_contacts(
+        subject=subject,
+        path_to_template=template_path,
+        context={"URI": settings.SERVER_URI},
+    )
+
+
+def send_digest(batch_size=None):
+    """Send one email per kind of item, listing the items notified since the
+    last digest
+
+    The notifications are claimed before the emails are sent, so digests sent
+    at the same time do not list them twice. They are deleted once their
+    email is sent (or stored in the outbox), and listed again in a digest
+    after ADMIN_NOTIFICATION_DIGEST_RETRY_DELAY if sending fails.
+
+    Args:
+        batch_size: maximum number of notifications in the digest
+
+    Returns:
+        number of notifications sent
+    """
+    notifications = claim_pending(
+        batch_size or settings.ADMIN_NOTIFICATION_DIGEST_BATCH_SIZE
+    )
+
+    notifications_by_kind = {}
+    for notification in notifications:
+        notifications_by_kind.setdefault(notification.kind, []).append(
+            notification
+        )
+
+    sent_count = 0
+    for kind, kind_notifications in notifications_by_kind.items():
+        _, subject, template_path = NOTIFICATION_EMAILS[kind]
+        # raises if the email could not be sent: the notifications of the
+        # kinds not sent yet stay claimed until the retry delay
+        send_mail_api.send_mail_to_website_contacts(
+            subject="%s (%d)" % (subject, len(kind_notifications)),
+            path_to_template=template_path,
+            context={
+                "URI": settings.SERVER_URI,
+                "items": [
+                    notification.item for notification in kind_notifications
+                ],
+            },
+            fail_silently=False,
+        )
+        AdminNotification.delete_all_by_id_list(
+            [notification.id for notification in kind_notifications]
+        )
+        sent_count += len(kind_notifications)
+    return sent_count
+
+
+def claim_pending(batch_size):
+    """Get the notifications to list in a digest and postpone their next
+    attempt, so digests sent at the same time do not list them twice.
+
+    Args:
+        batch_size: maximum number of notifications to claim
+
+    Returns:
+        list of AdminNotification
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        notifications = list(
+            AdminNotification.get_all_pending(now).select_for_update(
+                skip_locked=True
+            )[:batch_size]
+        )
+        AdminNotification.objects.filter(
+            id__in=[notification.id for notification in notifications]
+        ).update(
+            next_attempt_date=now
+            + timedelta(seconds=settings.ADMIN_NOTIFICATION_DIGEST_RETRY_DELAY)
+        )
+    return notifications
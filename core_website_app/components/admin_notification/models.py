@@ -0,0 +1,57 @@
+"""Admin notification model"""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class AdminNotification(models.Model):
+    """Represents a new item waiting for the next digest email to the
+    website contacts"""
+
+    KIND_ACCOUNT_REQUEST = "account_request"
+    KIND_CONTACT_MESSAGE = "contact_message"
+    KIND_CHOICES = (
+        (KIND_ACCOUNT_REQUEST, "Account request"),
+        (KIND_CONTACT_MESSAGE, "Contact message"),
+    )
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    item = models.JSONField(encoder=DjangoJSONEncoder)
+    creation_date = models.DateTimeField(auto_now_add=True)
+    next_attempt_date = models.DateTimeField(default=timezone.now)
+
+    @staticmethod
+    def get_all_pending(date):
+        """Get the notifications that can be sent in a digest at the given
+        date, oldest first
+
+        Args:
+            date:
+
+        Returns:
+        """
+        return AdminNotification.objects.filter(
+            next_attempt_date__lte=date
+        ).order_by("id")
+
+    @staticmethod
+    def delete_all_by_id_list(notification_ids):
+        """Delete notifications given their primary keys
+
+        Args:
+            notification_ids:
+
+        Returns:
+        """
+        return AdminNotification.objects.filter(
+            id__in=notification_ids
+        ).delete()
+
+    def __str__(self):
+        """Admin notification as string
+
+        Returns:
+
+        """
+        return "%s (%s)" % (self.kind, self.creation_date)
@@ -1,13 +1,29 @@
 """contact message API"""
 
 import logging
-from core_website_app import settings
-import core_main_app.utils.notifications.mail as send_mail_api
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.text import Truncator
+
 from core_main_app.commons import exceptions
+from core_website_app import settings
+import core_website_app.components.admin_notification.api as admin_notification_api
+from core_website_app.components.admin_notification.models import (
+    AdminNotification,
+)
 from core_website_app.components.contact_message.models import ContactMessage
+from core_website_app.utils import pagination
 
 logger = logging.getLogger("core_website_app.components.contact_message.api")
 
+CONTACT_MESSAGE_COUNT_CACHE_KEY = "core_website_app:contact_message:count"
+EXPORT_FIELDS = ("id", "name", "email", "content", "duplicate_count")
+# number of characters of the content listed in the digest emails
+NOTIFICATION_CONTENT_LENGTH = 200
+
 
 def get_all():
     """List all messages
@@ -18,13 +34,85 @@ def get_all():
     return ContactMessage.get_all()
 
 
+def search(query):
+    """List the messages with a name, email or content matching a query
+
+    Args:
+        query: words to search, all the messages are returned if empty
+
+    Returns:
+
+    """
+    if not query:
+        return get_all()
+    return ContactMessage.search(query)
+
+
+def get_page(after=None, before=None, page_size=None, query=None):
+    """Get a page of messages, newest first, using the message id as cursor
+
+    Args:
+        after: cursor, get the messages older than this one
+        before: cursor, get the messages newer than this one
+        page_size: number of messages in the page
+        query: words to search, only the matching messages are paginated
+
+    Returns:
+        KeysetPage
+    """
+    return pagination.paginate_by_id(
+        search(query),
+        pagination.get_page_size(
+            page_size,
+            settings.CONTACT_MESSAGES_PER_PAGE,
+            settings.CONTACT_MESSAGES_MAX_PER_PAGE,
+        ),
+        after=pagination.get_cursor(after),
+        before=pagination.get_cursor(before),
+    )
+
+
+def iter_export_rows(chunk_size=None):
+    """Iterate over all messages, oldest first, without loading them all in
+    memory
+
+    Args:
+        chunk_size: number of messages fetched from the database at a time
+
+    Returns:
+        iterator of dict
+    """
+    return ContactMessage.get_all_values(EXPORT_FIELDS).iterator(
+        chunk_size=chunk_size or settings.CONTACT_MESSAGE_EXPORT_CHUNK_SIZE
+    )
+
+
 def get_count():
     """Count number of contact messages currently in the database.
 
+    The count is cached until a message is created or deleted.
+
     Returns:
         int: number of contact messages
     """
-    return len(get_all())
+    count = cache.get(CONTACT_MESSAGE_COUNT_CACHE_KEY)
+    if count is None:
+        count = ContactMessage.get_count()
+        cache.set(
+            CONTACT_MESSAGE_COUNT_CACHE_KEY,
+            count,
+            settings.CONTACT_MESSAGE_COUNT_CACHE_TIMEOUT,
+        )
+    return count
+
+
+def clear_count_cache():
+    """Clear the cached number of contact messages
+
+    Returns:
+
+    """
+    cache.delete(CONTACT_MESSAGE_COUNT_CACHE_KEY)
 
 
 def get(message_id):
@@ -48,35 +136,100 @@ def get(message_id):
 def upsert(contact_message):
     """Insert or update a given message
 
+    A new message sent again by the same sender less than
+    CONTACT_MESSAGE_DUPLICATE_WINDOW seconds after the first one is not
+    inserted: the duplicate count of the message already received is
+    incremented and no email is sent.
+
     Args:
         contact_message:
 
     Returns:
-
+        ContactMessage: message stored in the database
     """
     try:
         # Check if new contact message
-        if contact_message.id is None:
-            if settings.SEND_EMAIL_WHEN_CONTACT_MESSAGE_IS_RECEIVED:
-                context = {"URI": settings.SERVER_URI}
-                template_path = (
-                    "core_website_app/admin/email"
-                    "/contact_message_for_admin.html"
-                )
-
-                send_mail_api.send_mail_to_website_contacts(
-                    subject="New Contact Message",
-                    path_to_template=template_path,
-                    context=context,
-                )
-
-        # save method return self
-        return contact_message.save()
+        if contact_message.id is not None:
+            contact_message.save()
+            return contact_message
+
+        contact_message.content_hash = ContactMessage.get_content_hash(
+            contact_message.content
+        )
+        if settings.CONTACT_MESSAGE_DUPLICATE_WINDOW > 0:
+            now = timezone.now().replace(microsecond=0)
+            contact_message.window_start = now
+            since = now - timedelta(
+                seconds=settings.CONTACT_MESSAGE_DUPLICATE_WINDOW
+            )
+            if _increment_duplicate_count(contact_message, since):
+                return _get_by_content_hash(contact_message, since)
+
+        try:
+            with transaction.atomic():
+                contact_message.save()
+        except IntegrityError:
+            # the same message was inserted during the same second
+            _increment_duplicate_count(
+                contact_message, contact_message.window_start
+            )
+            return _get_by_content_hash(
+                contact_message, contact_message.window_start
+            )
+
+        if settings.SEND_EMAIL_WHEN_CONTACT_MESSAGE_IS_RECEIVED:
+            admin_notification_api.notify(
+                AdminNotification.KIND_CONTACT_MESSAGE,
+                {
+                    "name": contact_message.name,
+                    "email": contact_message.email,
+                    "content": Truncator(contact_message.content).chars(
+                        NOTIFICATION_CONTENT_LENGTH
+                    ),
+                },
+            )
+
+        return contact_message
     except Exception as exception:
         logger.error(str(exception))
         raise exceptions.ApiError("Save message failed")
 
 
+def _increment_duplicate_count(contact_message, since):
+    """Count a new message as a duplicate of the same message already
+    received since a date, if any
+
+    Args:
+        contact_message:
+        since:
+
+    Returns:
+        True if the message is a duplicate
+    """
+    return (
+        ContactMessage.increment_duplicate_count(
+            contact_message.email, contact_message.content_hash, since
+        )
+        > 0
+    )
+
+
+def _get_by_content_hash(contact_message, since):
+    """Get the message already received of which a new message is a
+    duplicate
+
+    Args:
+        contact_message:
+        since:
+
+    Returns:
+        ContactMessage
+    """
+    return ContactMessage.get_by_content_hash(
+        contact_message.email, contact_message.content_hash, since
+    )
+
+
 def delete(contact_message):
     """Delete a message
 
@@ -1,9 +1,13 @@
 """Contact messages models"""
 
+import hashlib
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models import F
 
 from core_main_app.commons import exceptions
+from core_website_app.components.contact_message import search
 
 
 class ContactMessage(models.Model):
@@ -12,6 +16,73 @@ class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
     content = models.TextField()
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    # date the message was received, to the second: the start of the time
+    # window during which the same message is counted as a duplicate
+    window_start = models.DateTimeField(null=True, blank=True)
+    duplicate_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """Meta"""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email", "content_hash", "window_start"],
+                name="contact_message_unique_per_window",
+            ),
+        ]
+
+    @staticmethod
+    def get_content_hash(content):
+        """Hash a message content, ignoring case and whitespace
+
+        Args:
+            content:
+
+        Returns:
+            hexadecimal sha256 digest
+        """
+        normalized_content = " ".join(content.split()).casefold()
+        return hashlib.sha256(normalized_content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def increment_duplicate_count(email, content_hash, since):
+        """Count one more submission of a message already received
+
+        Args:
+            email:
+            content_hash:
+            since: date from which the messages are counted as duplicates
+
+        Returns:
+            number of messages updated
+        """
+        return ContactMessage.objects.filter(
+            email=email, content_hash=content_hash, window_start__gte=since
+        ).update(duplicate_count=F("duplicate_count") + 1)
+
+    @staticmethod
+    def get_by_content_hash(email, content_hash, since):
+        """Get the first message received from a sender with a content hash
+        since a date
+
+        Args:
+            email:
+            content_hash:
+            since:
+
+        Returns:
+        """
+        try:
+            return ContactMessage.objects.filter(
+                email=email,
+                content_hash=content_hash,
+                window_start__gte=since,
+            ).earliest("window_start")
+        except ObjectDoesNotExist as exception:
+            raise exceptions.DoesNotExist(str(exception))
+        except Exception as ex:
+            raise exceptions.ModelError(str(ex))
 
     @staticmethod
     def get_by_id(message_id):
@@ -36,3 +107,33 @@ class ContactMessage(models.Model):
         Returns:
         """
         return ContactMessage.objects.all()
+
+    @staticmethod
+    def search(query):
+        """Get the messages with a name, email or content matching a query
+
+        Args:
+            query: words to search
+
+        Returns:
+        """
+        return search.filter_queryset(ContactMessage.objects.all(), query)
+
+    @staticmethod
+    def get_count():
+        """Count messages in the database
+
+        Returns:
+        """
+        return ContactMessage.objects.count()
+
+    @staticmethod
+    def get_all_values(fields):
+        """Get the values of all messages, oldest first
+
+        Args:
+            fields: names of the fields
+
+        Returns:
+        """
+        return ContactMessage.objects.order_by("id").values(*fields)
@@ -0,0 +1,96 @@
+"""Full-text search of the contact messages
+
+The name, email and content of the messages are indexed by migration 0004:
+- PostgreSQL: GIN index on a `to_tsvector` expression, the query must use the
+same expression to be able to use it,
+- SQLite: FTS5 table kept up to date by triggers,
+- other databases are not indexed and fall back to a case-insensitive scan.
+
+Each word of the query must match the beginning of a word of the message.
+"""
+
+from django.db import connections
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+TABLE_NAME = "core_website_app_contactmessage"
+FTS_TABLE_NAME = "core_website_app_contactmessage_fts"
+
+POSTGRESQL_SEARCH_SQL = (
+    "to_tsvector('simple', "
+    '"{table}"."name" || \' \' || "{table}"."email" || \' \' '
+    '|| "{table}"."content") @@ to_tsquery(\'simple\', %s)'
+).format(table=TABLE_NAME)
+
+SQLITE_SEARCH_SQL = (
+    '"{table}"."id" IN (SELECT rowid FROM "{fts_table}" '
+    'WHERE "{fts_table}" MATCH %s)'
+).format(table=TABLE_NAME, fts_table=FTS_TABLE_NAME)
+
+
+def filter_queryset(queryset, query):
+    """Keep the messages matching a search query
+
+    Args:
+        queryset: contact messages
+        query: words to search
+
+    Returns:
+        queryset
+    """
+    words = query.split()
+    if not words:
+        return queryset
+
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        return queryset.filter(
+            RawSQL(
+                POSTGRESQL_SEARCH_SQL,
+                [get_postgresql_query(words)],
+                output_field=BooleanField(),
+            )
+        )
+    if vendor == "sqlite":
+        return queryset.filter(
+            RawSQL(
+                SQLITE_SEARCH_SQL,
+                [get_sqlite_query(words)],
+                output_field=BooleanField(),
+            )
+        )
+
+    for word in words:
+        queryset = queryset.filter(
+            Q(name__icontains=word)
+            | Q(email__icontains=word)
+            | Q(content__icontains=word)
+        )
+    return queryset
+
+
+def get_postgresql_query(words):
+    """Build a `to_tsquery` expression matching the prefix of all the words
+
+    Args:
+        words: list of words
+
+    Returns:
+        str
+    """
+    return " & ".join(
+        "'%s':*" % word.replace("\\", "\\\\").replace("'", "''")
+        for word in words
+    )
+
+
+def get_sqlite_query(words):
+    """Build an FTS5 query matching the prefix of all the words
+
+    Args:
+        words: list of words
+
+    Returns:
+        str
+    """
+    return " ".join('"%s"*' % word.replace('"', '""') for word in words)
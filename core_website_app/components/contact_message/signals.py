@@ -0,0 +1,70 @@
+"""Signals to attach to Contact Message"""
+
+import logging
+
+from django.db import transaction
+from django.db.models import signals as models_signals
+
+import core_website_app.components.contact_message.api as contact_message_api
+from core_website_app.components.contact_message.models import ContactMessage
+from core_website_app.utils import admin_events, badge_counts
+
+logger = logging.getLogger(__name__)
+
+
+def connect():
+    """Connect signals for contact messages"""
+    models_signals.post_save.connect(
+        post_save_contact_message, sender=ContactMessage
+    )
+    models_signals.post_delete.connect(
+        post_delete_contact_message, sender=ContactMessage
+    )
+    logger.info("Registered signals for contact messages")
+
+
+def post_save_contact_message(sender, instance, created=False, **kwargs):
+    """Signal triggered after saving a contact message
+
+    Args:
+        sender:
+        instance:
+        created:
+        kwargs:
+    """
+    if created:
+        _clear_count_cache()
+        admin_events.publish(
+            admin_events.CONTACT_MESSAGE_CREATED,
+            {
+                "id": instance.id,
+                "name": instance.name,
+                "email": instance.email,
+            },
+        )
+
+
+def post_delete_contact_message(sender, instance, **kwargs):
+    """Signal triggered after deleting a contact message
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    _clear_count_cache()
+    admin_events.publish(
+        admin_events.CONTACT_MESSAGE_DELETED, {"id": instance.id}
+    )
+
+
+def _clear_count_cache():
+    """Clear the cached counts now, and again once the transaction commits,
+    so a count read before the commit can not stay in the cache.
+    """
+    for clear_cache in (
+        contact_message_api.clear_count_cache,
+        badge_counts.clear_cache,
+    ):
+        clear_cache()
+        transaction.on_commit(clear_cache)
@@ -3,6 +3,9 @@
 import core_main_app.components.web_page.api as web_page_api
 from core_main_app.commons.exceptions import ApiError
 from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.components.web_page import (
+    api as rendered_web_page_api,
+)
 
 HELP_PAGE_NAME = "help"
 HELP_PAGE_TYPE = WEB_PAGE_TYPES[HELP_PAGE_NAME]
@@ -30,4 +33,4 @@ def upsert(help_page):
             % (str(HELP_PAGE_TYPE), str(help_page.type))
         )
 
-    return web_page_api.upsert(help_page)
+    return rendered_web_page_api.upsert(help_page, HELP_PAGE_NAME)
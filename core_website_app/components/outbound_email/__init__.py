@@ -0,0 +1 @@
+"""Outbound emails waiting in the outbox to be sent by a worker"""
@@ -0,0 +1,209 @@
+"""Outbound email API"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
+from django.utils import timezone
+
+from core_main_app.commons import exceptions
+from core_main_app.settings import SERVER_EMAIL, EMAIL_SUBJECT_PREFIX
+from core_website_app import settings
+from core_website_app.components.outbound_email.models import OutboundEmail
+
+logger = logging.getLogger("core_website_app.components.outbound_email.api")
+
+
+def get(outbound_email_id):
+    """Get an outbound email
+
+    Args:
+        outbound_email_id:
+
+    Returns:
+
+    """
+    try:
+        return OutboundEmail.get_by_id(outbound_email_id)
+    except Exception as exception:
+        logger.error(str(exception))
+        raise exceptions.ApiError(
+            "No outbound email could be found with the given id."
+        )
+
+
+def enqueue(recipient_list, subject, body, sender=SERVER_EMAIL):
+    """Store an email in the outbox
+
+    Args:
+        recipient_list: list of recipient addresses
+        subject: subject of the email, without prefix
+        body: HTML body of the email
+        sender: sender address
+
+    Returns:
+        OutboundEmail
+    """
+    return OutboundEmail.objects.create(
+        recipient_list=list(recipient_list),
+        subject=subject,
+        body=body,
+        sender=sender,
+    )
+
+
+def enqueue_all(email_list):
+    """Store a list of emails in the outbox in a single query
+
+    Args:
+        email_list: list of dict with recipient_list, subject, body and
+            optionally sender
+
+    Returns:
+        list of OutboundEmail
+    """
+    return OutboundEmail.objects.bulk_create(
+        [
+            OutboundEmail(
+                recipient_list=list(email["recipient_list"]),
+                subject=email["subject"],
+                body=email["body"],
+                sender=email.get("sender", SERVER_EMAIL),
+            )
+            for email in email_list
+        ]
+    )
+
+
+def claim_ready(batch_size):
+    """Get the emails ready to be sent and postpone their next attempt, so
+    workers running at the same time do not send them twice.
+
+    Args:
+        batch_size: maximum number of emails to claim
+
+    Returns:
+        list of OutboundEmail
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        outbound_emails = list(
+            OutboundEmail.get_all_ready(now).select_for_update(
+                skip_locked=True
+            )[:batch_size]
+        )
+        OutboundEmail.objects.filter(
+            id__in=[outbound_email.id for outbound_email in outbound_emails]
+        ).update(
+            next_attempt_date=now
+            + timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_DELAY)
+        )
+    return outbound_emails
+
+
+def send_ready(batch_size=None, max_workers=None):
+    """Send the emails ready in the outbox using a pool of threads
+
+    Args:
+        batch_size: maximum number of emails to send
+        max_workers: number of threads sending emails
+
+    Returns:
+        (number of emails sent, number of emails that failed)
+    """
+    outbound_emails = claim_ready(
+        batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    )
+    if not outbound_emails:
+        return 0, 0
+
+    # Only the SMTP calls run in the threads, results are saved from here
+    with ThreadPoolExecutor(
+        max_workers=max_workers or settings.EMAIL_OUTBOX_WORKERS
+    ) as executor:
+        errors = list(executor.map(_deliver, outbound_emails))
+
+    sent_count = 0
+    for outbound_email, error in zip(outbound_emails, errors):
+        if error is None:
+            _mark_sent(outbound_email)
+            sent_count += 1
+        else:
+            _mark_failed_attempt(outbound_email, error)
+    return sent_count, len(outbound_emails) - sent_count
+
+
+def _deliver(outbound_email):
+    """Send an outbound email
+
+    Args:
+        outbound_email:
+
+    Returns:
+        None if the email was sent, the error message otherwise
+    """
+    try:
+        mail = EmailMultiAlternatives(
+            subject=EMAIL_SUBJECT_PREFIX + outbound_email.subject,
+            body="",
+            from_email=outbound_email.sender,
+            to=outbound_email.recipient_list,
+        )
+        mail.attach_alternative(outbound_email.body, "text/html")
+        mail.send(fail_silently=False)
+        return None
+    except Exception as exception:
+        return str(exception) or exception.__class__.__name__
+
+
+def _mark_sent(outbound_email):
+    """Mark an outbound email as sent
+
+    Args:
+        outbound_email:
+
+    Returns:
+
+    """
+    outbound_email.status = OutboundEmail.STATUS_SENT
+    outbound_email.attempts += 1
+    outbound_email.sent_date = timezone.now()
+    outbound_email.last_error = ""
+    outbound_email.save()
+
+
+def _mark_failed_attempt(outbound_email, error):
+    """Schedule a retry with an exponential backoff, or mark an outbound email
+    as failed if it reached the maximum number of attempts
+
+    Args:
+        outbound_email:
+        error:
+
+    Returns:
+
+    """
+    outbound_email.attempts += 1
+    outbound_email.last_error = error
+    if outbound_email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        outbound_email.status = OutboundEmail.STATUS_FAILED
+        logger.error(
+            "Outbound email %s failed after %d attempts: %s",
+            str(outbound_email.id),
+            outbound_email.attempts,
+            error,
+        )
+    else:
+        outbound_email.next_attempt_date = timezone.now() + timedelta(
+            seconds=settings.EMAIL_OUTBOX_RETRY_DELAY
+            * 2 ** (outbound_email.attempts - 1)
+        )
+        logger.warning(
+            "Outbound email %s attempt %d failed: %s",
+            str(outbound_email.id),
+            outbound_email.attempts,
+            error,
+        )
+    outbound_email.save()
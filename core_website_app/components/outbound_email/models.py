@@ -0,0 +1,80 @@
+"""Outbound email model"""
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.utils import timezone
+
+from core_main_app.commons import exceptions
+
+
+class OutboundEmail(models.Model):
+    """Represents an email stored in the outbox until a worker sends it"""
+
+    STATUS_PENDING = "pending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    recipient_list = models.JSONField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    sender = models.CharField(max_length=254)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_date = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    creation_date = models.DateTimeField(auto_now_add=True)
+    sent_date = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """Meta"""
+
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_date"],
+                name="outbound_email_ready_idx",
+            ),
+        ]
+
+    @staticmethod
+    def get_by_id(outbound_email_id):
+        """Get an outbound email given its primary key
+
+        Args:
+            outbound_email_id:
+
+        Returns:
+        """
+        try:
+            return OutboundEmail.objects.get(pk=str(outbound_email_id))
+        except ObjectDoesNotExist as exception:
+            raise exceptions.DoesNotExist(str(exception))
+        except Exception as ex:
+            raise exceptions.ModelError(str(ex))
+
+    @staticmethod
+    def get_all_ready(date):
+        """Get pending emails that can be sent at the given date, oldest first
+
+        Args:
+            date:
+
+        Returns:
+        """
+        return OutboundEmail.objects.filter(
+            status=OutboundEmail.STATUS_PENDING, next_attempt_date__lte=date
+        ).order_by("next_attempt_date", "id")
+
+    def __str__(self):
+        """Outbound email as string
+
+        Returns:
+
+        """
+        return "%s (%s)" % (self.subject, self.status)
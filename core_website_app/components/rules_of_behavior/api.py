@@ -3,6 +3,9 @@
 import core_main_app.components.web_page.api as web_page_api
 from core_main_app.commons.exceptions import ApiError
 from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.components.web_page import (
+    api as rendered_web_page_api,
+)
 
 RULES_OF_BEHAVIOR_PAGE_NAME = "rules_of_behavior"
 RULES_OF_BEHAVIOR_PAGE_TYPE = WEB_PAGE_TYPES[RULES_OF_BEHAVIOR_PAGE_NAME]
@@ -33,4 +36,6 @@ def upsert(rules_of_behavior_page):
             )
         )
 
-    return web_page_api.upsert(rules_of_behavior_page)
+    return rendered_web_page_api.upsert(
+        rules_of_behavior_page, RULES_OF_BEHAVIOR_PAGE_NAME
+    )
@@ -0,0 +1 @@
+"""Website web pages (help, privacy policy, terms of use, rules of behavior)"""
@@ -0,0 +1,104 @@
+"""Rendered web page API"""
+
+import core_main_app.components.web_page.api as core_web_page_api
+from core_main_app.components.web_page.models import WebPage
+from core_main_app.utils.markdown_parser import parse
+from core_website_app.components.web_page.models import RenderedWebPage
+from core_website_app.utils import web_page_cache
+
+
+def render(web_page):
+    """Render the markdown content of a web page and store the HTML
+
+    Args:
+        web_page:
+
+    Returns:
+        RenderedWebPage
+    """
+    rendered_web_page, _ = RenderedWebPage.objects.update_or_create(
+        web_page_id=web_page.id,
+        defaults={
+            "content_hash": RenderedWebPage.get_content_hash(web_page.content),
+            "html": parse(web_page.content),
+        },
+    )
+    return rendered_web_page
+
+
+def get_rendered(web_page):
+    """Get the stored HTML of a web page, rendering it if it was not stored
+    yet or if it was rendered from another content
+
+    Args:
+        web_page:
+
+    Returns:
+        RenderedWebPage
+    """
+    try:
+        # loaded with the page by the web page registry
+        rendered_web_page = web_page.rendered
+    except RenderedWebPage.DoesNotExist:
+        return render(web_page)
+
+    if rendered_web_page.content_hash != RenderedWebPage.get_content_hash(
+        web_page.content
+    ):
+        return render(web_page)
+    return rendered_web_page
+
+
+def upsert(web_page, page_name):
+    """Save or delete a website page and invalidate its cached versions,
+    unless its content did not change
+
+    Args:
+        web_page:
+        page_name: name of the web page type
+
+    Returns:
+        result of the core upsert, the web page itself if it did not change
+    """
+    if is_unchanged(web_page):
+        # keep the cached page, its ETag and its static export
+        return web_page
+
+    result = core_web_page_api.upsert(web_page)
+    web_page_cache.invalidate(page_name)
+    return result
+
+
+def is_unchanged(web_page):
+    """Check if saving a web page would not change its stored content
+
+    Args:
+        web_page:
+
+    Returns:
+        boolean
+    """
+    if web_page.id is None:
+        return False
+    stored_content = (
+        WebPage.objects.filter(id=web_page.id)
+        .values_list("content", flat=True)
+        .first()
+    )
+    return stored_content is not None and has_content(web_page, stored_content)
+
+
+def has_content(web_page, content):
+    """Check if a web page has a given content, by comparing the hashes of
+    both contents
+
+    Args:
+        web_page:
+        content: markdown content
+
+    Returns:
+        boolean
+    """
+    return RenderedWebPage.get_content_hash(
+        web_page.content
+    ) == RenderedWebPage.get_content_hash(content)
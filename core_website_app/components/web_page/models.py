@@ -0,0 +1,57 @@
+"""Rendered web page model"""
+
+import hashlib
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+
+from core_main_app.commons import exceptions
+from core_main_app.components.web_page.models import WebPage
+
+
+class RenderedWebPage(models.Model):
+    """HTML rendered from the markdown content of a web page, with the hash
+    of the content it was rendered from"""
+
+    web_page = models.OneToOneField(
+        WebPage, on_delete=models.CASCADE, related_name="rendered"
+    )
+    content_hash = models.CharField(max_length=64)
+    html = models.TextField()
+    rendering_date = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def get_by_web_page_id(web_page_id):
+        """Get the rendered HTML of a web page
+
+        Args:
+            web_page_id:
+
+        Returns:
+        """
+        try:
+            return RenderedWebPage.objects.get(web_page_id=web_page_id)
+        except ObjectDoesNotExist as exception:
+            raise exceptions.DoesNotExist(str(exception))
+        except Exception as exception:
+            raise exceptions.ModelError(str(exception))
+
+    @staticmethod
+    def get_content_hash(content):
+        """Get the hash of the markdown content of a web page
+
+        Args:
+            content: markdown content
+
+        Returns:
+            hexadecimal sha256 of the content
+        """
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def __str__(self):
+        """Rendered web page as string
+
+        Returns:
+
+        """
+        return "%s (%s)" % (str(self.web_page_id), self.content_hash)
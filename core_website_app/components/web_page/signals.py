@@ -0,0 +1,79 @@
+"""Signals to attach to Web Page"""
+
+import logging
+from functools import partial
+
+from django.db import transaction
+from django.db.models import signals as models_signals
+
+from core_main_app.components.web_page.models import WebPage
+from core_website_app.commons.enums import WEBSITE_PAGE_TYPES
+from core_website_app.components.web_page import api as web_page_api
+from core_website_app.utils import (
+    static_export,
+    web_page_cache,
+    web_page_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def connect():
+    """Connect signals for web pages
+
+    Web pages can be saved without the website APIs (e.g. REST API), the
+    pages are rendered and the cached pages are invalidated whatever the way
+    they are saved.
+    """
+    models_signals.post_save.connect(post_save_web_page, sender=WebPage)
+    models_signals.post_delete.connect(post_delete_web_page, sender=WebPage)
+    logger.info("Registered signals for web pages")
+
+
+def post_save_web_page(sender, instance, **kwargs):
+    """Signal triggered after saving a web page
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    # other apps' pages (e.g. login) are not served by the website
+    if instance.type not in WEBSITE_PAGE_TYPES.values():
+        return
+    web_page_api.render(instance)
+    _invalidate(instance.type)
+
+
+def post_delete_web_page(sender, instance, **kwargs):
+    """Signal triggered after deleting a web page
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    if instance.type not in WEBSITE_PAGE_TYPES.values():
+        return
+    _invalidate(instance.type)
+
+
+def _invalidate(page_type):
+    """Invalidate the cached web page of a given type, and export it again
+    once the transaction is committed
+
+    The registry is invalidated again after the commit, in case another
+    process loaded it before the change was visible.
+
+    Args:
+        page_type: type of the web page
+    """
+    web_page_registry.invalidate()
+    transaction.on_commit(web_page_registry.invalidate)
+    for page_name, web_page_type in WEBSITE_PAGE_TYPES.items():
+        if web_page_type == page_type:
+            web_page_cache.invalidate(page_name)
+            if page_name in static_export.STATIC_PAGES:
+                transaction.on_commit(
+                    partial(static_export.export_page_on_commit, page_name)
+                )
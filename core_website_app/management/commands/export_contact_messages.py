@@ -0,0 +1,80 @@
+"""Export contact messages command"""
+
+from django.core.management import BaseCommand, CommandError
+
+import core_website_app.components.contact_message.api as contact_message_api
+from core_main_app.commons.exceptions import ApiError
+from core_website_app import settings
+from core_website_app.utils import export
+
+
+class Command(BaseCommand):
+    """Export all the contact messages"""
+
+    help = "Export all the contact messages as CSV or newline delimited JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            default=export.CSV,
+            choices=sorted(export.EXPORT_FORMATS),
+            help="Format of the export",
+        )
+        parser.add_argument(
+            "--gzip",
+            default=False,
+            action="store_true",
+            help="Compress the export with gzip",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            default=settings.CONTACT_MESSAGE_EXPORT_CHUNK_SIZE,
+            type=int,
+            help="Number of messages fetched from the database at a time",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Path of the export file, - for the standard output",
+        )
+
+    def handle(self, *args, **options):
+        """Write all the contact messages, oldest first, to a file or to the
+        standard output.
+
+        Parameters:
+            "format": csv or ndjson,
+            "gzip": boolean,
+            "chunk-size": integer,
+            "output": string
+
+        Examples:
+            python manage.py export_contact_messages > messages.csv
+            python manage.py export_contact_messages --format ndjson --gzip \
+                --output messages.ndjson.gz
+        """
+        try:
+            chunks = export.iter_export(
+                contact_message_api.iter_export_rows(
+                    chunk_size=options["chunk_size"]
+                ),
+                contact_message_api.EXPORT_FIELDS,
+                options["format"],
+                compress=options["gzip"],
+            )
+        except ApiError as api_error:
+            raise CommandError(str(api_error))
+
+        if options["output"] != "-":
+            with open(options["output"], "wb") as output_file:
+                for chunk in chunks:
+                    output_file.write(chunk)
+        elif hasattr(self.stdout, "buffer"):
+            for chunk in chunks:
+                self.stdout.buffer.write(chunk)
+            self.stdout.buffer.flush()
+        elif options["gzip"]:
+            raise CommandError("Use --output to write a compressed export.")
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk.decode("utf-8"), ending="")
@@ -0,0 +1,53 @@
+"""Export static pages command"""
+
+from django.core.management import BaseCommand, CommandError
+
+from core_website_app import settings
+from core_website_app.utils import static_export
+
+
+class Command(BaseCommand):
+    """Export the website pages as static files"""
+
+    help = (
+        "Render the help, privacy policy, terms of use and rules of behavior "
+        "pages as HTML files, with precompressed variants"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=settings.STATIC_EXPORT_DIR,
+            help="Directory of the exported pages",
+        )
+        parser.add_argument(
+            "--page",
+            action="append",
+            choices=sorted(static_export.STATIC_PAGES),
+            help="Page to export, can be repeated. All pages by default",
+        )
+
+    def handle(self, *args, **options):
+        """Write the pages to the output directory.
+
+        Parameters:
+            "output": string,
+            "page": list of strings
+
+        Examples:
+            python manage.py export_static_pages --output /srv/www/pages
+            python manage.py export_static_pages --page help
+        """
+        if not options["output"]:
+            raise CommandError(
+                "Use --output or the STATIC_EXPORT_DIR setting to set the "
+                "export directory."
+            )
+        if static_export.brotli is None:
+            self.stderr.write(
+                "brotli is not installed, the .br files are not written."
+            )
+
+        paths = static_export.export_pages(options["output"], options["page"])
+        for path in paths:
+            self.stdout.write(path)
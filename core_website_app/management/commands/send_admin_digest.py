@@ -0,0 +1,66 @@
+"""Send admin digest command"""
+
+import time
+
+from django.core.management import BaseCommand
+
+import core_website_app.components.admin_notification.api as admin_notification_api
+from core_website_app import settings
+
+
+class Command(BaseCommand):
+    """Send the digest of the new items to the website contacts"""
+
+    help = (
+        "Send one email per kind of new item (account requests, contact "
+        "messages) listing the items received since the last digest"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=settings.ADMIN_NOTIFICATION_DIGEST_BATCH_SIZE,
+            type=int,
+            help="Maximum number of items listed in a digest",
+        )
+        parser.add_argument(
+            "--loop",
+            default=False,
+            action="store_true",
+            help="Keep running and send a digest every interval",
+        )
+        parser.add_argument(
+            "--interval",
+            default=settings.ADMIN_NOTIFICATION_DIGEST_INTERVAL,
+            type=float,
+            help="Seconds between two digests when looping",
+        )
+
+    def handle(self, *args, **options):
+        """Send the digest of the items waiting since the last one, if any.
+
+        Parameters:
+            "batch-size": integer,
+            "loop": boolean,
+            "interval": float
+
+        Examples:
+            python manage.py send_admin_digest
+            python manage.py send_admin_digest --loop --interval 86400
+        """
+        while True:
+            try:
+                item_count = admin_notification_api.send_digest(
+                    batch_size=options["batch_size"]
+                )
+            except Exception as exception:
+                if not options["loop"]:
+                    raise
+                # the items are listed again in a later digest
+                self.stderr.write("Digest not sent: %s" % str(exception))
+                item_count = 0
+            if item_count:
+                self.stdout.write("%d item(s) sent in digest." % item_count)
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
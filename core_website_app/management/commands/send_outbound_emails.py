@@ -0,0 +1,72 @@
+"""Send outbound emails command"""
+
+import logging
+import time
+
+from django.core.management import BaseCommand
+
+import core_website_app.components.outbound_email.api as outbound_email_api
+from core_website_app import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Send the emails waiting in the outbox"""
+
+    help = "Send the emails waiting in the outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            type=int,
+            help="Maximum number of emails sent per iteration",
+        )
+        parser.add_argument(
+            "--workers",
+            default=settings.EMAIL_OUTBOX_WORKERS,
+            type=int,
+            help="Number of threads sending emails",
+        )
+        parser.add_argument(
+            "--loop",
+            default=False,
+            action="store_true",
+            help="Keep running and poll the outbox",
+        )
+        parser.add_argument(
+            "--interval",
+            default=5,
+            type=float,
+            help="Seconds between two polls of the outbox when looping",
+        )
+
+    def handle(self, *args, **options):
+        """Send the emails ready in the outbox, until it is empty.
+
+        Parameters:
+            "batch-size": integer,
+            "workers": integer,
+            "loop": boolean,
+            "interval": float
+
+        Examples:
+            python manage.py send_outbound_emails
+            python manage.py send_outbound_emails --loop --workers 8
+        """
+        while True:
+            sent_count, failed_count = outbound_email_api.send_ready(
+                batch_size=options["batch_size"],
+                max_workers=options["workers"],
+            )
+            if sent_count or failed_count:
+                self.stdout.write(
+                    "%d email(s) sent, %d failed." % (sent_count, failed_count)
+                )
+            # keep draining while full batches are sent
+            if sent_count + failed_count >= options["batch_size"]:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -4,25 +4,54 @@ from django.urls import reverse
 from menu import Menu, MenuItem
 
 from core_website_app.settings import (
+    DISPLAY_NIST_HEADERS,
     DISPLAY_PRIVACY_POLICY_FOOTER,
     DISPLAY_TERMS_OF_USE_FOOTER,
     DISPLAY_CONTACT_FOOTER,
     DISPLAY_HELP_FOOTER,
     DISPLAY_RULES_OF_BEHAVIOR_FOOTER,
 )
+from core_website_app.utils import web_page_registry
+
+
+def _page_exists(page_name):
+    """Get a menu check showing an item only if a web page exists. The
+    existence of the pages is read once per request for all the items.
+
+    Args:
+        page_name: name of the web page type
+
+    Returns:
+        function
+    """
+    return lambda request: web_page_registry.get_request_pages(request)[
+        page_name
+    ]
+
 
 if DISPLAY_PRIVACY_POLICY_FOOTER:
     Menu.add_item(
         "footer",
         MenuItem(
-            "Privacy policy", reverse("core_website_app_privacy"), weight=1001
+            "Privacy policy",
+            reverse("core_website_app_privacy"),
+            weight=1001,
+            # the NIST privacy policy is an external page
+            check=(
+                None
+                if DISPLAY_NIST_HEADERS
+                else _page_exists("privacy_policy")
+            ),
         ),
     )
 if DISPLAY_TERMS_OF_USE_FOOTER:
     Menu.add_item(
         "footer",
         MenuItem(
-            "Terms of use", reverse("core_website_app_terms"), weight=1002
+            "Terms of use",
+            reverse("core_website_app_terms"),
+            weight=1002,
+            check=_page_exists("terms_of_use"),
         ),
     )
 if DISPLAY_CONTACT_FOOTER:
@@ -43,6 +72,7 @@ if DISPLAY_HELP_FOOTER:
             reverse("core_website_app_help"),
             icon="question-circle",
             weight=1004,
+            check=_page_exists("help"),
         ),
     )
 if DISPLAY_RULES_OF_BEHAVIOR_FOOTER:
@@ -53,6 +83,7 @@ if DISPLAY_RULES_OF_BEHAVIOR_FOOTER:
             reverse("core_website_app_rules_of_behavior"),
             icon="balance-scale",
             weight=1004,
+            check=_page_exists("rules_of_behavior"),
         ),
     )
 
@@ -82,13 +113,14 @@ website_children = (
         "User requests",
         reverse("core-admin:core_website_app_user_requests"),
         icon="user-plus",
-        item_count_url="core-admin:core_website_app_request_count",
+        # the menu of each admin page sends one request per badge: a single
+        # badge is loaded, with all the counts
+        item_count_url="core-admin:core_website_app_badge_counts",
     ),
     MenuItem(
         "Contact messages",
         reverse("core-admin:core_website_app_contact_messages"),
         icon="envelope",
-        item_count_url="core-admin:core_website_app_message_count",
     ),
 )
 
@@ -0,0 +1,64 @@
+"""Query statistics Middleware"""
+
+import logging
+
+from django.core.exceptions import MiddlewareNotUsed
+
+from core_website_app import settings
+from core_website_app.utils.query_stats import track_queries
+
+logger = logging.getLogger("core_website_app.middleware.query_stats")
+
+
+class QueryStatsMiddleware:
+    """Log the number of queries, their duration and the duplicated queries
+    of each request, and warn when a view goes over its query budget"""
+
+    def __init__(self, get_response):
+        """Init middleware
+
+        Args:
+            get_response:
+        """
+        if not settings.QUERY_STATS_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Call Middleware
+
+        Args:
+            request:
+
+        Returns:
+
+        """
+        with track_queries() as stats:
+            response = self.get_response(request)
+
+        view_name = (
+            request.resolver_match.view_name
+            if request.resolver_match
+            else None
+        )
+        logger.info(
+            "%s %s (%s): %s",
+            request.method,
+            request.path,
+            view_name,
+            str(stats),
+        )
+        budget = settings.QUERY_BUDGETS.get(view_name)
+        if budget is not None and stats.count > budget:
+            logger.warning(
+                "%s sent %d queries, over its budget of %d.",
+                view_name,
+                stats.count,
+                budget,
+            )
+
+        if settings.QUERY_STATS_HEADERS:
+            response["X-Query-Count"] = str(stats.count)
+            response["X-Query-Time"] = "%.2f" % stats.duration_ms
+            response["X-Query-Duplicates"] = str(stats.duplicates)
+        return response
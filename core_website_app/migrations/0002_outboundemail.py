@@ -0,0 +1,63 @@
+"""Migrations"""
+
+# Generated by Django 5.2.18 on 2026-10-17 11:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_website_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboundEmail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("recipient_list", models.JSONField()),
+                ("subject", models.CharField(max_length=255)),
+                ("body", models.TextField()),
+                ("sender", models.CharField(max_length=254)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                (
+                    "next_attempt_date",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("creation_date", models.DateTimeField(auto_now_add=True)),
+                ("sent_date", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["status", "next_attempt_date"],
+                        name="outbound_email_ready_idx",
+                    )
+                ],
+            },
+        ),
+    ]
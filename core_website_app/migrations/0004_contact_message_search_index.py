@@ -0,0 +1,99 @@
+"""Migrations"""
+
+from django.db import migrations
+
+TABLE_NAME = "core_website_app_contactmessage"
+FTS_TABLE_NAME = "core_website_app_contactmessage_fts"
+
+# Must stay identical to the expression searched in
+# core_website_app.components.contact_message.search
+POSTGRESQL_CREATE_INDEX_SQL = [
+    'CREATE INDEX "{table}_search" ON "{table}" USING GIN '
+    "(to_tsvector('simple', \"name\" || ' ' || \"email\" || ' ' "
+    '|| "content"))'.format(table=TABLE_NAME),
+]
+POSTGRESQL_DROP_INDEX_SQL = [
+    'DROP INDEX IF EXISTS "{table}_search"'.format(table=TABLE_NAME),
+]
+
+# The triggers are dropped if SQLite rebuilds the table during a migration,
+# they must then be created again, followed by a 'rebuild' of the index.
+SQLITE_CREATE_INDEX_SQL = [
+    sql.format(table=TABLE_NAME, fts_table=FTS_TABLE_NAME)
+    for sql in (
+        'CREATE VIRTUAL TABLE "{fts_table}" USING fts5('
+        "name, email, content, content='{table}', content_rowid='id')",
+        'CREATE TRIGGER "{fts_table}_insert" AFTER INSERT ON "{table}" '
+        'BEGIN INSERT INTO "{fts_table}"(rowid, name, email, content) '
+        "VALUES (new.id, new.name, new.email, new.content); END",
+        'CREATE TRIGGER "{fts_table}_delete" AFTER DELETE ON "{table}" '
+        'BEGIN INSERT INTO "{fts_table}"("{fts_table}", rowid, name, email, '
+        "content) VALUES ('delete', old.id, old.name, old.email, "
+        "old.content); END",
+        'CREATE TRIGGER "{fts_table}_update" AFTER UPDATE ON "{table}" '
+        'BEGIN INSERT INTO "{fts_table}"("{fts_table}", rowid, name, email, '
+        "content) VALUES ('delete', old.id, old.name, old.email, "
+        'old.content); INSERT INTO "{fts_table}"(rowid, name, email, '
+        "content) VALUES (new.id, new.name, new.email, new.content); END",
+        'INSERT INTO "{fts_table}"("{fts_table}") VALUES (\'rebuild\')',
+    )
+]
+SQLITE_DROP_INDEX_SQL = [
+    sql.format(fts_table=FTS_TABLE_NAME)
+    for sql in (
+        'DROP TRIGGER IF EXISTS "{fts_table}_insert"',
+        'DROP TRIGGER IF EXISTS "{fts_table}_delete"',
+        'DROP TRIGGER IF EXISTS "{fts_table}_update"',
+        'DROP TABLE IF EXISTS "{fts_table}"',
+    )
+]
+
+CREATE_INDEX_SQL = {
+    "postgresql": POSTGRESQL_CREATE_INDEX_SQL,
+    "sqlite": SQLITE_CREATE_INDEX_SQL,
+}
+DROP_INDEX_SQL = {
+    "postgresql": POSTGRESQL_DROP_INDEX_SQL,
+    "sqlite": SQLITE_DROP_INDEX_SQL,
+}
+
+
+def create_search_index(apps, schema_editor):
+    """Create the full-text index of the contact messages, if the database
+    supports it
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    for sql in CREATE_INDEX_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the full-text index of the contact messages
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    for sql in DROP_INDEX_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_website_app", "0003_account_request_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,70 @@
+"""Migrations"""
+
+# Generated by Django 5.2.18 on 2026-10-17 12:07
+
+import importlib
+
+from django.db import migrations, models
+
+search_index_migration = importlib.import_module(
+    "core_website_app.migrations.0004_contact_message_search_index"
+)
+
+
+def recreate_search_triggers(apps, schema_editor):
+    """Create the full-text index of SQLite again: its triggers are dropped
+    when SQLite rebuilds the contact message table to add or remove the
+    constraint
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    search_index_migration.drop_search_index(apps, schema_editor)
+    search_index_migration.create_search_index(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_website_app", "0004_contact_message_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            migrations.RunPython.noop,
+            recreate_search_triggers,
+        ),
+        migrations.AddField(
+            model_name="contactmessage",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="contactmessage",
+            name="duplicate_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contactmessage",
+            name="window_start",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="contactmessage",
+            constraint=models.UniqueConstraint(
+                fields=("email", "content_hash", "window_start"),
+                name="contact_message_unique_per_window",
+            ),
+        ),
+        migrations.RunPython(
+            recreate_search_triggers,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,48 @@
+"""Migrations"""
+
+# Generated by Django 5.2.18 on 2026-10-17 12:15
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_website_app", "0005_contact_message_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AdminNotification",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("account_request", "Account request"),
+                            ("contact_message", "Contact message"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "item",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                ("creation_date", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""Migrations"""
+
+# Generated by Django 5.2.18 on 2026-10-17 12:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_main_app", "0001_initial"),
+        ("core_website_app", "0006_adminnotification"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RenderedWebPage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content_hash", models.CharField(max_length=64)),
+                ("html", models.TextField()),
+                ("rendering_date", models.DateTimeField(auto_now=True)),
+                (
+                    "web_page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rendered",
+                        to="core_main_app.webpage",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,22 @@
+"""Migrations"""
+
+# Generated by Django 5.2.18 on 2026-10-17 12:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_website_app", "0007_renderedwebpage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="adminnotification",
+            name="next_attempt_date",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
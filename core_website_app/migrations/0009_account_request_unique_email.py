@@ -0,0 +1,59 @@
+"""Migrations"""
+
+# Generated by Django 5.2.18 on 2026-10-17 12:45
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_account_requests(apps, schema_editor):
+    """Stop the migration if several pending requests use the same email,
+    so the email can be made unique. The requests are not deleted, an
+    administrator decides which ones to accept or deny.
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    account_request_model = apps.get_model(
+        "core_website_app", "AccountRequest"
+    )
+    duplicates = (
+        account_request_model.objects.values("email")
+        .annotate(request_count=Count("id"))
+        .filter(request_count__gt=1)
+        .order_by("email")
+    )
+    if not duplicates:
+        return
+    raise RuntimeError(
+        "Several pending account requests use the same email: %s. Accept "
+        "or deny the duplicate requests, then run the migration again."
+        % ", ".join(
+            "%s (%d requests)" % (row["email"], row["request_count"])
+            for row in duplicates
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_website_app", "0008_adminnotification_next_attempt_date"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_duplicate_account_requests,
+            migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name="accountrequest",
+            name="email",
+            field=models.CharField(max_length=200, unique=True),
+        ),
+    ]
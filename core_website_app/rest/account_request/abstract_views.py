@@ -14,6 +14,7 @@ from core_main_app.commons import exceptions
 from core_main_app.commons.exceptions import ApiError
 from core_main_app.utils.decorators import api_staff_member_required
 import core_website_app.components.account_request.api as account_request_api
+from core_website_app.utils import idempotency
 
 
 class AbstractActionAccountRequest(APIView, metaclass=ABCMeta):
@@ -44,6 +45,9 @@ class AbstractActionAccountRequest(APIView, metaclass=ABCMeta):
     def patch(self, request, pk):
         """Deny or Accept
 
+        Requests sent again with the same `Idempotency-Key` header get the
+        same response, without performing the action again.
+
         Args:
 
             request: HTTP request
@@ -63,11 +67,10 @@ class AbstractActionAccountRequest(APIView, metaclass=ABCMeta):
               content: Internal server error
         """
         try:
-            # Get object
-            account_request_object = self.get_object(pk)
-
-            # Set current template
-            self.perform(account_request_object)
+            # retries sent with the same idempotency key are not performed
+            idempotency.run_once(
+                request, lambda: self.perform(self.get_object(pk))
+            )
 
             return Response(status=status.HTTP_200_OK)
         except Http404:
@@ -87,3 +90,70 @@ class AbstractActionAccountRequest(APIView, metaclass=ABCMeta):
             return Response(
                 content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class AbstractBulkActionAccountRequest(APIView, metaclass=ABCMeta):
+    """Action on a list of Account requests"""
+
+    serializer_class = None
+
+    @abstractmethod
+    def perform(self, validated_data):
+        """Perform an action on the account requests, return the number of
+        requests processed and the recipients of the emails that could not be
+        sent"""
+        raise NotImplementedError("action method is not implemented.")
+
+    @method_decorator(api_staff_member_required())
+    def patch(self, request):
+        """Deny or Accept a list of account requests
+
+        Parameters:
+
+            {
+                "ids": [<id>, ...]
+            }
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 200
+              content: Number of account requests processed, recipients of
+                the emails that could not be sent
+            - code: 400
+              content: Validation error / bad request
+            - code: 403
+              content: Authentication error
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            serializer = self.serializer_class(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            # retries sent with the same idempotency key are not performed
+            count, failed_recipients = idempotency.run_once(
+                request, lambda: self.perform(serializer.validated_data)
+            )
+
+            return Response(
+                {"count": count, "failed_recipients": failed_recipients},
+                status=status.HTTP_200_OK,
+            )
+        except AccessControlError as access_error:
+            content = {"message": str(access_error)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except ApiError as api_error:
+            content = {"message": str(api_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
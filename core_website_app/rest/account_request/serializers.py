@@ -2,7 +2,15 @@
 
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import (
+    BooleanField,
+    CharField,
+    IntegerField,
+    ListField,
+    ModelSerializer,
+)
+
+from core_main_app.commons.serializers import BasicSerializer
 
 import core_website_app.components.account_request.api as account_request_api
 from core_website_app.components.account_request.models import AccountRequest
@@ -53,3 +61,17 @@ class UserSerializer(ModelSerializer):
 
         account_request_api.insert(user)
         return user
+
+
+class AccountRequestIdListSerializer(BasicSerializer):
+    """Represents a list of account request ids"""
+
+    ids = ListField(child=IntegerField(min_value=1), allow_empty=False)
+
+
+class AccountRequestDenyListSerializer(AccountRequestIdListSerializer):
+    """Represents a list of account request ids to deny"""
+
+    send_email = BooleanField(required=False, default=True)
+    email_subject = CharField(required=False)
+    email_body = CharField(required=False)
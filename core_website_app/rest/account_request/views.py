@@ -20,11 +20,16 @@ from core_main_app.utils.decorators import api_staff_member_required
 import core_website_app.components.account_request.api as account_request_api
 from core_website_app.rest.account_request.abstract_views import (
     AbstractActionAccountRequest,
+    AbstractBulkActionAccountRequest,
 )
 from core_website_app.rest.account_request.serializers import (
+    AccountRequestDenyListSerializer,
+    AccountRequestIdListSerializer,
     AccountRequestSerializer,
     UserSerializer,
 )
+from core_website_app.rest.throttling import TokenBucketThrottle
+from core_website_app.utils import rate_limit
 
 logger = logging.getLogger("core_website_app.rest.account_request.views")
 
@@ -36,6 +41,9 @@ logger = logging.getLogger("core_website_app.rest.account_request.views")
 class AccountRequestList(APIView):
     """Create or get all Account Request"""
 
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = rate_limit.ACCOUNT_REQUEST_SCOPE
+
     @extend_schema(
         summary="Get all account requests",
         description="Get all account requests",
@@ -78,6 +86,7 @@ class AccountRequestList(APIView):
             400: OpenApiResponse(
                 description="Validation error / missing parameters"
             ),
+            429: OpenApiResponse(description="Too many submissions"),
             500: OpenApiResponse(description="Internal server error"),
         },
     )
@@ -243,3 +252,67 @@ class AccountRequestAccept(AbstractActionAccountRequest):
             account_request_object: account_request
         """
         account_request_api.accept(account_request_object)
+
+
+@extend_schema(
+    tags=["Account Request"],
+    description="Deny a list of Account Requests",
+)
+class AccountRequestBulkDeny(AbstractBulkActionAccountRequest):
+    """Deny a list of Account Requests"""
+
+    serializer_class = AccountRequestDenyListSerializer
+
+    @extend_schema(
+        summary="Deny a list of Account Requests",
+        description="Deny a list of Account Requests in one transaction",
+        request=AccountRequestDenyListSerializer,
+        responses={
+            200: OpenApiResponse(description="Account requests denied"),
+            400: OpenApiResponse(description="Validation error"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def perform(self, validated_data):
+        """Deny a list of Account Requests
+        Args:
+            validated_data: ids, send_email and email parameters
+        """
+        email_params = None
+        if "email_subject" in validated_data or "email_body" in validated_data:
+            email_params = {
+                "subject": validated_data.get("email_subject"),
+                "body": validated_data.get("email_body"),
+            }
+        return account_request_api.deny_all(
+            validated_data["ids"],
+            send_email=validated_data["send_email"],
+            email_params=email_params,
+        )
+
+
+@extend_schema(
+    tags=["Account Request"],
+    description="Accept a list of Account Requests",
+)
+class AccountRequestBulkAccept(AbstractBulkActionAccountRequest):
+    """Accept a list of Account Requests"""
+
+    serializer_class = AccountRequestIdListSerializer
+
+    @extend_schema(
+        summary="Accept a list of Account Requests",
+        description="Accept a list of Account Requests in one transaction",
+        request=AccountRequestIdListSerializer,
+        responses={
+            200: OpenApiResponse(description="Account requests accepted"),
+            400: OpenApiResponse(description="Validation error"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def perform(self, validated_data):
+        """Accept a list of Account Requests
+        Args:
+            validated_data: ids
+        """
+        return account_request_api.accept_all(validated_data["ids"])
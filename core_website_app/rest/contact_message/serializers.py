@@ -2,6 +2,7 @@
 
 from rest_framework.serializers import ModelSerializer
 
+import core_website_app.components.contact_message.api as contact_message_api
 from core_website_app.components.contact_message.models import ContactMessage
 
 
@@ -12,5 +13,10 @@ class ContactMessageSerializer(ModelSerializer):
         """Meta"""
 
         model = ContactMessage
-        fields = ["id", "name", "email", "content"]
-        read_only_fields = ("id",)
+        fields = ["id", "name", "email", "content", "duplicate_count"]
+        read_only_fields = ("id", "duplicate_count")
+
+    def create(self, validated_data):
+        """Create and return a new `ContactMessage` instance, or the message
+        already received if it is a duplicate, given the validated data."""
+        return contact_message_api.upsert(ContactMessage(**validated_data))
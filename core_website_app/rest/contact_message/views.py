@@ -13,14 +13,18 @@ from drf_spectacular.utils import (
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView
 
 from core_main_app.commons import exceptions
+from core_main_app.utils.boolean import to_bool
 from core_main_app.utils.decorators import api_staff_member_required
 import core_website_app.components.contact_message.api as contact_message_api
 from core_website_app.rest.contact_message.serializers import (
     ContactMessageSerializer,
 )
+from core_website_app.rest.throttling import TokenBucketThrottle
+from core_website_app.utils import export, rate_limit
 
 logger = logging.getLogger("core_website_app.rest.contact_message.views")
 
@@ -32,33 +36,94 @@ logger = logging.getLogger("core_website_app.rest.contact_message.views")
 class ContactMessageList(APIView):
     """Create or get all Contact Message"""
 
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = rate_limit.CONTACT_SCOPE
+
     @extend_schema(
-        summary="Get all contact messages",
-        description="Get all contact messages",
+        summary="Get a page of contact messages",
+        description="Get a page of contact messages, newest first",
+        parameters=[
+            OpenApiParameter(
+                name="after",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Cursor: get messages older than this id",
+            ),
+            OpenApiParameter(
+                name="before",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Cursor: get messages newer than this id",
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Number of messages in the page",
+            ),
+            OpenApiParameter(
+                name="q",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Search the name, email and content of the "
+                "messages",
+            ),
+        ],
         responses={
             200: ContactMessageSerializer(many=True),
+            400: OpenApiResponse(description="Invalid cursor or page size"),
             500: OpenApiResponse(description="Internal server error"),
         },
     )
     @method_decorator(api_staff_member_required())
     def get(self, request):
-        """Get all Contact Message
+        """Get a page of Contact Message
+        Parameters:
+            {
+              "after": "message_id",
+              "before": "message_id",
+              "page_size": "page_size",
+              "q": "words to search"
+            }
         Args:
             request: HTTP request
         Returns:
             - code: 200
-              content: List of contact messages
+              content: Page of contact messages with next/previous links
+            - code: 400
+              content: Invalid cursor or page size
             - code: 500
               content: Internal server error
         """
         try:
-            contact_message_list = contact_message_api.get_all()
+            contact_message_page = contact_message_api.get_page(
+                after=request.query_params.get("after"),
+                before=request.query_params.get("before"),
+                page_size=request.query_params.get("page_size"),
+                query=request.query_params.get("q"),
+            )
             # Serialize object
             serializer = ContactMessageSerializer(
-                contact_message_list, many=True
+                contact_message_page.items, many=True
             )
             # Return response
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(
+                {
+                    "next": _get_cursor_url(
+                        request, "after", contact_message_page.next_cursor
+                    ),
+                    "previous": _get_cursor_url(
+                        request,
+                        "before",
+                        contact_message_page.previous_cursor,
+                    ),
+                    "results": serializer.data,
+                },
+                status=status.HTTP_200_OK,
+            )
+        except exceptions.ApiError as api_error:
+            content = {"message": str(api_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -74,6 +139,7 @@ class ContactMessageList(APIView):
             400: OpenApiResponse(
                 description="Validation error / missing parameters"
             ),
+            429: OpenApiResponse(description="Too many submissions"),
             500: OpenApiResponse(description="Internal server error"),
         },
     )
@@ -232,3 +298,97 @@ class ContactMessageDetail(APIView):
             return Response(
                 content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+@extend_schema(
+    tags=["Contact Message"],
+    description="Export all Contact Messages",
+)
+class ContactMessageExport(APIView):
+    """Export all Contact Messages"""
+
+    @extend_schema(
+        summary="Export all contact messages",
+        description="Stream all contact messages, oldest first, as CSV or "
+        "newline delimited JSON",
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=sorted(export.EXPORT_FORMATS),
+                description="Format of the export (default: csv)",
+            ),
+            OpenApiParameter(
+                name="gzip",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="Compress the export with gzip",
+            ),
+        ],
+        responses={
+            (200, "text/csv"): OpenApiTypes.STR,
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            (200, "application/gzip"): OpenApiTypes.BINARY,
+            400: OpenApiResponse(description="Invalid parameters"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    @method_decorator(api_staff_member_required())
+    def get(self, request):
+        """Export all Contact Messages
+        Parameters:
+            {
+              "export_format": "csv|ndjson",
+              "gzip": "true|false"
+            }
+        Args:
+            request: HTTP request
+        Returns:
+            - code: 200
+              content: Contact messages file
+            - code: 400
+              content: Invalid parameters
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            export_format = export.get_export_format(
+                request.query_params.get("export_format", export.CSV)
+            )
+            compress = to_bool(request.query_params.get("gzip", False))
+            # Rows are fetched while the response is streamed
+            return export.streaming_export_response(
+                contact_message_api.iter_export_rows(),
+                contact_message_api.EXPORT_FIELDS,
+                export_format,
+                "contact_messages",
+                compress=compress,
+            )
+        except (exceptions.ApiError, ValueError) as api_error:
+            content = {"message": str(api_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+def _get_cursor_url(request, cursor_param, cursor):
+    """Build the url of a page from the current url and a cursor
+
+    Args:
+        request: HTTP request
+        cursor_param: name of the cursor query parameter (after or before)
+        cursor: value of the cursor
+
+    Returns:
+        url of the page, None if there is no such page
+    """
+    if cursor is None:
+        return None
+    url = request.build_absolute_uri()
+    for param in ("after", "before"):
+        url = remove_query_param(url, param)
+    return replace_query_param(url, cursor_param, cursor)
@@ -0,0 +1,48 @@
+"""Throttles used throughout the Rest API"""
+
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import BaseThrottle
+
+from core_website_app.utils import rate_limit
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Limit the submissions to a view with the token buckets of the
+    `throttle_scope` of the view. Read-only requests are not limited."""
+
+    def __init__(self):
+        """Initialize the throttle"""
+        self.wait_time = 0
+
+    def allow_request(self, request, view):
+        """Take a token for the submission
+
+        Args:
+            request:
+            view:
+
+        Returns:
+            True if the submission is allowed
+        """
+        if request.method in SAFE_METHODS:
+            return True
+        # the body of a JSON request can be a list
+        email = (
+            request.data.get("email")
+            if isinstance(request.data, dict)
+            else None
+        )
+        self.wait_time = rate_limit.get_wait_time(
+            request,
+            view.throttle_scope,
+            email=email if isinstance(email, str) else None,
+        )
+        return self.wait_time == 0
+
+    def wait(self):
+        """Number of seconds before the next submission is allowed
+
+        Returns:
+
+        """
+        return self.wait_time
@@ -3,8 +3,12 @@
 from django.urls import re_path
 
 import core_main_app.rest.web_page.views as web_page_views
+import core_website_app.components.help.api as help_api
+import core_website_app.components.privacy_policy.api as privacy_policy_api
+import core_website_app.components.terms_of_use.api as terms_of_use_api
 import core_website_app.rest.account_request.views as account_request_views
 import core_website_app.rest.contact_message.views as contact_message_views
+from core_website_app.utils.decorators import web_page_condition
 
 urlpatterns = [
     re_path(
@@ -12,6 +16,16 @@ urlpatterns = [
         account_request_views.AccountRequestList.as_view(),
         name="core_website_app_rest_account_request_list",
     ),
+    re_path(
+        r"^user-requests/accept/$",
+        account_request_views.AccountRequestBulkAccept.as_view(),
+        name="core_website_app_rest_account_request_bulk_accept",
+    ),
+    re_path(
+        r"^user-requests/deny/$",
+        account_request_views.AccountRequestBulkDeny.as_view(),
+        name="core_website_app_rest_account_request_bulk_deny",
+    ),
     re_path(
         r"^user-requests/(?P<pk>\w+)/$",
         account_request_views.AccountRequestDetail.as_view(),
@@ -32,6 +46,11 @@ urlpatterns = [
         contact_message_views.ContactMessageList.as_view(),
         name="core_website_app_rest_message_list",
     ),
+    re_path(
+        r"^messages/export/$",
+        contact_message_views.ContactMessageExport.as_view(),
+        name="core_website_app_rest_message_export",
+    ),
     re_path(
         r"^messages/(?P<pk>\w+)/$",
         contact_message_views.ContactMessageDetail.as_view(),
@@ -39,17 +58,25 @@ urlpatterns = [
     ),
     re_path(
         r"^help/$",
-        web_page_views.WebPageList.as_view(web_page_type="help"),
+        web_page_condition(help_api.HELP_PAGE_NAME, representation="rest")(
+            web_page_views.WebPageList.as_view(web_page_type="help")
+        ),
         name="core_website_app_rest_help_list",
     ),
     re_path(
         r"^privacy_policy/$",
-        web_page_views.WebPageList.as_view(web_page_type="privacy_policy"),
+        web_page_condition(
+            privacy_policy_api.PRIVACY_PAGE_NAME,
+            representation="rest",
+        )(web_page_views.WebPageList.as_view(web_page_type="privacy_policy")),
         name="core_website_app_rest_privacy_policy_list",
     ),
     re_path(
         r"^terms_of_use/$",
-        web_page_views.WebPageList.as_view(web_page_type="terms_of_use"),
+        web_page_condition(
+            terms_of_use_api.TERMS_PAGE_NAME,
+            representation="rest",
+        )(web_page_views.WebPageList.as_view(web_page_type="terms_of_use")),
         name="core_website_app_rest_terms_of_use_list",
     ),
 ]
@@ -57,3 +57,191 @@ SEND_EMAIL_WHEN_CONTACT_MESSAGE_IS_RECEIVED = getattr(
 )
 """ boolean: send an email when a contact message is received
 """
+CONTACT_MESSAGES_PER_PAGE = getattr(settings, "CONTACT_MESSAGES_PER_PAGE", 20)
+""" integer: default number of contact messages per page
+"""
+CONTACT_MESSAGES_MAX_PER_PAGE = getattr(
+    settings, "CONTACT_MESSAGES_MAX_PER_PAGE", 100
+)
+""" integer: maximum number of contact messages per page
+"""
+CONTACT_MESSAGE_COUNT_CACHE_TIMEOUT = getattr(
+    settings, "CONTACT_MESSAGE_COUNT_CACHE_TIMEOUT", 300
+)
+""" integer: number of seconds the contact message count is cached
+"""
+CONTACT_MESSAGE_DUPLICATE_WINDOW = getattr(
+    settings, "CONTACT_MESSAGE_DUPLICATE_WINDOW", 3600
+)
+""" integer: number of seconds after a message during which the same message
+sent again by the same sender is counted as a duplicate instead of being
+stored and notified again. 0 disables the deduplication.
+"""
+CONTACT_MESSAGE_EXPORT_CHUNK_SIZE = getattr(
+    settings, "CONTACT_MESSAGE_EXPORT_CHUNK_SIZE", 2000
+)
+""" integer: number of contact messages fetched from the database at a time
+during an export
+"""
+ADMIN_BADGE_COUNTS_CACHE_TIMEOUT = getattr(
+    settings, "ADMIN_BADGE_COUNTS_CACHE_TIMEOUT", 5
+)
+""" integer: number of seconds the account request and contact message counts
+of the admin menu are cached
+"""
+ADMIN_EVENTS_ENABLED = getattr(settings, "ADMIN_EVENTS_ENABLED", False)
+""" boolean: push the badge counts of the admin pages, and the created and
+deleted account requests and contact messages, as server-sent events.
+Each open admin page holds a worker thread and a database connection while
+its stream is open: only enable it with a threaded or asynchronous server
+(e.g. gunicorn with the gthread or gevent worker class), not with the sync
+workers.
+"""
+ADMIN_EVENTS_HEARTBEAT = getattr(settings, "ADMIN_EVENTS_HEARTBEAT", 15)
+""" integer: number of seconds without event before the admin events stream
+checks the badge counts and sends a keep-alive comment
+"""
+ADMIN_EVENTS_MAX_DURATION = getattr(settings, "ADMIN_EVENTS_MAX_DURATION", 60)
+""" integer: number of seconds before an admin events stream ends and the
+browser opens a new one. Each open stream holds a worker thread.
+"""
+EMAIL_OUTBOX_ENABLED = getattr(settings, "EMAIL_OUTBOX_ENABLED", False)
+""" boolean: store notification emails in the outbox instead of sending them
+during the request. Run the `send_outbound_emails` command to send them.
+"""
+EMAIL_OUTBOX_MAX_ATTEMPTS = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+""" integer: number of attempts before an outbound email is marked as failed
+"""
+EMAIL_OUTBOX_RETRY_DELAY = getattr(settings, "EMAIL_OUTBOX_RETRY_DELAY", 60)
+""" integer: seconds before the first retry, doubled after each failed attempt
+"""
+EMAIL_OUTBOX_BATCH_SIZE = getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 100)
+""" integer: maximum number of outbound emails sent by a worker iteration
+"""
+EMAIL_OUTBOX_WORKERS = getattr(settings, "EMAIL_OUTBOX_WORKERS", 4)
+""" integer: number of threads sending outbound emails in parallel
+"""
+ADMIN_NOTIFICATION_DIGEST_ENABLED = getattr(
+    settings, "ADMIN_NOTIFICATION_DIGEST_ENABLED", False
+)
+""" boolean: notify the website contacts of the new account requests and
+contact messages with one digest email per interval instead of one email per
+item. Run the `send_admin_digest` command to send the digests.
+"""
+ADMIN_NOTIFICATION_DIGEST_INTERVAL = getattr(
+    settings, "ADMIN_NOTIFICATION_DIGEST_INTERVAL", 3600
+)
+""" integer: seconds between two digests sent by `send_admin_digest --loop`
+"""
+ADMIN_NOTIFICATION_DIGEST_BATCH_SIZE = getattr(
+    settings, "ADMIN_NOTIFICATION_DIGEST_BATCH_SIZE", 500
+)
+""" integer: maximum number of items listed in a digest
+"""
+ADMIN_NOTIFICATION_DIGEST_RETRY_DELAY = getattr(
+    settings, "ADMIN_NOTIFICATION_DIGEST_RETRY_DELAY", 300
+)
+""" integer: seconds before the items of a digest that could not be sent are
+listed in a new digest
+"""
+WEB_PAGE_CACHE_ALIAS = getattr(settings, "WEB_PAGE_CACHE_ALIAS", "default")
+""" string: name of the cache, from the CACHES setting, storing the rendered
+help, privacy policy, terms of use and rules of behavior pages. It must be
+shared by all the worker processes (e.g. Redis or Memcached, not the default
+local-memory cache), otherwise a page saved from one process is only seen by
+the others after WEB_PAGE_CACHE_TIMEOUT
+"""
+WEB_PAGE_CACHE_TIMEOUT = getattr(settings, "WEB_PAGE_CACHE_TIMEOUT", 3600)
+""" integer: number of seconds before a cached web page is refreshed
+"""
+WEB_PAGE_CACHE_STALE_TIMEOUT = getattr(
+    settings, "WEB_PAGE_CACHE_STALE_TIMEOUT", 86400
+)
+""" integer: number of seconds a web page is still served after
+WEB_PAGE_CACHE_TIMEOUT, while one process refreshes it
+"""
+WEB_PAGE_CACHE_LOCK_TIMEOUT = getattr(
+    settings, "WEB_PAGE_CACHE_LOCK_TIMEOUT", 10
+)
+""" integer: maximum number of seconds a process waits for another one to
+render a web page missing from the cache
+"""
+WEB_PAGE_LOCAL_CACHE_SIZE = getattr(settings, "WEB_PAGE_LOCAL_CACHE_SIZE", 64)
+""" integer: maximum number of web page versions cached in the memory of each
+process
+"""
+STATIC_EXPORT_DIR = getattr(settings, "STATIC_EXPORT_DIR", None)
+""" string: directory where the `export_static_pages` command writes the
+help, privacy policy, terms of use and rules of behavior pages as HTML files,
+with .gz and .br (if `brotli` is installed) variants
+"""
+STATIC_EXPORT_ON_UPSERT = getattr(settings, "STATIC_EXPORT_ON_UPSERT", False)
+""" boolean: export a page to STATIC_EXPORT_DIR again each time it is saved
+"""
+IDEMPOTENCY_KEY_TIMEOUT = getattr(settings, "IDEMPOTENCY_KEY_TIMEOUT", 86400)
+""" integer: number of seconds the result of a request sent with an
+`Idempotency-Key` header is kept and returned to the retries. The default
+cache must be shared by all the workers.
+"""
+RATE_LIMITS = getattr(
+    settings,
+    "RATE_LIMITS",
+    {
+        "contact": (10, 3600),
+        "account_request": (5, 3600),
+    },
+)
+""" dict: token buckets limiting the submissions of the contact and account
+request forms and REST endpoints, by scope: (capacity, number of seconds to
+refill an empty bucket). Each client IP address and each email address has its
+own bucket. Remove a scope to disable its limit. The default cache must be
+shared by all the workers.
+"""
+RATE_LIMIT_NUM_PROXIES = getattr(settings, "RATE_LIMIT_NUM_PROXIES", 0)
+""" integer: number of reverse proxies in front of the application, used to
+read the client IP address from the X-Forwarded-For header
+"""
+QUERY_STATS_ENABLED = getattr(settings, "QUERY_STATS_ENABLED", False)
+""" boolean: log the number of queries, their duration and the duplicated
+queries of each call to the component APIs and, when
+`core_website_app.middleware.query_stats.QueryStatsMiddleware` is installed,
+of each request
+"""
+QUERY_STATS_HEADERS = getattr(settings, "QUERY_STATS_HEADERS", False)
+""" boolean: add the X-Query-Count, X-Query-Time and X-Query-Duplicates
+headers to the responses, when the query statistics are enabled
+"""
+QUERY_BUDGETS = getattr(
+    settings,
+    "QUERY_BUDGETS",
+    {
+        "core_website_app_account_request": 14,
+        "core_website_app_contact": 6,
+        "core_website_app_help": 3,
+        "core_website_app_privacy": 3,
+        "core_website_app_terms": 3,
+        "core_website_app_rules_of_behavior": 3,
+        "core-admin:core_website_app_user_requests": 3,
+        "core-admin:core_website_app_contact_messages": 3,
+        "core-admin:core_website_app_request_count": 3,
+        "core-admin:core_website_app_message_count": 3,
+        "core-admin:core_website_app_badge_counts": 3,
+        "core-admin:core_website_app_accept_user_request": 9,
+        "core-admin:core_website_app_deny_user_request": 12,
+        "core-admin:core_website_app_bulk_accept_user_requests": 8,
+        "core-admin:core_website_app_bulk_deny_user_requests": 11,
+        "core_website_app_rest_account_request_list": 3,
+        "core_website_app_rest_account_request_detail": 3,
+        "core_website_app_rest_account_request_accept": 9,
+        "core_website_app_rest_account_request_deny": 12,
+        "core_website_app_rest_account_request_bulk_accept": 8,
+        "core_website_app_rest_account_request_bulk_deny": 11,
+        "core_website_app_rest_message_list": 3,
+        "core_website_app_rest_message_detail": 4,
+        "core_website_app_rest_message_export": 3,
+    },
+)
+""" dict: maximum number of queries sent by each view, by view name,
+including the queries loading the session and the user. The query statistics
+middleware logs a warning when a request goes over it
+"""
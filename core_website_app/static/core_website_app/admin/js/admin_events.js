@@ -0,0 +1,37 @@
+/**
+ * Update the badges of the admin menu with the counts pushed by the server,
+ * and forward the created and deleted items to the page as jQuery events.
+ */
+var updateBadgeCounts = function(counts) {
+    $.each(adminBadgeCountUrls, function(urlName, url) {
+        var badge = $("#admin-menu").find("span[id='" + url + "']");
+        badge.text(counts[urlName]);
+        badge.toggleClass("hidden", counts[urlName] === 0);
+    });
+};
+
+var listenAdminEvents = function() {
+    if (typeof(EventSource) === "undefined") return;
+
+    var eventSource = new EventSource(adminEventsUrl);
+    eventSource.addEventListener("counts", function(event) {
+        updateBadgeCounts(JSON.parse(event.data));
+    });
+    $.each([
+        "account_request_created",
+        "account_request_deleted",
+        "contact_message_created",
+        "contact_message_deleted"
+    ], function(index, eventType) {
+        eventSource.addEventListener(eventType, function(event) {
+            $(document).trigger("admin_event:" + eventType, [JSON.parse(event.data)]);
+        });
+    });
+    $(window).on("beforeunload", function() {
+        eventSource.close();
+    });
+};
+
+$(document).ready(function() {
+    listenAdminEvents();
+});
@@ -0,0 +1,5 @@
+var adminEventsUrl = "{% url 'core-admin:core_website_app_admin_events' %}";
+// id of the badge of the admin menu displaying each count
+var adminBadgeCountUrls = {
+    "core-admin:core_website_app_request_count": "{% url 'core-admin:core_website_app_badge_counts' %}"
+};
@@ -6,6 +6,13 @@ let getRequestId = function($btn) {
     return $btn.parent().parent().attr("id");
 };
 let denyRequestIdField = '#deny-request-id';
+// the same action sent twice from this page uses the same idempotency key,
+// so the server only performs it once
+let pageIdempotencyKey = (window.crypto && crypto.randomUUID) ?
+    crypto.randomUUID() : Date.now() + "-" + Math.random();
+let getIdempotencyHeaders = function(action, requestIds) {
+    return {"Idempotency-Key": pageIdempotencyKey + ":" + action + ":" + requestIds};
+};
 
 var acceptRequest = function(event) {
     event.preventDefault();
@@ -15,6 +22,7 @@ var acceptRequest = function(event) {
         url : acceptUserRequestUrl,
         type : "POST",
         dataType: "json",
+        headers: getIdempotencyHeaders("accept", requestId),
         data : {
         	requestid : requestId
         },
@@ -86,6 +94,7 @@ var denyRequestConfirm = function(event, sendEmail) {
         url : denyUserRequestUrl,
         type : "POST",
         dataType: "json",
+        headers: getIdempotencyHeaders("deny", requestId),
         data : {
         	requestid: requestId,
         	sendEmail: sendEmail,
@@ -112,12 +121,103 @@ var denyRequestConfirm = function(event, sendEmail) {
     });
 };
 
+/**
+ * Get the ids of the selected requests
+ */
+var getSelectedRequestIds = function() {
+    return $(".select_request:checked").map(function() {
+        return $(this).val();
+    }).get();
+};
+
+/**
+ * Enable the bulk action buttons only when requests are selected
+ */
+var updateBulkButtons = function() {
+    let selectedCount = getSelectedRequestIds().length;
+    $(".bulk_accept_requests, .bulk_deny_requests").toggleClass("disabled", selectedCount === 0);
+    $("#select-all-requests").prop(
+        "checked", selectedCount > 0 && selectedCount === $(".select_request").length
+    );
+};
+
+var selectAllRequests = function() {
+    $(".select_request").prop("checked", $(this).is(":checked"));
+    updateBulkButtons();
+};
+
+var bulkAcceptRequests = function(event) {
+    event.preventDefault();
+    let requestIds = getSelectedRequestIds();
+    if(requestIds.length === 0) return;
+
+    $.ajax({
+        url : bulkAcceptUserRequestsUrl,
+        type : "POST",
+        dataType: "json",
+        headers: getIdempotencyHeaders("accept", requestIds.join(",")),
+        data : {
+        	requestids : requestIds
+        },
+        success: function(data){
+        	location.reload();
+        },
+        error: function(error) {
+            console.log(error);
+        }
+    });
+};
+
+var bulkDenyRequestsOpenModal = function(event) {
+    event.preventDefault();
+    let requestIds = getSelectedRequestIds();
+    if(requestIds.length === 0) return;
+
+    $("#bulk-deny-count").text(requestIds.length);
+    $('#bulk-deny-requests-modal').modal('show');
+};
+
+    /**
+     * bulkDenyRequestsConfirm send the selected requests to the backend
+     * @param: event {object} MouseClick event
+     * @param: sendEmail {boolean} send the default email
+     */
+var bulkDenyRequestsConfirm = function(event, sendEmail) {
+    event.preventDefault();
+    $(".error-container").hide();
+    let requestIds = getSelectedRequestIds();
+
+    $.ajax({
+        url : bulkDenyUserRequestsUrl,
+        type : "POST",
+        dataType: "json",
+        headers: getIdempotencyHeaders("deny", requestIds.join(",")),
+        data : {
+        	requestids: requestIds,
+        	sendEmail: sendEmail
+        },
+        success: function(){
+        	location.reload();
+        },
+        error: function(error) {
+            $(".error-container").show();
+            $("#bulk-deny-error-text").html("Impossible to deny these account requests, please retry.");
+        }
+    });
+};
+
 // create the listeners and save the initial email template
 $(document).ready(function() {
     $(document).on('click', '.accept_request', acceptRequest);
     $(document).on('click', '.deny_request', denyRequestOpenModal);
     $(document).on('click','#btn-deny-request-email', e=>denyRequestConfirm(e, true));
     $(document).on('click','#btn-deny-request', e=>denyRequestConfirm(e, false));
+    $(document).on('change', '.select_request', updateBulkButtons);
+    $(document).on('change', '#select-all-requests', selectAllRequests);
+    $(document).on('click', '.bulk_accept_requests', bulkAcceptRequests);
+    $(document).on('click', '.bulk_deny_requests', bulkDenyRequestsOpenModal);
+    $(document).on('click','#btn-bulk-deny-requests-email', e=>bulkDenyRequestsConfirm(e, true));
+    $(document).on('click','#btn-bulk-deny-requests', e=>bulkDenyRequestsConfirm(e, false));
 
     // if the custom email field is displayed init the form
     if($("#custom-email-textarea").length > 0) {
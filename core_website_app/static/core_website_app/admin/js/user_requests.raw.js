@@ -1,3 +1,5 @@
 var acceptUserRequestUrl = "{% url 'core-admin:core_website_app_accept_user_request' %}";
 var denyUserRequestUrl = "{% url 'core-admin:core_website_app_deny_user_request' %}";
+var bulkAcceptUserRequestsUrl = "{% url 'core-admin:core_website_app_bulk_accept_user_requests' %}";
+var bulkDenyUserRequestsUrl = "{% url 'core-admin:core_website_app_bulk_deny_user_requests' %}";
 var denyGetEmailTemplateUrl = "{% url 'core-admin:core_website_app_get_deny_email_template' %}";
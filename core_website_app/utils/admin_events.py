@@ -0,0 +1,100 @@
+"""Admin events utils
+
+The account request and contact message signals publish an event when an
+item is created or deleted, with the id and the summary of the item. The
+admin pages receive these events, and the updated badge counts, as
+server-sent events, when ADMIN_EVENTS_ENABLED is set.
+
+Events are delivered to the streams opened in the same process, which send
+them with the new counts right away. The streams also check the cached badge
+counts at each heartbeat, so the counts changed by other processes are sent
+within ADMIN_EVENTS_HEARTBEAT seconds.
+"""
+
+import json
+import time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from core_website_app import settings
+from core_website_app.utils import badge_counts
+from core_website_app.utils.pubsub import broker
+
+ADMIN_EVENTS_CHANNEL = "core_website_app:admin"
+ACCOUNT_REQUEST_CREATED = "account_request_created"
+ACCOUNT_REQUEST_DELETED = "account_request_deleted"
+CONTACT_MESSAGE_CREATED = "contact_message_created"
+CONTACT_MESSAGE_DELETED = "contact_message_deleted"
+COUNTS = "counts"
+RECONNECTION_DELAY = 3000
+
+
+def publish(event_type, data):
+    """Publish an event once the current transaction commits
+
+    Args:
+        event_type: name of the event
+        data: JSON serializable data of the event
+
+    Returns:
+
+    """
+    transaction.on_commit(
+        lambda: broker.publish(ADMIN_EVENTS_CHANNEL, (event_type, data))
+    )
+
+
+def format_event(event_type, data):
+    """Format an event for a server-sent events stream
+
+    Args:
+        event_type: name of the event
+        data: JSON serializable data of the event
+
+    Returns:
+        str
+    """
+    return "event: %s\ndata: %s\n\n" % (
+        event_type,
+        json.dumps(data, cls=DjangoJSONEncoder),
+    )
+
+
+def iter_events(heartbeat=None, max_duration=None):
+    """Stream the admin events, starting with the current badge counts. The
+    badge counts are sent again each time they change.
+
+    Args:
+        heartbeat: number of seconds without event before checking the
+            counts and sending a keep-alive comment
+        max_duration: number of seconds before the stream ends, the client
+            then opens a new one
+
+    Returns:
+        iterator of str
+    """
+    heartbeat = heartbeat or settings.ADMIN_EVENTS_HEARTBEAT
+    deadline = time.monotonic() + (
+        max_duration or settings.ADMIN_EVENTS_MAX_DURATION
+    )
+    # subscribe before reading the counts, so no change is missed
+    with broker.subscribe(ADMIN_EVENTS_CHANNEL) as subscription:
+        yield "retry: %d\n\n" % RECONNECTION_DELAY
+        counts = badge_counts.get_counts()
+        yield format_event(COUNTS, counts)
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            message = subscription.get(timeout=min(heartbeat, remaining))
+            if message is not None:
+                yield format_event(*message)
+
+            new_counts = badge_counts.get_counts()
+            if new_counts != counts:
+                counts = new_counts
+                yield format_event(COUNTS, counts)
+            elif message is None:
+                yield ": keep-alive\n\n"
@@ -0,0 +1,46 @@
+"""Admin menu badge counts utils
+
+The counts displayed in the admin menu are computed together and cached for
+a few seconds, so the admin pages opened at the same time share
+the same queries. The cache is cleared when account requests or contact
+messages are created or deleted.
+"""
+
+from django.core.cache import cache
+
+import core_website_app.components.account_request.api as account_request_api
+import core_website_app.components.contact_message.api as contact_message_api
+from core_website_app import settings
+
+BADGE_COUNTS_CACHE_KEY = "core_website_app:badge_counts"
+ACCOUNT_REQUEST_COUNT_URL_NAME = "core-admin:core_website_app_request_count"
+CONTACT_MESSAGE_COUNT_URL_NAME = "core-admin:core_website_app_message_count"
+
+
+def get_counts():
+    """Get the badge counts of the admin menu
+
+    Returns:
+        dict: count by name of the url serving it alone
+    """
+    counts = cache.get(BADGE_COUNTS_CACHE_KEY)
+    if counts is None:
+        counts = {
+            ACCOUNT_REQUEST_COUNT_URL_NAME: account_request_api.get_count(),
+            CONTACT_MESSAGE_COUNT_URL_NAME: contact_message_api.get_count(),
+        }
+        cache.set(
+            BADGE_COUNTS_CACHE_KEY,
+            counts,
+            settings.ADMIN_BADGE_COUNTS_CACHE_TIMEOUT,
+        )
+    return counts
+
+
+def clear_cache():
+    """Clear the cached badge counts
+
+    Returns:
+
+    """
+    cache.delete(BADGE_COUNTS_CACHE_KEY)
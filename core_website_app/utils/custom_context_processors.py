@@ -1,6 +1,9 @@
 """Custom context processor"""
 
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from core_website_app.utils import web_page_registry
 
 
 def domain_context_processor(request):
@@ -17,4 +20,8 @@ def domain_context_processor(request):
             if hasattr(settings, "DISPLAY_NIST_HEADERS")
             else True
         ),
+        # e.g. {% if WEBSITE_PAGES.help %}, only loaded if used
+        "WEBSITE_PAGES": SimpleLazyObject(
+            lambda: web_page_registry.get_request_pages(request)
+        ),
     }
@@ -0,0 +1,78 @@
+"""Decorators"""
+
+import hashlib
+
+from django.utils.translation import get_language
+from django.views.decorators.http import condition
+
+from core_website_app.utils import web_page_cache
+
+
+def web_page_condition(page_name, get_page=None, representation="html"):
+    """Answer conditional requests on a web page with 304 Not Modified,
+    using an ETag computed from the stored content of the page and the date
+    its HTML was rendered, both read from the web page cache.
+
+    Args:
+        page_name: name of the web page type
+        get_page: function returning the web page, or None. The page is
+            read from the web page registry by default
+        representation: `html` for pages rendered for the current user,
+            `rest` for the REST representation of the page
+
+    Returns:
+        decorator
+    """
+
+    def etag_func(request, *args, **kwargs):
+        """Compute the ETag of the page
+
+        Args:
+            request:
+            args:
+            kwargs:
+
+        Returns:
+
+        """
+        content_hash = (
+            web_page_cache.get_page_entry(page_name, get_page)["content_hash"]
+            or "none"
+        )
+        if representation == "html":
+            # the HTML page also depends on the user and the language
+            user = getattr(request, "user", None)
+            variant = "%s:%s" % (
+                (
+                    str(user.pk)
+                    if user is not None and user.is_authenticated
+                    else "anonymous"
+                ),
+                get_language() or "",
+            )
+        else:
+            # the REST page depends on the negotiated renderer
+            variant = request.META.get("HTTP_ACCEPT", "")
+        return hashlib.sha256(
+            ":".join([representation, content_hash, variant]).encode("utf-8")
+        ).hexdigest()
+
+    def last_modified_func(request, *args, **kwargs):
+        """Get the date the HTML of the page was rendered, None if the page
+        does not exist
+
+        Args:
+            request:
+            args:
+            kwargs:
+
+        Returns:
+
+        """
+        return web_page_cache.get_page_entry(page_name, get_page)[
+            "last_modified"
+        ]
+
+    return condition(
+        etag_func=etag_func, last_modified_func=last_modified_func
+    )
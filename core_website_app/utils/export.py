@@ -0,0 +1,185 @@
+"""Streaming export utils
+
+Rows are serialized and compressed one at a time, so an export uses the same
+amount of memory whatever the number of rows.
+"""
+
+import csv
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+from core_main_app.commons.exceptions import ApiError
+
+CSV = "csv"
+NDJSON = "ndjson"
+
+EXPORT_FORMATS = {
+    CSV: "text/csv",
+    NDJSON: "application/x-ndjson",
+}
+
+GZIP_CONTENT_TYPE = "application/gzip"
+
+# spreadsheets evaluate cells starting with these characters as formulas
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _LineBuffer:
+    """File-like object returning what is written instead of storing it"""
+
+    def write(self, value):
+        """Return the written value
+
+        Args:
+            value:
+
+        Returns:
+
+        """
+        return value
+
+
+def get_export_format(export_format):
+    """Check an export format
+
+    Args:
+        export_format: csv or ndjson
+
+    Returns:
+        export format
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ApiError(
+            "Export format must be one of: %s."
+            % ", ".join(sorted(EXPORT_FORMATS))
+        )
+    return export_format
+
+
+def escape_csv_value(value):
+    """Escape a CSV value that a spreadsheet would evaluate as a formula
+
+    Args:
+        value:
+
+    Returns:
+        value, prefixed with a quote if it starts like a formula
+    """
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_csv(rows, fields):
+    """Serialize rows as CSV lines, starting with the header
+
+    Args:
+        rows: iterable of dict
+        fields: names of the columns
+
+    Returns:
+        iterator of str
+    """
+    writer = csv.DictWriter(
+        _LineBuffer(), fieldnames=fields, extrasaction="ignore"
+    )
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(
+            {field: escape_csv_value(value) for field, value in row.items()}
+        )
+
+
+def iter_ndjson(rows):
+    """Serialize rows as newline delimited JSON
+
+    Args:
+        rows: iterable of dict
+
+    Returns:
+        iterator of str
+    """
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def iter_gzip(chunks):
+    """Compress a stream of bytes with gzip
+
+    Args:
+        chunks: iterable of bytes
+
+    Returns:
+        iterator of bytes
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_export(rows, fields, export_format, compress=False):
+    """Serialize rows in an export format
+
+    Args:
+        rows: iterable of dict
+        fields: names of the columns
+        export_format: csv or ndjson
+        compress: compress the export with gzip
+
+    Returns:
+        iterator of bytes
+    """
+    if get_export_format(export_format) == CSV:
+        lines = iter_csv(rows, fields)
+    else:
+        lines = iter_ndjson(rows)
+    chunks = (line.encode("utf-8") for line in lines)
+    return iter_gzip(chunks) if compress else chunks
+
+
+def get_filename(name, export_format, compress=False):
+    """Get the name of an export file
+
+    Args:
+        name: name of the file, without extension
+        export_format: csv or ndjson
+        compress: the export is compressed with gzip
+
+    Returns:
+        file name
+    """
+    filename = "%s.%s" % (name, export_format)
+    return filename + ".gz" if compress else filename
+
+
+def streaming_export_response(
+    rows, fields, export_format, name, compress=False
+):
+    """Stream rows as an attachment
+
+    Args:
+        rows: iterable of dict
+        fields: names of the columns
+        export_format: csv or ndjson
+        name: name of the file, without extension
+        compress: compress the export with gzip
+
+    Returns:
+        StreamingHttpResponse
+    """
+    response = StreamingHttpResponse(
+        iter_export(rows, fields, export_format, compress=compress),
+        content_type=(
+            GZIP_CONTENT_TYPE if compress else EXPORT_FORMATS[export_format]
+        ),
+    )
+    response["Content-Disposition"] = 'attachment; filename="%s"' % (
+        get_filename(name, export_format, compress=compress)
+    )
+    return response
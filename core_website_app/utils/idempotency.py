@@ -0,0 +1,78 @@
+"""Idempotency key utils
+
+A client sends the same `Idempotency-Key` header when it retries a request.
+The result of the first run is stored in the cache and returned to the
+retries, without running the action again.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+
+from core_main_app.commons.exceptions import ApiError
+from core_website_app import settings
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_CACHE_KEY_PREFIX = "core_website_app:idempotency"
+IDEMPOTENCY_LOCK_TIMEOUT = 60
+
+
+def run_once(request, action):
+    """Run an action once per idempotency key
+
+    Args:
+        request: HTTP request, sending the key in the `Idempotency-Key` header
+        action: function without argument returning a picklable result
+
+    Returns:
+        result of the first run of the action for this key
+    """
+    idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+    if not idempotency_key:
+        return action()
+
+    cache_key = get_cache_key(request, idempotency_key)
+    stored_result = cache.get(cache_key)
+    if stored_result is not None:
+        return stored_result["result"]
+
+    lock_key = cache_key + ":lock"
+    if not cache.add(lock_key, True, IDEMPOTENCY_LOCK_TIMEOUT):
+        raise ApiError(
+            "A request with the same idempotency key is already running."
+        )
+    try:
+        result = action()
+        # results are only stored on success, failed requests can be retried
+        cache.set(
+            cache_key, {"result": result}, settings.IDEMPOTENCY_KEY_TIMEOUT
+        )
+        return result
+    finally:
+        cache.delete(lock_key)
+
+
+def get_cache_key(request, idempotency_key):
+    """Get the cache key of an idempotency key, for the user and the url of
+    the request
+
+    Args:
+        request:
+        idempotency_key:
+
+    Returns:
+
+    """
+    return "%s:%s" % (
+        IDEMPOTENCY_CACHE_KEY_PREFIX,
+        hashlib.sha256(
+            "\n".join(
+                [
+                    str(request.user.id),
+                    request.method,
+                    request.path,
+                    idempotency_key,
+                ]
+            ).encode()
+        ).hexdigest(),
+    )
@@ -0,0 +1,307 @@
+"""Mailing util
+
+Same interface as `core_main_app.utils.notifications.mail`. When the email
+outbox is enabled, emails are rendered and stored in the outbox, to be sent
+later by the `send_outbound_emails` command. Otherwise, they are sent using
+the core mailing util.
+"""
+
+import logging
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template import loader
+
+import core_main_app.utils.notifications.mail as core_send_mail_api
+from core_main_app.settings import (
+    EMAIL_SUBJECT_PREFIX,
+    SEND_EMAIL_ASYNC,
+    SERVER_EMAIL,
+    WEBSITE_CONTACTS,
+)
+from core_main_app.templatetags.stripjs import stripjs
+from core_website_app import settings
+import core_website_app.components.outbound_email.api as outbound_email_api
+
+logger = logging.getLogger("core_website_app.utils.notifications.mail")
+
+
+def send_mail_from_template(
+    recipient_list,
+    subject,
+    path_to_template,
+    context=None,
+    fail_silently=True,
+    sender=SERVER_EMAIL,
+):
+    """Send email.
+
+    Args:
+        recipient_list:
+        subject:
+        path_to_template:
+        context:
+        fail_silently:
+        sender:
+
+    Returns:
+
+    """
+    if not settings.EMAIL_OUTBOX_ENABLED:
+        return core_send_mail_api.send_mail_from_template(
+            recipient_list=recipient_list,
+            subject=subject,
+            path_to_template=path_to_template,
+            context=context,
+            fail_silently=fail_silently,
+            sender=sender,
+        )
+
+    outbound_email_api.enqueue(
+        recipient_list=recipient_list,
+        subject=subject,
+        body=_render(path_to_template, context),
+        sender=sender,
+    )
+
+
+def send_mass_mail(mail_list, fail_silently=True):
+    """Send a list of emails. With the email outbox enabled, all the emails
+    are stored in a single query. Otherwise, they are sent over a single
+    connection to the email backend.
+
+    Args:
+        mail_list: list of dict with recipient_list, subject and either
+            body or path_to_template and context
+        fail_silently:
+
+    Returns:
+        list of the recipients of the emails that could not be sent
+    """
+    if settings.EMAIL_OUTBOX_ENABLED:
+        outbound_email_api.enqueue_all(
+            [
+                {
+                    "recipient_list": mail["recipient_list"],
+                    "subject": mail["subject"],
+                    "body": _render_mail(mail),
+                }
+                for mail in mail_list
+            ]
+        )
+        return []
+
+    if SEND_EMAIL_ASYNC:
+        # the emails are sent one by one by the celery workers
+        for mail in mail_list:
+            core_send_mail_api.send_mail(
+                recipient_list=mail["recipient_list"],
+                subject=mail["subject"],
+                body=_render_mail(mail),
+                fail_silently=fail_silently,
+            )
+        return []
+
+    return send_messages(
+        [
+            _get_message(
+                mail["recipient_list"], mail["subject"], _render_mail(mail)
+            )
+            for mail in mail_list
+        ],
+        fail_silently=fail_silently,
+    )
+
+
+def send_messages(messages, fail_silently=True):
+    """Send a list of emails over a single connection to the email backend
+
+    The emails are sent one at a time, so that an email rejected by the
+    server does not prevent the next ones from being sent. The connection is
+    opened again after an error, in case the server closed it. If it cannot
+    be opened, the remaining emails are not sent.
+
+    Args:
+        messages: list of EmailMessage
+        fail_silently: if False, raise the first error instead of returning
+            the recipients of the emails that could not be sent
+
+    Returns:
+        list of the recipients of the emails that could not be sent
+    """
+    failed_recipients = []
+    connection = get_connection()
+    try:
+        for index, message in enumerate(messages):
+            try:
+                connection.open()
+            except Exception as exception:
+                if not fail_silently:
+                    raise
+                logger.warning(
+                    "Email connection could not be opened: %s", str(exception)
+                )
+                for unsent_message in messages[index:]:
+                    failed_recipients.extend(unsent_message.recipients())
+                break
+            try:
+                connection.send_messages([message])
+            except Exception as exception:
+                if not fail_silently:
+                    raise
+                logger.warning(
+                    "Email to %s could not be sent: %s",
+                    ", ".join(message.recipients()),
+                    str(exception),
+                )
+                failed_recipients.extend(message.recipients())
+                _close(connection)
+    finally:
+        _close(connection)
+    return failed_recipients
+
+
+def send_mail(
+    recipient_list,
+    subject,
+    body,
+    fail_silently=True,
+    sender=SERVER_EMAIL,
+):
+    """Send email.
+
+    Args:
+        recipient_list:
+        subject:
+        body:
+        fail_silently:
+        sender:
+
+    Returns:
+
+    """
+    if not settings.EMAIL_OUTBOX_ENABLED:
+        return core_send_mail_api.send_mail(
+            recipient_list=recipient_list,
+            subject=subject,
+            body=body,
+            fail_silently=fail_silently,
+            sender=sender,
+        )
+
+    outbound_email_api.enqueue(
+        recipient_list=recipient_list,
+        subject=subject,
+        body=stripjs(body),
+        sender=sender,
+    )
+
+
+def send_mail_to_website_contacts(
+    subject, path_to_template, context=None, fail_silently=True
+):
+    """Send a message to the admins contacts, as defined by the
+    WEBSITE_CONTACTS setting.
+
+    Args:
+        subject:
+        path_to_template:
+        context:
+        fail_silently: if False and the outbox is disabled, the email is sent
+            right away and the errors are raised
+
+    Returns:
+
+    """
+    if not WEBSITE_CONTACTS:
+        return
+
+    if not settings.EMAIL_OUTBOX_ENABLED:
+        if not fail_silently:
+            # the core util only logs the errors, or sends the email later
+            # from a celery worker
+            _get_message(
+                [contact[1] for contact in WEBSITE_CONTACTS],
+                subject,
+                _render(path_to_template, context),
+            ).send(fail_silently=False)
+            return
+        return core_send_mail_api.send_mail_to_website_contacts(
+            subject=subject,
+            path_to_template=path_to_template,
+            context=context,
+            fail_silently=fail_silently,
+        )
+
+    outbound_email_api.enqueue(
+        recipient_list=[contact[1] for contact in WEBSITE_CONTACTS],
+        subject=subject,
+        body=_render(path_to_template, context),
+    )
+
+
+def _render(path_to_template, context):
+    """Render an email template
+
+    Args:
+        path_to_template:
+        context:
+
+    Returns:
+
+    """
+    template = loader.get_template(path_to_template)
+    return template.render(context if context is not None else {})
+
+
+def _render_mail(mail):
+    """Render the body of an email of `send_mass_mail`
+
+    Args:
+        mail: dict with either body or path_to_template and context
+
+    Returns:
+
+    """
+    if "body" in mail:
+        return stripjs(mail["body"])
+    return _render(mail["path_to_template"], mail.get("context"))
+
+
+def _get_message(recipient_list, subject, body, sender=SERVER_EMAIL):
+    """Build an HTML email
+
+    Args:
+        recipient_list:
+        subject:
+        body:
+        sender:
+
+    Returns:
+        EmailMultiAlternatives
+    """
+    message = EmailMultiAlternatives(
+        subject=EMAIL_SUBJECT_PREFIX + subject,
+        body="",
+        from_email=sender,
+        to=recipient_list,
+    )
+    message.attach_alternative(body, "text/html")
+    return message
+
+
+def _close(connection):
+    """Close a connection to the email backend, ignoring the errors of a
+    connection already closed by the server
+
+    Args:
+        connection:
+
+    Returns:
+
+    """
+    try:
+        connection.close()
+    except Exception as exception:
+        logger.warning(
+            "Email connection could not be closed: %s", str(exception)
+        )
@@ -0,0 +1,139 @@
+"""Keyset pagination utils"""
+
+from core_main_app.commons.exceptions import ApiError
+
+
+class KeysetPage:
+    """Page of results built from an id cursor"""
+
+    def __init__(self, items, next_cursor=None, previous_cursor=None):
+        """Initialize the page
+
+        Args:
+            items: list of objects in the page
+            next_cursor: id to pass as `after` to get the next page
+            previous_cursor: id to pass as `before` to get the previous page
+        """
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        """Iterate over the items of the page
+
+        Returns:
+
+        """
+        return iter(self.items)
+
+    def __len__(self):
+        """Number of items in the page
+
+        Returns:
+
+        """
+        return len(self.items)
+
+    @property
+    def has_next(self):
+        """Check if a next page exists
+
+        Returns:
+
+        """
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        """Check if a previous page exists
+
+        Returns:
+
+        """
+        return self.previous_cursor is not None
+
+
+def get_cursor(value):
+    """Convert a cursor given by the client to an id
+
+    Args:
+        value: cursor value (None, str or int)
+
+    Returns:
+        int or None
+    """
+    if value is None or value == "":
+        return None
+    try:
+        cursor = int(value)
+    except (TypeError, ValueError):
+        raise ApiError("Invalid cursor: %s." % str(value))
+    if cursor < 0:
+        raise ApiError("Invalid cursor: %s." % str(value))
+    return cursor
+
+
+def get_page_size(value, default_page_size, max_page_size):
+    """Convert a page size given by the client to a bounded integer
+
+    Args:
+        value: page size (None, str or int)
+        default_page_size: page size used when none is given
+        max_page_size: upper limit of the page size
+
+    Returns:
+        int
+    """
+    if value is None or value == "":
+        return min(default_page_size, max_page_size)
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        raise ApiError("Invalid page size: %s." % str(value))
+    if page_size < 1:
+        raise ApiError("Invalid page size: %s." % str(value))
+    return min(page_size, max_page_size)
+
+
+def paginate_by_id(queryset, page_size, after=None, before=None):
+    """Get a page of a queryset, newest ids first, using the id as cursor.
+
+    The query only reads page_size + 1 rows from the primary key index,
+    whatever the position of the page in the table.
+
+    Args:
+        queryset: queryset to paginate
+        page_size: number of items in the page
+        after: return items with an id lower than this cursor
+        before: return items with an id greater than this cursor
+
+    Returns:
+        KeysetPage
+    """
+    if after is not None and before is not None:
+        raise ApiError("Only one of after and before cursors can be set.")
+
+    if before is not None:
+        # Walk back towards the newest items, then restore the page order
+        items = list(
+            queryset.filter(id__gt=before).order_by("id")[: page_size + 1]
+        )
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        items.reverse()
+        return KeysetPage(
+            items,
+            next_cursor=items[-1].id if items else before + 1,
+            previous_cursor=items[0].id if has_more else None,
+        )
+
+    if after is not None:
+        queryset = queryset.filter(id__lt=after)
+    items = list(queryset.order_by("-id")[: page_size + 1])
+    has_more = len(items) > page_size
+    items = items[:page_size]
+    return KeysetPage(
+        items,
+        next_cursor=items[-1].id if has_more else None,
+        previous_cursor=(items[0].id if items and after is not None else None),
+    )
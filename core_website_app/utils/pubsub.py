@@ -0,0 +1,139 @@
+"""In-process publish/subscribe utils
+
+Messages published on a channel are delivered to the subscriptions of the
+channel opened in the same process. Each subscription has its own bounded
+queue: when a subscriber is too slow, new messages are dropped for it.
+"""
+
+import queue
+import threading
+from collections import defaultdict
+
+
+class Subscription:
+    """Subscription to a channel of a broker"""
+
+    def __init__(self, broker, channel, max_size):
+        """Initialize the subscription
+
+        Args:
+            broker: broker of the channel
+            channel: name of the channel
+            max_size: maximum number of messages waiting in the queue
+        """
+        self.broker = broker
+        self.channel = channel
+        self.queue = queue.Queue(maxsize=max_size)
+
+    def put(self, message):
+        """Add a message to the queue, drop it if the queue is full
+
+        Args:
+            message:
+
+        Returns:
+            True if the message was added
+        """
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except queue.Full:
+            return False
+
+    def get(self, timeout=None):
+        """Wait for the next message
+
+        Args:
+            timeout: number of seconds to wait, wait forever if None
+
+        Returns:
+            message, None if no message was published before the timeout
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """Stop receiving messages
+
+        Returns:
+
+        """
+        self.broker.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class Broker:
+    """Deliver the messages published on a channel to its subscriptions"""
+
+    def __init__(self):
+        """Initialize the broker"""
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, channel, max_size=100):
+        """Open a subscription to a channel
+
+        Args:
+            channel: name of the channel
+            max_size: maximum number of messages waiting for the subscriber
+
+        Returns:
+            Subscription
+        """
+        subscription = Subscription(self, channel, max_size)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Close a subscription
+
+        Args:
+            subscription:
+
+        Returns:
+
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.channel]
+
+    def publish(self, channel, message):
+        """Publish a message on a channel
+
+        Args:
+            channel: name of the channel
+            message:
+
+        Returns:
+            number of subscriptions the message was delivered to
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        return sum(subscription.put(message) for subscription in subscriptions)
+
+    def get_subscription_count(self, channel):
+        """Count the subscriptions of a channel
+
+        Args:
+            channel: name of the channel
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
+
+
+broker = Broker()
@@ -0,0 +1,136 @@
+"""Query statistics utils
+
+Count the queries sent to the database while a block of code runs, with
+their total duration and the number of duplicated queries.
+"""
+
+import contextlib
+import functools
+import inspect
+import logging
+import time
+from collections import Counter
+
+from django.db import connections
+
+logger = logging.getLogger("core_website_app.utils.query_stats")
+
+
+class QueryStats:
+    """Statistics of the queries sent to the database"""
+
+    def __init__(self):
+        """Initialize the statistics"""
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        """Execute a query and record it, see `connection.execute_wrapper`
+
+        Args:
+            execute:
+            sql:
+            params:
+            many:
+            context:
+
+        Returns:
+
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.statements[(sql, repr(params))] += 1
+
+    @property
+    def duplicates(self):
+        """Number of queries sent again with the same parameters
+
+        Returns:
+
+        """
+        return sum(count - 1 for count in self.statements.values())
+
+    @property
+    def duration_ms(self):
+        """Total duration of the queries, in milliseconds
+
+        Returns:
+
+        """
+        return self.duration * 1000
+
+    def __str__(self):
+        """Statistics as string
+
+        Returns:
+
+        """
+        return "%d queries, %.2f ms, %d duplicates" % (
+            self.count,
+            self.duration_ms,
+            self.duplicates,
+        )
+
+
+@contextlib.contextmanager
+def track_queries():
+    """Record the queries sent to the databases in the block
+
+    Returns:
+        QueryStats
+    """
+    stats = QueryStats()
+    with contextlib.ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        yield stats
+
+
+def instrument(func, name=None):
+    """Log the query statistics of each call of a function
+
+    Args:
+        func: function to instrument
+        name: name of the function in the logs
+
+    Returns:
+
+    """
+    name = name or "%s.%s" % (func.__module__, func.__qualname__)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with track_queries() as stats:
+            result = func(*args, **kwargs)
+        logger.debug("%s: %s", name, str(stats))
+        return result
+
+    wrapper.query_stats_instrumented = True
+    return wrapper
+
+
+def instrument_module(module):
+    """Instrument the public functions defined in a module
+
+    Callers using the module attributes, such as `account_request_api.get`,
+    call the instrumented functions.
+
+    Args:
+        module:
+
+    Returns:
+
+    """
+    for name, func in inspect.getmembers(module, inspect.isfunction):
+        if (
+            name.startswith("_")
+            or func.__module__ != module.__name__
+            or getattr(func, "query_stats_instrumented", False)
+        ):
+            continue
+        setattr(module, name, instrument(func))
@@ -0,0 +1,118 @@
+"""Rate limit utils
+
+Each client IP address and each email address get a token bucket per scope,
+stored in the cache. A submission takes a token from the buckets of its
+address and email, and is rejected at the first empty one. The buckets
+are refilled continuously, up to their capacity.
+"""
+
+import hashlib
+import math
+import time
+
+from django.core.cache import cache
+
+from core_website_app import settings
+
+RATE_LIMIT_CACHE_KEY_PREFIX = "core_website_app:rate_limit"
+CONTACT_SCOPE = "contact"
+ACCOUNT_REQUEST_SCOPE = "account_request"
+
+
+def get_wait_time(request, scope, email=None):
+    """Take a token for a submission, from the buckets of the client IP
+    address and of the email
+
+    Args:
+        request: HTTP request
+        scope: name of the limit in the RATE_LIMITS setting
+        email: email address sent with the submission
+
+    Returns:
+        0 if the submission is allowed, otherwise the number of seconds to
+        wait before the next one
+    """
+    if scope not in settings.RATE_LIMITS:
+        return 0
+    capacity, period = settings.RATE_LIMITS[scope]
+
+    identities = ["ip:%s" % get_client_ip(request)]
+    if email:
+        identities.append("email:%s" % email.strip().lower())
+    # stop at the first empty bucket, a rejected submission does not take
+    # tokens from the other buckets
+    for identity in identities:
+        wait_time = take_token(
+            get_cache_key(scope, identity), capacity, period
+        )
+        if wait_time:
+            return wait_time
+    return 0
+
+
+def take_token(cache_key, capacity, period):
+    """Take a token from a bucket
+
+    Concurrent requests may read the same state and both take the last
+    token: the limit is approximate, but no lock is needed.
+
+    Args:
+        cache_key: key of the bucket in the cache
+        capacity: maximum number of tokens in the bucket
+        period: number of seconds to refill an empty bucket
+
+    Returns:
+        0 if a token was taken, otherwise the number of seconds before a
+        token is available
+    """
+    now = time.time()
+    refill_rate = capacity / period
+    tokens, updated = cache.get(cache_key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated) * refill_rate)
+
+    wait_time = 0
+    if tokens >= 1:
+        tokens -= 1
+    else:
+        wait_time = (1 - tokens) / refill_rate
+    # the bucket is full again, and can be forgotten, after this timeout
+    cache.set(
+        cache_key,
+        (tokens, now),
+        math.ceil((capacity - tokens) / refill_rate) or 1,
+    )
+    return wait_time
+
+
+def get_client_ip(request):
+    """Get the IP address of the client, behind RATE_LIMIT_NUM_PROXIES
+    reverse proxies
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        IP address
+    """
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if forwarded_for and settings.RATE_LIMIT_NUM_PROXIES > 0:
+        addresses = [address.strip() for address in forwarded_for.split(",")]
+        return addresses[-min(settings.RATE_LIMIT_NUM_PROXIES, len(addresses))]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def get_cache_key(scope, identity):
+    """Get the cache key of the bucket of a client for a scope
+
+    Args:
+        scope:
+        identity: ip address or email of the client
+
+    Returns:
+        cache key
+    """
+    return "%s:%s:%s" % (
+        RATE_LIMIT_CACHE_KEY_PREFIX,
+        scope,
+        hashlib.sha256(identity.encode("utf-8")).hexdigest(),
+    )
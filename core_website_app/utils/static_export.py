@@ -0,0 +1,189 @@
+"""Static export of the website pages
+
+The help, privacy policy, terms of use and rules of behavior pages are
+rendered for an anonymous user and written as HTML files, with gzip and
+brotli variants, so a web server can serve them without calling Django, e.g.
+with NGINX `gzip_static` and `brotli_static`.
+
+The brotli variants are only written if the `brotli` package is installed.
+"""
+
+import gzip
+import logging
+import os
+import tempfile
+from urllib.parse import urlparse
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest
+from django.urls import resolve, reverse
+
+from core_website_app import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger("core_website_app.utils.static_export")
+
+# name of the web page type: (url name of the page, name of the file)
+STATIC_PAGES = {
+    "help": ("core_website_app_help", "help.html"),
+    "privacy_policy": ("core_website_app_privacy", "privacy-policy.html"),
+    "terms_of_use": ("core_website_app_terms", "terms-of-use.html"),
+    "rules_of_behavior": (
+        "core_website_app_rules_of_behavior",
+        "rules_of_behavior.html",
+    ),
+}
+
+
+def export_pages(output_dir, page_names=None):
+    """Render the website pages and write them to a directory
+
+    The files of a page that is not served by the website anymore are
+    deleted.
+
+    Args:
+        output_dir: path of the directory
+        page_names: names of the pages to export, all the pages by default
+
+    Returns:
+        list of the paths of the written files
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for page_name in page_names or STATIC_PAGES:
+        url_name, file_name = STATIC_PAGES[page_name]
+        content = render_page(url_name)
+        if content is None:
+            logger.warning(
+                "Static export of %s skipped: the page is not served by "
+                "the website.",
+                page_name,
+            )
+            # the web server must not serve a previous export of the page
+            delete_page(output_dir, file_name)
+            continue
+        paths.extend(write_page(output_dir, file_name, content))
+    return paths
+
+
+def export_page_on_commit(page_name):
+    """Export a page again after it is saved, if STATIC_EXPORT_ON_UPSERT is
+    enabled. Errors are logged, they do not fail the save.
+
+    Args:
+        page_name: name of the web page type
+
+    Returns:
+
+    """
+    if not settings.STATIC_EXPORT_ON_UPSERT or not settings.STATIC_EXPORT_DIR:
+        return
+    try:
+        export_pages(settings.STATIC_EXPORT_DIR, [page_name])
+    except Exception as exception:
+        logger.error(
+            "Static export of %s failed: %s", page_name, str(exception)
+        )
+
+
+def render_page(url_name):
+    """Render a page for an anonymous user
+
+    Args:
+        url_name: name of the url of the page
+
+    Returns:
+        HTML as bytes, None if the page is not rendered by the website
+    """
+    path = reverse(url_name)
+    response = resolve(path).func(_get_request(path))
+    if response.status_code != 200:
+        return None
+    return response.content
+
+
+def write_page(output_dir, file_name, content):
+    """Write a page and its compressed variants
+
+    Each file is written to a temporary file first and then renamed, so the
+    web server never serves a partially written page.
+
+    Args:
+        output_dir: path of the directory
+        file_name: name of the HTML file
+        content: HTML as bytes
+
+    Returns:
+        list of the paths of the written files
+    """
+    variants = [
+        (file_name, content),
+        (file_name + ".gz", gzip.compress(content, mtime=0)),
+    ]
+    if brotli is not None:
+        variants.append((file_name + ".br", brotli.compress(content)))
+
+    paths = []
+    for variant_name, variant_content in variants:
+        path = os.path.join(output_dir, variant_name)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=output_dir, prefix=".%s." % variant_name
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(variant_content)
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, path)
+        except Exception:
+            os.unlink(temporary_path)
+            raise
+        paths.append(path)
+    return paths
+
+
+def delete_page(output_dir, file_name):
+    """Delete a page and its compressed variants, if they were written
+
+    Args:
+        output_dir: path of the directory
+        file_name: name of the HTML file
+
+    Returns:
+        list of the paths of the deleted files
+    """
+    paths = []
+    for variant_name in (file_name, file_name + ".gz", file_name + ".br"):
+        path = os.path.join(output_dir, variant_name)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            continue
+        paths.append(path)
+    return paths
+
+
+def _get_request(path):
+    """Build a GET request of an anonymous user on the SERVER_URI host
+
+    Args:
+        path:
+
+    Returns:
+        HttpRequest
+    """
+    server_uri = urlparse(settings.SERVER_URI)
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = path
+    request.META = {
+        "SERVER_NAME": server_uri.hostname or "localhost",
+        "SERVER_PORT": str(
+            server_uri.port or (443 if server_uri.scheme == "https" else 80)
+        ),
+    }
+    request.user = AnonymousUser()
+    return request
@@ -0,0 +1,369 @@
+"""Cache of the rendered website pages
+
+The HTML of a web page is rendered from its markdown when the page is saved,
+and stored in the database (see `core_website_app.components.web_page`). The
+cache holds the stored HTML by page, so a cached page is served without any
+query.
+
+The pages are cached in two tiers: a bounded LRU cache in the memory of each
+process, in front of the WEB_PAGE_CACHE_ALIAS cache shared by the processes.
+Each page has a version, stored in the shared cache and part of the keys of
+its entries. Saving or deleting a web page changes the version of the page,
+and again once the transaction commits, so all the processes stop using the
+entries of the previous version.
+
+An entry older than WEB_PAGE_CACHE_TIMEOUT is stale: one process refreshes
+it from the database while the others keep serving the stale entry, so a
+page changed without changing its version (e.g. updated without signals) is
+eventually served. When a page is not cached at all, one process builds the
+entry while the others wait for it, so the processes do not all load the
+page at the same time.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import partial
+
+from django.core.cache import caches
+from django.db import transaction
+
+import core_main_app.components.web_page.api as core_web_page_api
+
+from core_website_app import settings
+from core_website_app.components.web_page import api as web_page_api
+from core_website_app.components.web_page.models import RenderedWebPage
+from core_website_app.utils import web_page_registry
+
+CACHE_KEY_PREFIX = "core_website_app:web_page"
+# seconds between two checks of the shared cache while waiting for an entry
+LOCK_POLL_INTERVAL = 0.05
+
+
+class LocalCache:
+    """Thread-safe LRU cache, bounded to a maximum number of entries"""
+
+    def __init__(self, max_size):
+        """Initialize the cache
+
+        Args:
+            max_size: maximum number of entries
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get an entry, and mark it as the most recently used
+
+        Args:
+            key:
+
+        Returns:
+            entry, None if it is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """Add an entry, removing the least recently used entries if the
+        cache is full
+
+        Args:
+            key:
+            entry:
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all the entries
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        """Number of entries
+
+        Returns:
+
+        """
+        return len(self._entries)
+
+
+local_cache = LocalCache(settings.WEB_PAGE_LOCAL_CACHE_SIZE)
+
+
+def get_rendered_page(page_name, get_page=None):
+    """Get a web page with its content rendered as HTML
+
+    Args:
+        page_name: name of the web page type
+        get_page: function returning the web page, or None. The page is
+            read from the web page registry by default
+
+    Returns:
+        dict with the rendered `content`, its markdown `content_hash` and
+        the `last_modified` rendering date, None if the page does not exist
+    """
+    entry = get_page_entry(page_name, get_page)
+    return entry if entry["content_hash"] is not None else None
+
+
+def get_page_entry(page_name, get_page=None):
+    """Get the cache entry of a web page, rendering it if needed
+
+    Args:
+        page_name: name of the web page type
+        get_page: function returning the web page, or None. The page is
+            read from the web page registry by default
+
+    Returns:
+        dict with the rendered `content`, its markdown `content_hash` and
+        the `last_modified` rendering date (all None if the page does not
+        exist)
+    """
+    cache = _get_cache()
+    entry_key = _get_entry_key(page_name, _get_version(cache, page_name))
+
+    entry = local_cache.get(entry_key)
+    if entry is not None and not _is_stale(entry):
+        return entry
+
+    # another process may have refreshed the entry
+    shared_entry = cache.get(entry_key)
+    if shared_entry is not None:
+        entry = shared_entry
+        local_cache.set(entry_key, entry)
+    if entry is not None and not _is_stale(entry):
+        return entry
+
+    if entry is not None:
+        # only one process refreshes a stale entry, the others serve it
+        if _acquire_lock(cache, entry_key):
+            try:
+                entry = _build_entry(
+                    cache, entry_key, page_name, get_page, previous=entry
+                )
+            finally:
+                _release_lock(cache, entry_key)
+        return entry
+
+    if _acquire_lock(cache, entry_key):
+        try:
+            return _build_entry(cache, entry_key, page_name, get_page)
+        finally:
+            _release_lock(cache, entry_key)
+
+    # wait for the process building the entry
+    deadline = time.monotonic() + settings.WEB_PAGE_CACHE_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        entry = cache.get(entry_key)
+        if entry is not None:
+            local_cache.set(entry_key, entry)
+            return entry
+    return _build_entry(cache, entry_key, page_name, get_page)
+
+
+def invalidate(page_name):
+    """Change the version of a web page, so all the processes render it again
+
+    The version changes again once the current transaction commits, in case
+    another process cached the page before the change was visible.
+
+    Args:
+        page_name: name of the web page type
+
+    Returns:
+
+    """
+    _set_new_version(page_name)
+    transaction.on_commit(partial(_set_new_version, page_name))
+
+
+def get_content_hash(content):
+    """Get the hash of the content of a web page
+
+    Args:
+        content: markdown content
+
+    Returns:
+        hexadecimal sha256 of the content
+    """
+    return RenderedWebPage.get_content_hash(content)
+
+
+def _build_entry(cache, entry_key, page_name, get_page, previous=None):
+    """Build the cache entry of a web page, and store it in both caches
+
+    Args:
+        cache: shared cache
+        entry_key: key of the entry
+        page_name: name of the web page type
+        get_page: function returning the web page, or None
+        previous: stale entry of the page, if any
+
+    Returns:
+        cache entry of the page
+    """
+    if get_page is not None:
+        web_page = get_page()
+    elif previous is not None:
+        # the snapshot of the registry only changes with the version
+        web_page = core_web_page_api.get(page_name)
+    else:
+        web_page = web_page_registry.get_page(page_name)
+    entry = _render_page(web_page)
+    cache.set(
+        entry_key,
+        entry,
+        settings.WEB_PAGE_CACHE_TIMEOUT
+        + settings.WEB_PAGE_CACHE_STALE_TIMEOUT,
+    )
+    local_cache.set(entry_key, entry)
+    return entry
+
+
+def _render_page(web_page):
+    """Build the cache entry of a web page from its stored HTML
+
+    Args:
+        web_page: web page, or None
+
+    Returns:
+        cache entry of the page
+    """
+    content_hash = None
+    content = None
+    last_modified = None
+    if web_page is not None:
+        rendered_web_page = web_page_api.get_rendered(web_page)
+        content_hash = rendered_web_page.content_hash
+        content = rendered_web_page.html
+        # the date the stored HTML was rendered, the same in all processes
+        last_modified = rendered_web_page.rendering_date.replace(microsecond=0)
+    return {
+        "content": content,
+        "content_hash": content_hash,
+        "last_modified": last_modified,
+        "expires": time.time() + settings.WEB_PAGE_CACHE_TIMEOUT,
+    }
+
+
+def _is_stale(entry):
+    """Check if a cache entry must be refreshed
+
+    Args:
+        entry:
+
+    Returns:
+        boolean
+    """
+    return entry["expires"] <= time.time()
+
+
+def _set_new_version(page_name):
+    """Set a new version of a web page
+
+    Args:
+        page_name: name of the web page type
+
+    Returns:
+
+    """
+    _get_cache().set(_get_version_key(page_name), uuid.uuid4().hex, None)
+
+
+def _get_version(cache, page_name):
+    """Get the current version of a web page, creating it if needed
+
+    Args:
+        cache: shared cache
+        page_name: name of the web page type
+
+    Returns:
+        str
+    """
+    version_key = _get_version_key(page_name)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, None)
+        # a new version each time if the cache does not store anything
+        version = cache.get(version_key) or uuid.uuid4().hex
+    return version
+
+
+def _acquire_lock(cache, entry_key):
+    """Try to become the process building an entry
+
+    Args:
+        cache: shared cache
+        entry_key: key of the entry
+
+    Returns:
+        True if the lock was acquired
+    """
+    return cache.add(
+        "%s:lock" % entry_key, True, settings.WEB_PAGE_CACHE_LOCK_TIMEOUT
+    )
+
+
+def _release_lock(cache, entry_key):
+    """Release the lock on an entry
+
+    Args:
+        cache: shared cache
+        entry_key: key of the entry
+
+    Returns:
+
+    """
+    cache.delete("%s:lock" % entry_key)
+
+
+def _get_entry_key(page_name, version):
+    """Get the cache key of a version of a web page
+
+    Args:
+        page_name: name of the web page type
+        version: version of the page
+
+    Returns:
+
+    """
+    return "%s:%s:%s" % (CACHE_KEY_PREFIX, page_name, version)
+
+
+def _get_version_key(page_name):
+    """Get the cache key of the version of a web page
+
+    Args:
+        page_name: name of the web page type
+
+    Returns:
+
+    """
+    return "%s:%s:version" % (CACHE_KEY_PREFIX, page_name)
+
+
+def _get_cache():
+    """Get the cache storing the web pages
+
+    Returns:
+
+    """
+    return caches[settings.WEB_PAGE_CACHE_ALIAS]
@@ -0,0 +1,181 @@
+"""Registry of the website pages
+
+All the web pages of the WEB_PAGE_TYPES are loaded in one query, with their
+rendered HTML, into a snapshot kept in the memory of the process. The version
+of the snapshot is stored in the WEB_PAGE_CACHE_ALIAS cache: saving or
+deleting a web page changes the version, and every process loads a new
+snapshot the next time it reads a page. The processes only see the new
+version if this cache is shared by all of them. A snapshot is also loaded
+again after WEB_PAGE_CACHE_TIMEOUT, so the pages are eventually up to date
+otherwise.
+
+The pages of the snapshot are shared by all the threads of the process, and
+must not be modified. Use the web page APIs to get a page to update.
+"""
+
+import threading
+import time
+import uuid
+
+from django.core.cache import caches
+
+from core_main_app.components.web_page.models import WebPage
+from core_website_app import settings
+from core_website_app.commons.enums import WEB_PAGE_TYPES
+
+VERSION_CACHE_KEY = "core_website_app:web_page_registry:version"
+
+_lock = threading.Lock()
+# (version, loading time, {page name: web page})
+_snapshot = (None, 0, {})
+
+
+def get_page(page_name):
+    """Get a web page from the snapshot
+
+    Args:
+        page_name: name of the web page type
+
+    Returns:
+        web page, None if it does not exist
+    """
+    return get_snapshot().get(page_name)
+
+
+def exists(page_name):
+    """Check if a web page exists
+
+    Args:
+        page_name: name of the web page type
+
+    Returns:
+        boolean
+    """
+    return page_name in get_snapshot()
+
+
+def get_existing_pages():
+    """Get the existence of all the web pages, to check in templates
+
+    Returns:
+        dict of page name: boolean
+    """
+    snapshot = get_snapshot()
+    return {page_name: page_name in snapshot for page_name in WEB_PAGE_TYPES}
+
+
+def get_request_pages(request):
+    """Get the existence of all the web pages, read once per request
+
+    Args:
+        request:
+
+    Returns:
+        dict of page name: boolean
+    """
+    if not hasattr(request, "website_pages"):
+        request.website_pages = get_existing_pages()
+    return request.website_pages
+
+
+def get_snapshot():
+    """Get the snapshot of the web pages, loading it again if a web page
+    changed since it was loaded, or if it is older than
+    WEB_PAGE_CACHE_TIMEOUT
+
+    Returns:
+        dict of page name: web page, for the existing pages
+    """
+    version = _get_version()
+    if _is_current(_snapshot, version):
+        return _snapshot[2]
+    with _lock:
+        pages = _snapshot[2]
+        if not _is_current(_snapshot, version):
+            pages = _load()
+            _set_snapshot(version, pages)
+    return pages
+
+
+def invalidate():
+    """Change the version of the snapshot, so all the processes load it again
+
+    Returns:
+
+    """
+    _get_cache().set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    _set_snapshot(None, {})
+
+
+def _is_current(snapshot, version):
+    """Check if a snapshot can still be used
+
+    Args:
+        snapshot:
+        version: current version of the snapshot
+
+    Returns:
+        boolean
+    """
+    snapshot_version, loading_time, _ = snapshot
+    return (
+        snapshot_version == version
+        and time.monotonic() - loading_time < settings.WEB_PAGE_CACHE_TIMEOUT
+    )
+
+
+def _load():
+    """Load all the web pages in one query
+
+    Returns:
+        dict of page name: web page
+    """
+    page_names = {
+        page_type: page_name for page_name, page_type in WEB_PAGE_TYPES.items()
+    }
+    pages = {}
+    for web_page in (
+        WebPage.objects.filter(type__in=page_names)
+        .select_related("rendered")
+        .order_by("id")
+    ):
+        pages.setdefault(page_names[web_page.type], web_page)
+    return pages
+
+
+def _get_version():
+    """Get the current version of the snapshot, creating it if needed
+
+    Returns:
+        str
+    """
+    cache = _get_cache()
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        # a new version each time if the cache does not store anything
+        version = cache.get(VERSION_CACHE_KEY) or uuid.uuid4().hex
+    return version
+
+
+def _set_snapshot(version, pages):
+    """Replace the snapshot of the process
+
+    Args:
+        version:
+        pages:
+
+    Returns:
+
+    """
+    global _snapshot  # pylint: disable=global-statement
+    _snapshot = (version, time.monotonic(), pages)
+
+
+def _get_cache():
+    """Get the cache storing the version of the snapshot
+
+    Returns:
+
+    """
+    return caches[settings.WEB_PAGE_CACHE_ALIAS]
@@ -4,8 +4,14 @@ Ajax views for the admin part
 
 import json
 
+from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
-from django.http import HttpResponse, HttpResponseBadRequest
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
 from django.template import loader
 from django.views.decorators.http import require_http_methods
 
@@ -15,7 +21,9 @@ from core_main_app.commons import exceptions as main_exceptions
 from core_main_app.templatetags.stripjs import stripjs
 import core_website_app.components.account_request.api as account_request_api
 import core_website_app.components.contact_message.api as contact_message_api
+from core_website_app import settings
 from core_website_app.commons import exceptions
+from core_website_app.utils import admin_events, badge_counts, idempotency
 from core_website_app.settings import (
     SERVER_URI,
     SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_DENIED,
@@ -31,8 +39,12 @@ def accept_request(request):
     """
     try:
         request_id = request.POST["requestid"]
-        account_request_from_api = account_request_api.get(request_id)
-        account_request_api.accept(account_request_from_api)
+        idempotency.run_once(
+            request,
+            lambda: account_request_api.accept(
+                account_request_api.get(request_id)
+            ),
+        )
         message = "Request Accepted"
     except main_exceptions.ApiError as error:
         raise exceptions.WebsiteAjaxError(str(error))
@@ -78,9 +90,11 @@ def deny_request(request):
         elif not request_id:
             raise ("Wrong parameters.")
 
-        account_request_from_api = account_request_api.get(request_id)
-        account_request_api.deny(
-            account_request_from_api, send_email, email_params
+        idempotency.run_once(
+            request,
+            lambda: account_request_api.deny(
+                account_request_api.get(request_id), send_email, email_params
+            ),
         )
         message = "Request denied"
 
@@ -96,6 +110,84 @@ def deny_request(request):
     )
 
 
+@staff_member_required
+@require_http_methods(["POST"])
+def bulk_accept_requests(request):
+    """
+    Accepts a list of requests and activates the user accounts
+    :param request:
+    :return:
+    """
+    try:
+        count, failed_recipients = idempotency.run_once(
+            request,
+            lambda: account_request_api.accept_all(
+                request.POST.getlist("requestids[]")
+            ),
+        )
+        message = "%d request(s) accepted" % count
+        _add_failed_recipients_message(request, failed_recipients)
+    except main_exceptions.ApiError as error:
+        raise exceptions.WebsiteAjaxError(str(error))
+    except Exception as exception:
+        raise exceptions.WebsiteAjaxError(str(exception))
+
+    return HttpResponse(
+        json.dumps({"message": message}), content_type="application/json"
+    )
+
+
+@staff_member_required
+@require_http_methods(["POST"])
+def bulk_deny_requests(request):
+    """
+    Denies a list of account requests, the default email is sent to each user
+    :param request:
+    :return:
+    """
+    try:
+        send_email = (
+            request.POST.get("sendEmail") == "true"
+            and SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_DENIED
+        )
+        count, failed_recipients = idempotency.run_once(
+            request,
+            lambda: account_request_api.deny_all(
+                request.POST.getlist("requestids[]"), send_email
+            ),
+        )
+        message = "%d request(s) denied" % count
+        _add_failed_recipients_message(request, failed_recipients)
+    except main_exceptions.ApiError as error:
+        raise exceptions.WebsiteAjaxError(str(error))
+    except Exception as exception:
+        raise exceptions.WebsiteAjaxError(str(exception))
+
+    return HttpResponse(
+        json.dumps({"message": message}), content_type="application/json"
+    )
+
+
+def _add_failed_recipients_message(request, failed_recipients):
+    """Report the emails that could not be sent, on the page reloaded after
+    a bulk action
+
+    Args:
+        request:
+        failed_recipients:
+
+    Returns:
+
+    """
+    if failed_recipients:
+        messages.add_message(
+            request,
+            messages.WARNING,
+            "The email could not be sent to: %s"
+            % ", ".join(failed_recipients),
+        )
+
+
 @staff_member_required
 def remove_message(request):
     """
@@ -156,7 +248,13 @@ def get_deny_email_template(request):
 def account_request_count(request):
     """Account request count"""
     return HttpResponse(
-        json.dumps({"count": account_request_api.get_count()}),
+        json.dumps(
+            {
+                "count": badge_counts.get_counts()[
+                    badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME
+                ]
+            }
+        ),
         content_type="application/json",
     )
 
@@ -166,6 +264,45 @@ def account_request_count(request):
 def contact_message_count(request):
     """Contact message count"""
     return HttpResponse(
-        json.dumps({"count": contact_message_api.get_count()}),
+        json.dumps(
+            {
+                "count": badge_counts.get_counts()[
+                    badge_counts.CONTACT_MESSAGE_COUNT_URL_NAME
+                ]
+            }
+        ),
+        content_type="application/json",
+    )
+
+
+@staff_member_required
+@require_http_methods(["GET", "POST"])
+def badge_counts_view(request):
+    """Badge of the admin menu: the account request count, with all the
+    badge counts"""
+    counts = badge_counts.get_counts()
+    return HttpResponse(
+        json.dumps(
+            {
+                "count": counts[badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME],
+                "counts": counts,
+            }
+        ),
         content_type="application/json",
     )
+
+
+@staff_member_required
+@require_http_methods(["GET"])
+def admin_events_stream(request):
+    """Server-sent events stream of the badge counts and of the created and
+    deleted items, if ADMIN_EVENTS_ENABLED is set"""
+    if not settings.ADMIN_EVENTS_ENABLED:
+        raise Http404("Admin events are disabled.")
+    response = StreamingHttpResponse(
+        admin_events.iter_events(), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # disable the buffering of nginx
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -1,12 +1,18 @@
 """Admin views"""
 
+from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
+from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 
 import core_website_app.components.account_request.api as account_request_api
 import core_website_app.components.contact_message.api as contact_message_api
+from core_main_app.commons.exceptions import ApiError
 from core_main_app.utils.rendering import admin_render
-from core_website_app.components.account_request import api as website_api
+from core_main_app.views.admin.views import WebPageView
+from core_website_app.components.web_page import api as web_page_api
+from core_website_app import settings
 from core_website_app.settings import (
     EMAIL_DENY_SUBJECT,
     SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_DENIED,
@@ -23,7 +29,7 @@ def user_requests(request):
     Returns:
     """
     # Call the API
-    requests = account_request_api.get_all()
+    requests = account_request_api.get_all_with_user_id()
 
     assets = {
         "js": [
@@ -31,11 +37,17 @@ def user_requests(request):
                 "path": "core_website_app/admin/js/user_requests.js",
                 "is_raw": False,
             },
-        ],
+            {
+                "path": "core_website_app/admin/js/user_requests.raw.js",
+                "is_raw": True,
+            },
+        ]
+        + _get_admin_events_js(),
     }
 
     modals = [
         "core_website_app/admin/account_requests/modals/deny_request.html",
+        "core_website_app/admin/account_requests/modals/bulk_deny_requests.html",
     ]
 
     return admin_render(
@@ -61,13 +73,28 @@ def contact_messages(request):
     Returns:
     """
 
+    query = request.GET.get("q", "").strip()
+
     # Call the API
-    messages_contact = contact_message_api.get_all()
+    try:
+        messages_contact = contact_message_api.get_page(
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            query=query,
+        )
+    except ApiError:
+        # invalid cursor: go back to the first page
+        messages_contact = contact_message_api.get_page(query=query)
 
     assets = {
         "js": [
             {"path": "core_website_app/admin/js/messages.js", "is_raw": False},
-        ],
+            {
+                "path": "core_website_app/admin/js/messages.raw.js",
+                "is_raw": True,
+            },
+        ]
+        + _get_admin_events_js(),
         "css": ["core_website_app/admin/css/messages.css"],
     }
 
@@ -80,15 +107,61 @@ def contact_messages(request):
         "core_website_app/admin/contact_messages.html",
         assets=assets,
         modals=modals,
-        context={"contacts": messages_contact},
+        context={"contacts": messages_contact, "query": query},
     )
 
 
+class WebsitePageView(WebPageView):
+    """Web Page View of the website pages, reporting when a submitted
+    content is identical to the saved one"""
+
+    @method_decorator(staff_member_required)
+    def post(self, request):
+        """POST request. Save the page with the core view, unless its content
+        did not change.
+
+        Args:
+            request:
+
+        Returns:
+
+        """
+        page = self.api.get()
+        if page is not None and web_page_api.has_content(
+            page, request.POST.get("content", "")
+        ):
+            messages.add_message(request, messages.INFO, "No changes to save.")
+            return redirect(reverse(self.post_redirect))
+
+        return super().post(request)
+
+
+def _get_admin_events_js():
+    """Get the scripts updating the badge counts with the admin events, if
+    they are enabled
+
+    Returns:
+        list of js assets
+    """
+    if not settings.ADMIN_EVENTS_ENABLED:
+        return []
+    return [
+        {
+            "path": "core_website_app/admin/js/admin_events.js",
+            "is_raw": False,
+        },
+        {
+            "path": "core_website_app/admin/js/admin_events.raw.js",
+            "is_raw": True,
+        },
+    ]
+
+
 def _build_requests_context(request_list):
     """Build context from list of requests
 
     Args:
-        request_list:
+        request_list: requests annotated with the id of their user
 
     Returns:
 
@@ -101,13 +174,10 @@ def _build_requests_context(request_list):
             "last_name": request_item.last_name,
             "email": request_item.email,
             "date": request_item.date,
-            "edit_url": reverse(
-                "admin:auth_user_change",
-                args=[
-                    website_api._get_user_by_username(
-                        request_item.username
-                    ).id,
-                ],
+            "edit_url": (
+                reverse("admin:auth_user_change", args=[request_item.user_id])
+                if request_item.user_id is not None
+                else None
             ),
         }
         for request_item in request_list
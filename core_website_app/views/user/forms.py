@@ -4,11 +4,6 @@ from captcha.fields import CaptchaField
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
-
-from core_website_app.components.account_request import (
-    api as account_request_api,
-)
 
 
 class RequestAccountForm(UserCreationForm):
@@ -41,21 +36,6 @@ class RequestAccountForm(UserCreationForm):
             "password2",
         )
 
-    def clean_email(self):
-        """Check email field
-
-        Returns:
-
-        """
-        email = self.cleaned_data["email"]
-        try:
-            # Check if user with same email already exists
-            account_request_api._get_user_by_email(email)
-            # Raise validation error if found
-            raise ValidationError("A user with that email already exists.")
-        except ObjectDoesNotExist:
-            return email
-
 
 class ContactForm(forms.Form):
     """
@@ -1,5 +1,7 @@
 """Views available for the user"""
 
+from http import HTTPStatus
+
 from django.contrib import messages
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
@@ -10,7 +12,6 @@ from django.template.loader import get_template
 from django.urls import reverse
 
 from core_main_app.commons.exceptions import ApiError
-from core_main_app.utils.markdown_parser import parse
 from core_main_app.utils.rendering import render
 import core_website_app.components.account_request.api as account_request_api
 import core_website_app.components.contact_message.api as contact_message_api
@@ -23,6 +24,8 @@ import core_website_app.components.terms_of_use.api as terms_of_use_api
 
 from core_website_app.components.contact_message.models import ContactMessage
 from core_website_app.settings import DISPLAY_NIST_HEADERS
+from core_website_app.utils import rate_limit, web_page_cache
+from core_website_app.utils.decorators import web_page_condition
 from .forms import RequestAccountForm, ContactForm
 
 
@@ -45,6 +48,27 @@ def request_new_account(request):
     }
 
     if request.method == "POST":
+        # Check the limit before validating and hashing the password
+        if rate_limit.get_wait_time(
+            request,
+            rate_limit.ACCOUNT_REQUEST_SCOPE,
+            email=request.POST.get("email"),
+        ):
+            response = render(
+                request,
+                "core_website_app/user/request_new_account.html",
+                assets=assets,
+                context={
+                    "request_form": RequestAccountForm(
+                        initial=request.POST.dict()
+                    ),
+                    "action_result": _get_too_many_requests_box(),
+                    "page_title": "Account Request",
+                },
+            )
+            response.status_code = HTTPStatus.TOO_MANY_REQUESTS
+            return response
+
         request_form = RequestAccountForm(request.POST)
         if request_form.is_valid():
             # Call the API
@@ -138,6 +162,21 @@ def contact(request):
     """
 
     if request.method == "POST":
+        if rate_limit.get_wait_time(
+            request, rate_limit.CONTACT_SCOPE, email=request.POST.get("email")
+        ):
+            response = render(
+                request,
+                "core_website_app/user/contact.html",
+                context={
+                    "contact_form": ContactForm(initial=request.POST.dict()),
+                    "action_result": _get_too_many_requests_box(),
+                    "page_title": "Contact",
+                },
+            )
+            response.status_code = HTTPStatus.TOO_MANY_REQUESTS
+            return response
+
         contact_form = ContactForm(request.POST)
         if contact_form.is_valid():
             # Call the API
@@ -164,6 +203,7 @@ def contact(request):
     )
 
 
+@web_page_condition(help_api.HELP_PAGE_NAME)
 def help_page(request):
     """Page that provides FAQ
 
@@ -173,9 +213,9 @@ def help_page(request):
     Returns:
     """
     # Call the API
-    help_page_object = help_api.get()
-    if help_page_object is not None:
-        help_page_object.content = parse(help_page_object.content)
+    help_page_object = web_page_cache.get_rendered_page(
+        help_api.HELP_PAGE_NAME
+    )
 
     return render(
         request,
@@ -195,10 +235,22 @@ def privacy_policy(request):
     if DISPLAY_NIST_HEADERS:
         return HttpResponseRedirect("https://www.nist.gov/privacy-policy")
 
+    return _privacy_policy_page(request)
+
+
+@web_page_condition(privacy_policy_api.PRIVACY_PAGE_NAME)
+def _privacy_policy_page(request):
+    """Page that provides the privacy policy stored in the database
+
+    Parameters:
+        request:
+
+    Returns: Http response
+    """
     # Call the API
-    policy = privacy_policy_api.get()
-    if policy is not None:
-        policy.content = parse(policy.content)
+    policy = web_page_cache.get_rendered_page(
+        privacy_policy_api.PRIVACY_PAGE_NAME
+    )
 
     return render(
         request,
@@ -207,6 +259,7 @@ def privacy_policy(request):
     )
 
 
+@web_page_condition(terms_of_use_api.TERMS_PAGE_NAME)
 def terms_of_use(request):
     """Page that provides terms of use
 
@@ -216,9 +269,7 @@ def terms_of_use(request):
     Returns: Http Response
     """
     # Call the API
-    terms = terms_of_use_api.get()
-    if terms is not None:
-        terms.content = parse(terms.content)
+    terms = web_page_cache.get_rendered_page(terms_of_use_api.TERMS_PAGE_NAME)
 
     return render(
         request,
@@ -227,6 +278,7 @@ def terms_of_use(request):
     )
 
 
+@web_page_condition(rules_of_behavior_api.RULES_OF_BEHAVIOR_PAGE_NAME)
 def rules_of_behavior(request):
     """Page that provides the rules of behavior
 
@@ -236,11 +288,9 @@ def rules_of_behavior(request):
     Returns: Http Response
     """
     # Call the API
-    rules_of_behavior_object = rules_of_behavior_api.get()
-    if rules_of_behavior_object is not None:
-        rules_of_behavior_object.content = parse(
-            rules_of_behavior_object.content
-        )
+    rules_of_behavior_object = web_page_cache.get_rendered_page(
+        rules_of_behavior_api.RULES_OF_BEHAVIOR_PAGE_NAME
+    )
 
     return render(
         request,
@@ -250,3 +300,18 @@ def rules_of_behavior(request):
             "page_title": "Rules of Behavior",
         },
     )
+
+
+def _get_too_many_requests_box():
+    """Render the error displayed when a form is submitted too many times
+
+    Returns:
+        HTML error box
+    """
+    error_template = get_template("core_website_app/user/request_error.html")
+    return error_template.render(
+        {
+            "error_message": "Too many submissions were sent, "
+            "please try again later."
+        }
+    )
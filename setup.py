@@ -48,7 +48,7 @@ setup(
     author="NIST IT Lab",
     author_email="itl_inquiries@nist.gov",
     url="https://github.com/usnistgov/core_website_app",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests*", "benchmarks*"]),
     include_package_data=True,
     install_requires=required,
     dependency_links=dep_links,
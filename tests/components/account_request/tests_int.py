@@ -0,0 +1,349 @@
+"""Integration tests of the account request API"""
+
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+
+from core_main_app.commons.exceptions import ApiError
+from core_website_app import settings
+from core_website_app.components.account_request import (
+    api as account_request_api,
+)
+from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.components.outbound_email.models import OutboundEmail
+from tests.utils.notifications.mail.tests_int import REJECTING_EMAIL_BACKEND
+
+
+class TestAccountRequestGetAllWithUserId(TestCase):
+    """Test Account Request Get All With User Id"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.users = [
+            User.objects.create(username="user%d" % index, is_active=False)
+            for index in range(3)
+        ]
+        for user in self.users:
+            AccountRequest.objects.create(
+                username=user.username, email="%s@test.com" % user.username
+            )
+        AccountRequest.objects.create(username="no_user", email="no@test.com")
+
+    def test_get_all_with_user_id_returns_user_ids(self):
+        """test_get_all_with_user_id_returns_user_ids"""
+
+        # Act
+        result = {
+            account_request.username: account_request.user_id
+            for account_request in account_request_api.get_all_with_user_id()
+        }
+
+        # Assert
+        for user in self.users:
+            self.assertEqual(result[user.username], user.id)
+        self.assertIsNone(result["no_user"])
+
+    def test_get_all_with_user_id_runs_a_single_query(self):
+        """test_get_all_with_user_id_runs_a_single_query"""
+
+        # Act # Assert
+        with self.assertNumQueries(1):
+            list(account_request_api.get_all_with_user_id())
+
+
+class TestAccountRequestUniqueFields(TestCase):
+    """Test Account Request Unique Fields"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.account_request = AccountRequest.objects.create(
+            username="user", email="user@test.com"
+        )
+
+    def test_username_is_unique(self):
+        """test_username_is_unique"""
+
+        # Act # Assert
+        with self.assertRaises(IntegrityError):
+            AccountRequest.objects.create(
+                username="user", email="other@test.com"
+            )
+
+    def test_email_is_unique(self):
+        """test_email_is_unique"""
+
+        # Act # Assert
+        with self.assertRaises(IntegrityError):
+            AccountRequest.objects.create(
+                username="other", email="user@test.com"
+            )
+
+
+class TestAccountRequestInsert(TestCase):
+    """Test Account Request Insert"""
+
+    def setUp(self):
+        """setUp"""
+
+        User.objects.create(username="user", email="user@test.com")
+        AccountRequest.objects.create(
+            username="pending", email="pending@test.com"
+        )
+
+    def test_get_conflicts_runs_a_single_query(self):
+        """test_get_conflicts_runs_a_single_query"""
+
+        # Act # Assert
+        with self.assertNumQueries(1):
+            conflicts = AccountRequest.get_conflicts(
+                "pending", "user@test.com"
+            )
+        self.assertEqual(
+            sorted(conflicts),
+            [
+                ("request", "pending", "pending@test.com"),
+                ("user", "user", "user@test.com"),
+            ],
+        )
+
+    def test_insert_with_existing_email_raises_api_error(self):
+        """test_insert_with_existing_email_raises_api_error"""
+
+        # Act # Assert
+        with self.assertRaisesRegex(ApiError, "same email"):
+            account_request_api.insert(
+                User(username="new", email="user@test.com", is_active=False)
+            )
+        self.assertFalse(User.objects.filter(username="new").exists())
+
+    def test_insert_with_pending_request_raises_api_error(self):
+        """test_insert_with_pending_request_raises_api_error"""
+
+        # Act # Assert
+        with self.assertRaisesRegex(ApiError, "request with the same"):
+            account_request_api.insert(
+                User(username="pending", email="new@test.com", is_active=False)
+            )
+        self.assertFalse(User.objects.filter(username="pending").exists())
+
+    def test_insert_saves_user_and_request(self):
+        """test_insert_saves_user_and_request"""
+
+        # Act
+        account_request_api.insert(
+            User(username="new", email="new@test.com", is_active=False)
+        )
+
+        # Assert
+        self.assertTrue(User.objects.filter(username="new").exists())
+        self.assertTrue(AccountRequest.objects.filter(username="new").exists())
+
+    @patch.object(AccountRequest, "get_conflicts")
+    def test_insert_concurrent_duplicate_raises_api_error(
+        self, mock_get_conflicts
+    ):
+        """test_insert_concurrent_duplicate_raises_api_error"""
+
+        # Arrange
+        # the check ran before another request saved the same username
+        mock_get_conflicts.return_value = []
+
+        # Act # Assert
+        with self.assertRaises(ApiError):
+            account_request_api.insert(
+                User(username="user", email="new@test.com", is_active=False)
+            )
+        self.assertEqual(User.objects.filter(username="user").count(), 1)
+
+    @patch.object(AccountRequest, "get_conflicts")
+    def test_insert_concurrent_duplicate_email_raises_api_error(
+        self, mock_get_conflicts
+    ):
+        """test_insert_concurrent_duplicate_email_raises_api_error"""
+
+        # Arrange
+        # the check ran before another request saved the same email
+        mock_get_conflicts.side_effect = [
+            [],
+            [("request", "pending", "pending@test.com")],
+        ]
+
+        # Act # Assert
+        with self.assertRaisesRegex(ApiError, "request with the same email"):
+            account_request_api.insert(
+                User(username="new", email="pending@test.com", is_active=False)
+            )
+        self.assertFalse(User.objects.filter(username="new").exists())
+
+
+class TestAccountRequestAcceptDenyOnce(TestCase):
+    """Test Account Request Accept and Deny process a request once"""
+
+    def setUp(self):
+        """setUp"""
+
+        User.objects.create(username="user", is_active=False)
+        self.account_request = AccountRequest.objects.create(
+            username="user", email="user@test.com"
+        )
+
+    @override_settings(SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED=True)
+    def test_accept_twice_raises_api_error_and_sends_one_email(self):
+        """test_accept_twice_raises_api_error_and_sends_one_email"""
+
+        # Arrange
+        stale_account_request = AccountRequest.objects.get(
+            pk=self.account_request.pk
+        )
+        account_request_api.accept(self.account_request)
+
+        # Act # Assert
+        with self.assertRaisesRegex(ApiError, "already been processed"):
+            account_request_api.accept(stale_account_request)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_deny_after_accept_raises_api_error_and_keeps_user(self):
+        """test_deny_after_accept_raises_api_error_and_keeps_user"""
+
+        # Arrange
+        stale_account_request = AccountRequest.objects.get(
+            pk=self.account_request.pk
+        )
+        account_request_api.accept(self.account_request)
+
+        # Act # Assert
+        with self.assertRaisesRegex(ApiError, "already been processed"):
+            account_request_api.deny(stale_account_request)
+        self.assertTrue(User.objects.get(username="user").is_active)
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class TestAccountRequestBulkActions(TestCase):
+    """Test Account Request Accept All and Deny All"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.account_requests = []
+        for index in range(5):
+            User.objects.create(username="user%d" % index, is_active=False)
+            self.account_requests.append(
+                AccountRequest.objects.create(
+                    username="user%d" % index,
+                    first_name="first",
+                    last_name="last",
+                    email="user%d@test.com" % index,
+                )
+            )
+        self.ids = [
+            account_request.id for account_request in self.account_requests
+        ]
+
+    @override_settings(SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED=False)
+    def test_accept_all_activates_users_and_deletes_requests(self):
+        """test_accept_all_activates_users_and_deletes_requests"""
+
+        # Act
+        count, _ = account_request_api.accept_all(self.ids)
+
+        # Assert
+        self.assertEqual(count, 5)
+        self.assertFalse(User.objects.filter(is_active=False).exists())
+        self.assertFalse(AccountRequest.objects.exists())
+
+    @override_settings(SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED=False)
+    def test_accept_all_runs_a_fixed_number_of_queries(self):
+        """test_accept_all_runs_a_fixed_number_of_queries"""
+
+        # Act # Assert
+        # select requests, select users, update users, select and delete
+        # requests for the delete signals, and the savepoint of the
+        # transaction
+        with self.assertNumQueries(7):
+            account_request_api.accept_all(self.ids)
+
+    @override_settings(SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED=False)
+    def test_accept_all_with_missing_user_changes_nothing(self):
+        """test_accept_all_with_missing_user_changes_nothing"""
+
+        # Arrange
+        User.objects.filter(username="user0").delete()
+
+        # Act # Assert
+        with self.assertRaises(ApiError):
+            account_request_api.accept_all(self.ids)
+        self.assertEqual(User.objects.filter(is_active=False).count(), 4)
+        self.assertEqual(AccountRequest.objects.count(), 5)
+
+    def test_accept_all_with_unknown_id_changes_nothing(self):
+        """test_accept_all_with_unknown_id_changes_nothing"""
+
+        # Act # Assert
+        with self.assertRaises(ApiError):
+            account_request_api.accept_all(self.ids + [max(self.ids) + 1])
+        self.assertEqual(AccountRequest.objects.count(), 5)
+
+    @override_settings(SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED=True)
+    @patch.object(settings, "EMAIL_OUTBOX_ENABLED", True)
+    def test_accept_all_queues_one_email_per_request(self):
+        """test_accept_all_queues_one_email_per_request"""
+
+        # Act
+        account_request_api.accept_all(self.ids)
+
+        # Assert
+        self.assertEqual(OutboundEmail.objects.count(), 5)
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(
+        SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED=True,
+        EMAIL_BACKEND=REJECTING_EMAIL_BACKEND,
+    )
+    def test_accept_all_returns_failed_recipients(self):
+        """test_accept_all_returns_failed_recipients"""
+
+        # Arrange
+        AccountRequest.objects.filter(id=self.ids[0]).update(
+            email="rejected@test.com"
+        )
+
+        # Act
+        count, failed_recipients = account_request_api.accept_all(self.ids)
+
+        # Assert
+        self.assertEqual(count, 5)
+        self.assertEqual(failed_recipients, ["rejected@test.com"])
+        self.assertEqual(len(mail.outbox), 4)
+
+    def test_deny_all_deletes_users_and_requests(self):
+        """test_deny_all_deletes_users_and_requests"""
+
+        # Act
+        count, _ = account_request_api.deny_all(self.ids, send_email=False)
+
+        # Assert
+        self.assertEqual(count, 5)
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(AccountRequest.objects.exists())
+
+    @patch.object(settings, "EMAIL_OUTBOX_ENABLED", True)
+    def test_deny_all_queues_custom_email(self):
+        """test_deny_all_queues_custom_email"""
+
+        # Act
+        account_request_api.deny_all(
+            self.ids,
+            email_params={"subject": "Denied", "body": "<p>Sorry</p>"},
+        )
+
+        # Assert
+        self.assertEqual(
+            set(OutboundEmail.objects.values_list("subject", "body")),
+            {("Denied", "<p>Sorry</p>")},
+        )
+        self.assertEqual(OutboundEmail.objects.count(), 5)
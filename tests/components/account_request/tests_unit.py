@@ -55,6 +55,13 @@ class TestsAccountRequestAccept(TestCase):
         """setUp"""
 
         self.account_request = _create_account_request()
+        patcher = patch.object(
+            AccountRequest,
+            "get_by_id_for_update",
+            return_value=self.account_request,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     @patch(
         "core_website_app.components.account_request.models"
@@ -115,6 +122,13 @@ class TestsAccountRequestDeny(TestCase):
         """setUp"""
 
         self.account_request = _create_account_request()
+        patcher = patch.object(
+            AccountRequest,
+            "get_by_id_for_update",
+            return_value=self.account_request,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     @patch(
         "core_website_app.components.account_request.models."
@@ -209,78 +223,86 @@ class TestsAccountRequestInsert(TestCase):
         """setUp"""
 
         self.mock_account_request = _create_account_request()
+        self.mock_user = Mock(spec=User)
+        self.mock_user.username = "username"
+        self.mock_user.email = "user@test.com"
 
     @patch(
-        "core_website_app.components.account_request.api"
-        "._get_user_by_username"
+        "core_website_app.components.account_request.models"
+        ".AccountRequest.get_conflicts"
     )
     def test_account_request_insert_raise_api_error_if_username_already_exist(
-        self, mock_get_user_by_username
+        self, mock_get_conflicts
     ):
         """test_account_request_insert_raise_api_error
         _if_username_already_exist"""
 
         # Arrange
-        mock_user = Mock(spec=User)
-        mock_user.username = "username"
-        mock_get_user_by_username.return_value = mock_user
+        mock_get_conflicts.return_value = [
+            ("user", "username", "other@test.com")
+        ]
 
         # Act # Assert
-        with self.assertRaises(ApiError):
-            account_request_api.insert(mock_user)
+        with self.assertRaisesRegex(ApiError, "user with the same username"):
+            account_request_api.insert(self.mock_user)
+        self.mock_user.save.assert_not_called()
 
     @patch(
         "core_website_app.components.account_request.models"
-        ".AccountRequest.save"
-    )
-    @patch(
-        "core_website_app.components.account_request.api"
-        "._get_user_by_username"
-    )
-    @patch(
-        "core_website_app.components.account_request.api" "._get_user_by_email"
+        ".AccountRequest.get_conflicts"
     )
     def test_account_request_raises_error_if_email_already_exists(
-        self, mock_get_user_by_email, mock_get_user_by_username, mock_save
+        self, mock_get_conflicts
     ):
-        """test_account_request_insert_return_request"""
+        """test_account_request_raises_error_if_email_already_exists"""
 
         # Arrange
-        mock_user = Mock(spec=User)
-        mock_user.username = "username"
-        mock_get_user_by_username.side_effect = ObjectDoesNotExist()
-        mock_get_user_by_email.return_value = mock_user
-        mock_save.return_value = self.mock_account_request
+        mock_get_conflicts.return_value = [("user", "other", "user@test.com")]
 
         # Act # Assert
-        with self.assertRaises(ApiError):
-            account_request_api.insert(mock_user)
+        with self.assertRaisesRegex(ApiError, "user with the same email"):
+            account_request_api.insert(self.mock_user)
+        self.mock_user.save.assert_not_called()
 
     @patch(
         "core_website_app.components.account_request.models"
-        ".AccountRequest.save"
+        ".AccountRequest.get_conflicts"
     )
+    def test_account_request_insert_raise_api_error_if_request_already_exist(
+        self, mock_get_conflicts
+    ):
+        """test_account_request_insert_raise_api_error
+        _if_request_already_exist"""
+
+        # Arrange
+        mock_get_conflicts.return_value = [
+            ("request", "username", "other@test.com")
+        ]
+
+        # Act # Assert
+        with self.assertRaisesRegex(ApiError, "request with the same"):
+            account_request_api.insert(self.mock_user)
+        self.mock_user.save.assert_not_called()
+
     @patch(
-        "core_website_app.components.account_request.api"
-        "._get_user_by_username"
+        "core_website_app.components.account_request.models"
+        ".AccountRequest.save"
     )
     @patch(
-        "core_website_app.components.account_request.api" "._get_user_by_email"
+        "core_website_app.components.account_request.models"
+        ".AccountRequest.get_conflicts"
     )
     def test_account_request_insert_return_request(
-        self, mock_get_user_by_email, mock_get_user_by_username, mock_save
+        self, mock_get_conflicts, mock_save
     ):
         """test_account_request_insert_return_request"""
 
         # Arrange
-        mock_user = Mock(spec=User)
-        mock_user.username = "username"
-        mock_get_user_by_username.side_effect = ObjectDoesNotExist()
-        mock_get_user_by_email.side_effect = ObjectDoesNotExist()
+        mock_get_conflicts.return_value = []
         mock_save.return_value = self.mock_account_request
 
         # Act
-        result = account_request_api.insert(mock_user)
+        result = account_request_api.insert(self.mock_user)
 
         # Assert
         self.assertIsInstance(result, AccountRequest)
@@ -0,0 +1,223 @@
+"""Integration tests of the admin notification API"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import core_website_app.components.account_request.api as account_request_api
+import core_website_app.components.admin_notification.api as admin_notification_api
+import core_website_app.components.contact_message.api as contact_message_api
+from core_website_app import settings
+from core_website_app.components.admin_notification.models import (
+    AdminNotification,
+)
+from core_website_app.components.contact_message.models import ContactMessage
+from core_website_app.components.outbound_email.models import OutboundEmail
+
+LOCMEM_EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+# nothing listens on port 1: the connection is refused
+UNREACHABLE_SMTP_SETTINGS = {
+    "EMAIL_BACKEND": "django.core.mail.backends.smtp.EmailBackend",
+    "EMAIL_HOST": "127.0.0.1",
+    "EMAIL_PORT": 1,
+    "EMAIL_TIMEOUT": 1,
+}
+
+
+@patch.object(settings, "ADMIN_NOTIFICATION_DIGEST_ENABLED", True)
+class TestNotifyWithDigest(TestCase):
+    """Test Notify With Digest"""
+
+    def test_contact_message_upsert_queues_notification(self):
+        """test_contact_message_upsert_queues_notification"""
+
+        # Act
+        contact_message_api.upsert(
+            ContactMessage(name="name", email="a@test.com", content="message")
+        )
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 0)
+        notification = AdminNotification.objects.get()
+        self.assertEqual(
+            notification.kind, AdminNotification.KIND_CONTACT_MESSAGE
+        )
+        self.assertEqual(notification.item["content"], "message")
+
+    def test_account_request_insert_queues_notification(self):
+        """test_account_request_insert_queues_notification"""
+
+        # Act
+        account_request_api.insert(
+            User(username="user", first_name="f", last_name="l", email="u@t")
+        )
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 0)
+        notification = AdminNotification.objects.get()
+        self.assertEqual(
+            notification.kind, AdminNotification.KIND_ACCOUNT_REQUEST
+        )
+        self.assertEqual(notification.item["username"], "user")
+
+
+class TestNotifyWithoutDigest(TestCase):
+    """Test Notify Without Digest"""
+
+    def test_notify_sends_email_right_away(self):
+        """test_notify_sends_email_right_away"""
+
+        # Act
+        admin_notification_api.notify(
+            AdminNotification.KIND_CONTACT_MESSAGE,
+            {"name": "name", "email": "a@test.com", "content": "message"},
+        )
+
+        # Assert
+        self.assertEqual(AdminNotification.objects.count(), 0)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("A new message", mail.outbox[0].body)
+
+
+class TestSendDigest(TestCase):
+    """Test Send Digest"""
+
+    def setUp(self):
+        """setUp"""
+        for index in range(3):
+            AdminNotification.objects.create(
+                kind=AdminNotification.KIND_CONTACT_MESSAGE,
+                item={
+                    "name": "name%d" % index,
+                    "email": "a@test.com",
+                    "content": "message %d" % index,
+                },
+            )
+        AdminNotification.objects.create(
+            kind=AdminNotification.KIND_ACCOUNT_REQUEST,
+            item={
+                "username": "user",
+                "first_name": "first",
+                "last_name": "last",
+                "email": "u@test.com",
+            },
+        )
+
+    def test_send_digest_sends_one_email_per_kind(self):
+        """test_send_digest_sends_one_email_per_kind"""
+
+        # Act
+        item_count = admin_notification_api.send_digest()
+
+        # Assert
+        self.assertEqual(item_count, 4)
+        self.assertEqual(len(mail.outbox), 2)
+        subjects = sorted(email.subject for email in mail.outbox)
+        self.assertEqual(
+            subjects,
+            [
+                "[Django] New Account Requests (1)",
+                "[Django] New Contact Messages (3)",
+            ],
+        )
+
+    def test_send_digest_lists_items(self):
+        """test_send_digest_lists_items"""
+
+        # Act
+        admin_notification_api.send_digest()
+
+        # Assert
+        body = next(
+            email.alternatives[0][0]
+            for email in mail.outbox
+            if "Messages" in email.subject
+        )
+        self.assertIn("3 new messages", body)
+        for index in range(3):
+            self.assertIn("message %d" % index, body)
+
+    def test_send_digest_deletes_sent_notifications(self):
+        """test_send_digest_deletes_sent_notifications"""
+
+        # Act
+        admin_notification_api.send_digest()
+
+        # Assert
+        self.assertEqual(AdminNotification.objects.count(), 0)
+        self.assertEqual(admin_notification_api.send_digest(), 0)
+
+    def test_send_digest_respects_batch_size(self):
+        """test_send_digest_respects_batch_size"""
+
+        # Act
+        item_count = admin_notification_api.send_digest(batch_size=2)
+
+        # Assert
+        self.assertEqual(item_count, 2)
+        self.assertEqual(AdminNotification.objects.count(), 2)
+
+    @override_settings(**UNREACHABLE_SMTP_SETTINGS)
+    def test_send_digest_keeps_notifications_when_sending_fails(self):
+        """test_send_digest_keeps_notifications_when_sending_fails"""
+
+        # Act
+        with self.assertRaises(OSError):
+            admin_notification_api.send_digest()
+
+        # Assert
+        self.assertEqual(AdminNotification.objects.count(), 4)
+
+    @override_settings(**UNREACHABLE_SMTP_SETTINGS)
+    def test_send_digest_retries_notifications_after_delay(self):
+        """test_send_digest_retries_notifications_after_delay"""
+
+        # Arrange
+        with self.assertRaises(OSError):
+            admin_notification_api.send_digest()
+
+        # Act
+        with override_settings(EMAIL_BACKEND=LOCMEM_EMAIL_BACKEND):
+            postponed_count = admin_notification_api.send_digest()
+            with patch.object(
+                settings, "ADMIN_NOTIFICATION_DIGEST_RETRY_DELAY", 0
+            ):
+                AdminNotification.objects.update(
+                    next_attempt_date=timezone.now()
+                )
+                item_count = admin_notification_api.send_digest()
+
+        # Assert
+        self.assertEqual(postponed_count, 0)
+        self.assertEqual(item_count, 4)
+        self.assertEqual(AdminNotification.objects.count(), 0)
+
+    @patch.object(settings, "EMAIL_OUTBOX_ENABLED", True)
+    def test_send_digest_stores_emails_in_outbox(self):
+        """test_send_digest_stores_emails_in_outbox"""
+
+        # Act
+        item_count = admin_notification_api.send_digest()
+
+        # Assert
+        self.assertEqual(item_count, 4)
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+        self.assertEqual(AdminNotification.objects.count(), 0)
+
+    def test_command_sends_digest(self):
+        """test_command_sends_digest"""
+
+        # Arrange
+        stdout = StringIO()
+
+        # Act
+        call_command("send_admin_digest", stdout=stdout)
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn("4 item(s) sent in digest.", stdout.getvalue())
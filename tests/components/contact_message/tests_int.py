@@ -1,10 +1,21 @@
 """Test send mail"""
 
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+
 from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase, override_settings
 from unittest.mock import patch
 
 import core_website_app.components.contact_message.api as contact_message_api
+from core_website_app import settings
 from core_website_app.components.contact_message.models import ContactMessage
 
 
@@ -67,6 +78,7 @@ class TestSendEmailContactMessage(TestCase):
         """test_contact_message_does_not_send_mail_when_email_disabled"""
         # Arrange
         mock_settings.SEND_EMAIL_WHEN_CONTACT_MESSAGE_IS_RECEIVED = False
+        mock_settings.CONTACT_MESSAGE_DUPLICATE_WINDOW = 3600
         mock_save.return_value = self.contact_message
 
         # Act
@@ -91,3 +103,435 @@ def _create_contact_message(
     """
 
     return ContactMessage(name=name, email=email, content=content)
+
+
+class TestContactMessageGetPage(TestCase):
+    """Test Contact Message Get Page"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.ids = [
+            ContactMessage.objects.create(
+                name="name", email="email@test.com", content=str(index)
+            ).id
+            for index in range(5)
+        ]
+
+    def test_get_page_returns_newest_messages_first(self):
+        """test_get_page_returns_newest_messages_first"""
+
+        # Act
+        page = contact_message_api.get_page(page_size=2)
+
+        # Assert
+        self.assertEqual([item.id for item in page], self.ids[:-3:-1])
+        self.assertEqual(page.next_cursor, self.ids[3])
+        self.assertIsNone(page.previous_cursor)
+
+    def test_get_page_after_cursor_returns_older_messages(self):
+        """test_get_page_after_cursor_returns_older_messages"""
+
+        # Act
+        page = contact_message_api.get_page(after=self.ids[1], page_size=2)
+
+        # Assert
+        self.assertEqual([item.id for item in page], [self.ids[0]])
+        self.assertIsNone(page.next_cursor)
+        self.assertEqual(page.previous_cursor, self.ids[0])
+
+    def test_get_page_after_last_message_returns_empty_page(self):
+        """test_get_page_after_last_message_returns_empty_page"""
+
+        # Act
+        page = contact_message_api.get_page(after=self.ids[0], page_size=2)
+
+        # Assert
+        self.assertEqual(list(page), [])
+        self.assertIsNone(page.next_cursor)
+        self.assertIsNone(page.previous_cursor)
+
+    def test_get_page_before_cursor_returns_newer_messages(self):
+        """test_get_page_before_cursor_returns_newer_messages"""
+
+        # Act
+        page = contact_message_api.get_page(before=self.ids[0], page_size=2)
+
+        # Assert
+        self.assertEqual(
+            [item.id for item in page], [self.ids[2], self.ids[1]]
+        )
+        self.assertEqual(page.next_cursor, self.ids[1])
+        self.assertEqual(page.previous_cursor, self.ids[2])
+
+    def test_get_page_queries_do_not_depend_on_page_position(self):
+        """test_get_page_queries_do_not_depend_on_page_position"""
+
+        # Act # Assert
+        with self.assertNumQueries(1):
+            list(contact_message_api.get_page(after=self.ids[4], page_size=2))
+
+
+class TestContactMessageGetCount(TestCase):
+    """Test Contact Message Get Count"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.contact_message = ContactMessage.objects.create(
+            name="name", email="email@test.com", content="message"
+        )
+
+    def test_get_count_returns_count(self):
+        """test_get_count_returns_count"""
+
+        # Act # Assert
+        self.assertEqual(contact_message_api.get_count(), 1)
+
+    def test_get_count_is_cached(self):
+        """test_get_count_is_cached"""
+
+        # Arrange
+        contact_message_api.get_count()
+
+        # Act # Assert
+        with self.assertNumQueries(0):
+            self.assertEqual(contact_message_api.get_count(), 1)
+
+    def test_get_count_is_updated_when_message_is_created(self):
+        """test_get_count_is_updated_when_message_is_created"""
+
+        # Arrange
+        contact_message_api.get_count()
+
+        # Act
+        ContactMessage.objects.create(
+            name="name", email="email@test.com", content="message 2"
+        )
+
+        # Assert
+        self.assertEqual(contact_message_api.get_count(), 2)
+
+    def test_get_count_is_updated_when_message_is_deleted(self):
+        """test_get_count_is_updated_when_message_is_deleted"""
+
+        # Arrange
+        contact_message_api.get_count()
+
+        # Act
+        contact_message_api.delete(self.contact_message)
+
+        # Assert
+        self.assertEqual(contact_message_api.get_count(), 0)
+
+
+class TestContactMessageExport(TestCase):
+    """Test Contact Message Export"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.contact_messages = [
+            ContactMessage.objects.create(
+                name="name %d" % index,
+                email="email@test.com",
+                content="line 1\nline 2",
+            )
+            for index in range(5)
+        ]
+
+    def test_iter_export_rows_returns_all_messages_oldest_first(self):
+        """test_iter_export_rows_returns_all_messages_oldest_first"""
+
+        # Act
+        rows = list(contact_message_api.iter_export_rows(chunk_size=2))
+
+        # Assert
+        self.assertEqual(
+            [row["id"] for row in rows],
+            [contact_message.id for contact_message in self.contact_messages],
+        )
+        self.assertEqual(set(rows[0]), set(contact_message_api.EXPORT_FIELDS))
+
+    def test_iter_export_rows_sends_a_single_query(self):
+        """test_iter_export_rows_sends_a_single_query"""
+
+        # Act # Assert
+        with self.assertNumQueries(1):
+            list(contact_message_api.iter_export_rows(chunk_size=2))
+
+    def test_export_command_writes_csv_to_stdout(self):
+        """test_export_command_writes_csv_to_stdout"""
+
+        # Arrange
+        stdout = StringIO()
+
+        # Act
+        call_command("export_contact_messages", stdout=stdout)
+
+        # Assert
+        lines = stdout.getvalue().split("\r\n")
+        self.assertEqual(lines[0], "id,name,email,content,duplicate_count")
+        self.assertEqual(
+            lines[1],
+            '%d,name 0,email@test.com,"line 1\nline 2",0'
+            % self.contact_messages[0].id,
+        )
+
+    def test_export_command_writes_compressed_ndjson_to_file(self):
+        """test_export_command_writes_compressed_ndjson_to_file"""
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "messages.ndjson.gz")
+
+            # Act
+            call_command(
+                "export_contact_messages",
+                "--format",
+                "ndjson",
+                "--gzip",
+                "--output",
+                output,
+            )
+
+            # Assert
+            with gzip.open(output, "rt") as output_file:
+                rows = [json.loads(line) for line in output_file]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[-1]["name"], "name 4")
+
+
+class TestContactMessageSearch(TestCase):
+    """Test Contact Message Search"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.john = ContactMessage.objects.create(
+            name="John Doe",
+            email="john@example.com",
+            content="Question about the XYZ dataset",
+        )
+        self.jane = ContactMessage.objects.create(
+            name="Jane Roe",
+            email="jane@example.org",
+            content="Cannot log in",
+        )
+
+    def test_search_matches_name_email_and_content(self):
+        """test_search_matches_name_email_and_content"""
+
+        # Act # Assert
+        self.assertEqual(list(contact_message_api.search("doe")), [self.john])
+        self.assertEqual(
+            list(contact_message_api.search("jane@example.org")), [self.jane]
+        )
+        self.assertEqual(
+            list(contact_message_api.search("dataset")), [self.john]
+        )
+
+    def test_search_matches_prefix_of_all_words(self):
+        """test_search_matches_prefix_of_all_words"""
+
+        # Act # Assert
+        self.assertEqual(
+            list(contact_message_api.search("quest XY")), [self.john]
+        )
+        self.assertEqual(list(contact_message_api.search("jane XYZ")), [])
+
+    def test_search_ignores_query_syntax(self):
+        """test_search_ignores_query_syntax"""
+
+        # Act # Assert
+        self.assertEqual(
+            list(contact_message_api.search('"john" OR NOT*')), []
+        )
+
+    def test_search_follows_updates_and_deletes(self):
+        """test_search_follows_updates_and_deletes"""
+
+        # Act
+        self.jane.content = "Question about the ABC dataset"
+        self.jane.save()
+        self.john.delete()
+
+        # Assert
+        self.assertEqual(list(contact_message_api.search("abc")), [self.jane])
+        self.assertEqual(
+            list(contact_message_api.search("dataset")), [self.jane]
+        )
+
+    def test_search_uses_full_text_index(self):
+        """test_search_uses_full_text_index"""
+
+        # Act
+        plan = contact_message_api.search("dataset").explain()
+
+        # Assert
+        self.assertIn("VIRTUAL TABLE INDEX", plan)
+        self.assertNotIn("SCAN core_website_app_contactmessage ", plan + " ")
+
+    def test_get_page_paginates_search_results(self):
+        """test_get_page_paginates_search_results"""
+
+        # Act
+        page = contact_message_api.get_page(query="example", page_size=1)
+
+        # Assert
+        self.assertEqual(list(page), [self.jane])
+        self.assertEqual(page.next_cursor, self.jane.id)
+
+
+class TestContactMessageDeduplication(TestCase):
+    """Test Contact Message Deduplication"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.contact_message = contact_message_api.upsert(
+            _create_contact_message(content="Hello World")
+        )
+
+    def test_duplicate_increments_count_of_first_message(self):
+        """test_duplicate_increments_count_of_first_message"""
+
+        # Act
+        for _ in range(2):
+            result = contact_message_api.upsert(
+                _create_contact_message(content="  hello\nworld ")
+            )
+
+        # Assert
+        self.assertEqual(result.id, self.contact_message.id)
+        self.assertEqual(result.duplicate_count, 2)
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+    def test_message_from_other_sender_is_not_duplicate(self):
+        """test_message_from_other_sender_is_not_duplicate"""
+
+        # Act
+        result = contact_message_api.upsert(
+            _create_contact_message(
+                email="other@test.com", content="Hello World"
+            )
+        )
+
+        # Assert
+        self.assertNotEqual(result.id, self.contact_message.id)
+        self.assertEqual(ContactMessage.objects.count(), 2)
+
+    def test_message_after_window_is_not_duplicate(self):
+        """test_message_after_window_is_not_duplicate"""
+
+        # Arrange
+        after_window = self.contact_message.window_start + timedelta(
+            seconds=settings.CONTACT_MESSAGE_DUPLICATE_WINDOW + 1
+        )
+
+        # Act
+        with patch.object(
+            contact_message_api.timezone, "now", return_value=after_window
+        ):
+            result = contact_message_api.upsert(
+                _create_contact_message(content="Hello World")
+            )
+
+        # Assert
+        self.assertNotEqual(result.id, self.contact_message.id)
+        self.assertEqual(result.duplicate_count, 0)
+
+    def test_message_within_window_is_duplicate(self):
+        """test_message_within_window_is_duplicate"""
+
+        # Arrange
+        within_window = self.contact_message.window_start + timedelta(
+            seconds=settings.CONTACT_MESSAGE_DUPLICATE_WINDOW
+        )
+
+        # Act
+        with patch.object(
+            contact_message_api.timezone, "now", return_value=within_window
+        ):
+            result = contact_message_api.upsert(
+                _create_contact_message(content="Hello World")
+            )
+
+        # Assert
+        self.assertEqual(result.id, self.contact_message.id)
+        self.assertEqual(result.duplicate_count, 1)
+
+    def test_messages_one_second_apart_are_duplicates(self):
+        """test_messages_one_second_apart_are_duplicates"""
+
+        # Arrange
+        ContactMessage.objects.all().delete()
+        dates = [
+            datetime(2024, 5, 1, 10, 59, 59, tzinfo=dt_timezone.utc),
+            datetime(2024, 5, 1, 11, 0, 0, tzinfo=dt_timezone.utc),
+        ]
+
+        # Act
+        with patch.object(
+            contact_message_api.timezone, "now", side_effect=dates
+        ):
+            first_message = contact_message_api.upsert(
+                _create_contact_message(content="Hello World")
+            )
+            result = contact_message_api.upsert(
+                _create_contact_message(content="Hello World")
+            )
+
+        # Assert
+        self.assertEqual(result.id, first_message.id)
+        self.assertEqual(result.duplicate_count, 1)
+
+    @patch.object(settings, "CONTACT_MESSAGE_DUPLICATE_WINDOW", 0)
+    def test_window_of_0_disables_deduplication(self):
+        """test_window_of_0_disables_deduplication"""
+
+        # Act
+        for _ in range(2):
+            contact_message_api.upsert(
+                _create_contact_message(content="Hello World")
+            )
+
+        # Assert
+        self.assertEqual(ContactMessage.objects.count(), 3)
+
+    @patch.object(
+        settings, "SEND_EMAIL_WHEN_CONTACT_MESSAGE_IS_RECEIVED", True
+    )
+    def test_duplicate_does_not_send_mail(self):
+        """test_duplicate_does_not_send_mail"""
+
+        # Arrange
+        mail.outbox = []
+
+        # Act
+        contact_message_api.upsert(
+            _create_contact_message(content="Hello World")
+        )
+        contact_message_api.upsert(_create_contact_message(content="Other"))
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 1)
+
+    @patch.object(
+        ContactMessage, "increment_duplicate_count", side_effect=[0, 1]
+    )
+    def test_duplicate_inserted_concurrently_is_counted(
+        self, mock_increment_duplicate_count
+    ):
+        """test_duplicate_inserted_concurrently_is_counted"""
+
+        # Act
+        result = contact_message_api.upsert(
+            _create_contact_message(content="Hello World")
+        )
+
+        # Assert
+        self.assertEqual(result.id, self.contact_message.id)
+        self.assertEqual(mock_increment_duplicate_count.call_count, 2)
+        self.assertEqual(ContactMessage.objects.count(), 1)
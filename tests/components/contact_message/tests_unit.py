@@ -4,10 +4,13 @@ from unittest.case import TestCase
 
 from unittest.mock import Mock, patch
 
+from django.core.cache import cache
+
 from core_main_app.commons import exceptions
 from core_website_app.components.contact_message import (
     api as contact_message_api,
 )
+from core_website_app.components.contact_message import search
 from core_website_app.components.contact_message.models import ContactMessage
 
 
@@ -144,10 +147,40 @@ class TestsContactMessageUpsert(TestCase):
         with self.assertRaises(exceptions.ApiError):
             contact_message_api.upsert(self.mock_message)
 
+    @patch.object(ContactMessage, "get_by_content_hash")
+    @patch.object(ContactMessage, "increment_duplicate_count", return_value=1)
+    @patch(
+        "core_website_app.components.contact_message.models"
+        ".ContactMessage.save"
+    )
+    def test_duplicate_message_is_not_saved(
+        self,
+        mock_save,
+        mock_increment_duplicate_count,
+        mock_get_by_content_hash,
+    ):
+        """test_duplicate_message_is_not_saved"""
+
+        # Arrange
+        existing_message = _create_contact_message()
+        mock_get_by_content_hash.return_value = existing_message
+
+        # Act
+        result = contact_message_api.upsert(_create_contact_message(pk=None))
+
+        # Assert
+        self.assertEqual(result, existing_message)
+        mock_save.assert_not_called()
+
 
 class TestsContactMessageGetCount(TestCase):
     """Tests Contact Message Get Count"""
 
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+
     def test_contact_message_get_count_returns_count(self):
         """test_contact_message_get_count_return_count"""
 
@@ -198,3 +231,88 @@ def _create_contact_message(
     """
 
     return ContactMessage(pk=pk, name=name, email=email, content=content)
+
+
+class TestsContactMessageSearch(TestCase):
+    """Tests Contact Message Search"""
+
+    @patch(
+        "core_website_app.components.contact_message.models.ContactMessage"
+        ".search"
+    )
+    @patch(
+        "core_website_app.components.contact_message.models.ContactMessage"
+        ".get_all"
+    )
+    def test_empty_query_returns_all_messages(self, mock_get_all, mock_search):
+        """test_empty_query_returns_all_messages"""
+
+        # Act
+        contact_message_api.search("")
+
+        # Assert
+        mock_get_all.assert_called_once_with()
+        mock_search.assert_not_called()
+
+    def test_postgresql_query_matches_prefix_of_all_words(self):
+        """test_postgresql_query_matches_prefix_of_all_words"""
+
+        self.assertEqual(
+            search.get_postgresql_query(["john", "o'neil\\"]),
+            "'john':* & 'o''neil\\\\':*",
+        )
+
+    def test_sqlite_query_matches_prefix_of_all_words(self):
+        """test_sqlite_query_matches_prefix_of_all_words"""
+
+        self.assertEqual(
+            search.get_sqlite_query(["john", 'say"hi']),
+            '"john"* "say""hi"*',
+        )
+
+    @patch.object(search, "connections")
+    def test_postgresql_uses_indexed_expression(self, mock_connections):
+        """test_postgresql_uses_indexed_expression"""
+
+        # Arrange
+        mock_connections.__getitem__.return_value = Mock(vendor="postgresql")
+
+        # Act
+        queryset = search.filter_queryset(ContactMessage.objects.all(), "a")
+
+        # Assert
+        self.assertIn("to_tsvector('simple'", str(queryset.query))
+
+    @patch.object(search, "connections")
+    def test_other_databases_fall_back_to_icontains(self, mock_connections):
+        """test_other_databases_fall_back_to_icontains"""
+
+        # Arrange
+        mock_connections.__getitem__.return_value = Mock(vendor="mysql")
+
+        # Act
+        queryset = search.filter_queryset(ContactMessage.objects.all(), "a")
+
+        # Assert
+        self.assertIn("LIKE", str(queryset.query))
+        self.assertNotIn("MATCH", str(queryset.query))
+
+
+class TestsContactMessageContentHash(TestCase):
+    """Tests Contact Message Content Hash"""
+
+    def test_content_hash_ignores_case_and_whitespace(self):
+        """test_content_hash_ignores_case_and_whitespace"""
+
+        self.assertEqual(
+            ContactMessage.get_content_hash("Hello  World\n"),
+            ContactMessage.get_content_hash("hello world"),
+        )
+
+    def test_content_hash_differs_for_different_content(self):
+        """test_content_hash_differs_for_different_content"""
+
+        self.assertNotEqual(
+            ContactMessage.get_content_hash("hello world"),
+            ContactMessage.get_content_hash("hello world!"),
+        )
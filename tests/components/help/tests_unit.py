@@ -39,8 +39,14 @@ class TestHelpUpsert(TestCase):
         with self.assertRaises(exceptions.ApiError):
             help_api.upsert(help_page)
 
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=False,
+    )
     @patch("core_main_app.components.web_page.api.upsert")
-    def test_help_upsert_returns_correct_page(self, mock_upsert):
+    def test_help_upsert_returns_correct_page(
+        self, mock_upsert, mock_is_unchanged
+    ):
         """test_help_upsert_returns_correct_page"""
 
         # Arrange
@@ -51,3 +57,24 @@ class TestHelpUpsert(TestCase):
 
         # Assert
         self.assertEqual(result.type, 2)
+
+    @patch("core_website_app.utils.web_page_cache.invalidate")
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=True,
+    )
+    @patch("core_main_app.components.web_page.api.upsert")
+    def test_help_upsert_skips_unchanged_page(
+        self, mock_upsert, mock_is_unchanged, mock_invalidate
+    ):
+        """test_help_upsert_skips_unchanged_page"""
+
+        # Arrange
+        help_page = Mock(spec=WebPage, type=2, content="test")
+        # Act
+        result = help_api.upsert(help_page)
+
+        # Assert
+        self.assertEqual(result, help_page)
+        mock_upsert.assert_not_called()
+        mock_invalidate.assert_not_called()
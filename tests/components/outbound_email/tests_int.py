@@ -0,0 +1,170 @@
+"""Integration tests of the outbound email API"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+import core_website_app.components.contact_message.api as contact_message_api
+import core_website_app.components.outbound_email.api as outbound_email_api
+import core_website_app.utils.notifications.mail as send_mail_api
+from core_website_app import settings
+from core_website_app.components.contact_message.models import ContactMessage
+from core_website_app.components.outbound_email.models import OutboundEmail
+
+
+@patch.object(settings, "EMAIL_OUTBOX_ENABLED", True)
+class TestSendMailWithOutbox(TestCase):
+    """Test Send Mail With Outbox"""
+
+    def test_send_mail_stores_email_without_sending_it(self):
+        """test_send_mail_stores_email_without_sending_it"""
+
+        # Act
+        send_mail_api.send_mail(["user@test.com"], "subject", "<p>body</p>")
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+
+    def test_send_mail_to_website_contacts_stores_email(self):
+        """test_send_mail_to_website_contacts_stores_email"""
+
+        # Act
+        send_mail_api.send_mail_to_website_contacts(
+            subject="New Contact Message",
+            path_to_template="core_website_app/admin/email"
+            "/contact_message_for_admin.html",
+        )
+
+        # Assert
+        outbound_email = OutboundEmail.objects.get()
+        self.assertEqual(
+            outbound_email.recipient_list,
+            ["admin1@example.com", "admin2@example.com"],
+        )
+        self.assertIn("Dear Administrator", outbound_email.body)
+
+    def test_contact_message_upsert_enqueues_email(self):
+        """test_contact_message_upsert_enqueues_email"""
+
+        # Act
+        contact_message_api.upsert(
+            ContactMessage(name="name", email="a@test.com", content="message")
+        )
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(
+            OutboundEmail.objects.get().subject, "New Contact Message"
+        )
+
+
+class TestSendReady(TestCase):
+    """Test Send Ready"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.outbound_email = outbound_email_api.enqueue(
+            ["user@test.com"], "subject", "<p>body</p>"
+        )
+
+    def test_send_ready_sends_emails(self):
+        """test_send_ready_sends_emails"""
+
+        # Act
+        result = outbound_email_api.send_ready(max_workers=2)
+
+        # Assert
+        self.assertEqual(result, (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["user@test.com"])
+        self.assertEqual(
+            OutboundEmail.objects.get().status, OutboundEmail.STATUS_SENT
+        )
+
+    def test_send_ready_does_not_send_emails_twice(self):
+        """test_send_ready_does_not_send_emails_twice"""
+
+        # Act
+        outbound_email_api.send_ready()
+        outbound_email_api.send_ready()
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_send_ready_ignores_emails_scheduled_later(self):
+        """test_send_ready_ignores_emails_scheduled_later"""
+
+        # Arrange
+        OutboundEmail.objects.update(
+            next_attempt_date=timezone.now() + timedelta(minutes=5)
+        )
+
+        # Act
+        result = outbound_email_api.send_ready()
+
+        # Assert
+        self.assertEqual(result, (0, 0))
+        self.assertEqual(len(mail.outbox), 0)
+
+    @patch.object(EmailMultiAlternatives, "send")
+    def test_send_ready_schedules_retry_on_failure(self, mock_send):
+        """test_send_ready_schedules_retry_on_failure"""
+
+        # Arrange
+        mock_send.side_effect = Exception("SMTP error")
+
+        # Act
+        result = outbound_email_api.send_ready()
+
+        # Assert
+        outbound_email = OutboundEmail.objects.get()
+        self.assertEqual(result, (0, 1))
+        self.assertEqual(outbound_email.status, OutboundEmail.STATUS_PENDING)
+        self.assertEqual(outbound_email.attempts, 1)
+        self.assertEqual(outbound_email.last_error, "SMTP error")
+        self.assertGreater(outbound_email.next_attempt_date, timezone.now())
+
+    @patch.object(EmailMultiAlternatives, "send")
+    def test_send_ready_marks_email_failed_after_max_attempts(self, mock_send):
+        """test_send_ready_marks_email_failed_after_max_attempts"""
+
+        # Arrange
+        mock_send.side_effect = Exception("SMTP error")
+        OutboundEmail.objects.update(
+            attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS - 1
+        )
+
+        # Act
+        outbound_email_api.send_ready()
+
+        # Assert
+        self.assertEqual(
+            OutboundEmail.objects.get().status, OutboundEmail.STATUS_FAILED
+        )
+
+    def test_send_outbound_emails_command_drains_outbox(self):
+        """test_send_outbound_emails_command_drains_outbox"""
+
+        # Arrange
+        outbound_email_api.enqueue(["other@test.com"], "subject", "body")
+
+        # Act
+        call_command(
+            "send_outbound_emails", "--batch-size", "1", stdout=StringIO()
+        )
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertFalse(
+            OutboundEmail.objects.filter(
+                status=OutboundEmail.STATUS_PENDING
+            ).exists()
+        )
@@ -40,8 +40,14 @@ class TestPrivacyPolicyUpsert(TestCase):
         with self.assertRaises(exceptions.ApiError):
             privacy_policy_api.upsert(privacy_policy_page)
 
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=False,
+    )
     @patch("core_main_app.components.web_page.api.upsert")
-    def test_help_upsert_returns_correct_page(self, mock_upsert):
+    def test_help_upsert_returns_correct_page(
+        self, mock_upsert, mock_is_unchanged
+    ):
         """test_privacy_policy_upsert_returns_correct_page"""
 
         # Arrange
@@ -52,3 +58,24 @@ class TestPrivacyPolicyUpsert(TestCase):
 
         # Assert
         self.assertEqual(result.type, 1)
+
+    @patch("core_website_app.utils.web_page_cache.invalidate")
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=True,
+    )
+    @patch("core_main_app.components.web_page.api.upsert")
+    def test_privacy_policy_upsert_skips_unchanged_page(
+        self, mock_upsert, mock_is_unchanged, mock_invalidate
+    ):
+        """test_privacy_policy_upsert_skips_unchanged_page"""
+
+        # Arrange
+        privacy_policy_page = Mock(spec=WebPage, type=1, content="test")
+        # Act
+        result = privacy_policy_api.upsert(privacy_policy_page)
+
+        # Assert
+        self.assertEqual(result, privacy_policy_page)
+        mock_upsert.assert_not_called()
+        mock_invalidate.assert_not_called()
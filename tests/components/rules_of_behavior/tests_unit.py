@@ -43,8 +43,14 @@ class TestRulesOfBehaviorUpsert(TestCase):
         with self.assertRaises(exceptions.ApiError):
             rules_of_behavior_api.upsert(rules_of_behavior_page)
 
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=False,
+    )
     @patch("core_main_app.components.web_page.api.upsert")
-    def test_rules_of_behavior_upsert_returns_correct_page(self, mock_upsert):
+    def test_rules_of_behavior_upsert_returns_correct_page(
+        self, mock_upsert, mock_is_unchanged
+    ):
         """test_rules_of_behavior_upsert_returns_correct_page"""
 
         # Arrange
@@ -55,3 +61,24 @@ class TestRulesOfBehaviorUpsert(TestCase):
 
         # Assert
         self.assertEqual(result.type, 4)
+
+    @patch("core_website_app.utils.web_page_cache.invalidate")
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=True,
+    )
+    @patch("core_main_app.components.web_page.api.upsert")
+    def test_rules_of_behavior_upsert_skips_unchanged_page(
+        self, mock_upsert, mock_is_unchanged, mock_invalidate
+    ):
+        """test_rules_of_behavior_upsert_skips_unchanged_page"""
+
+        # Arrange
+        rules_of_behavior_page = Mock(spec=WebPage, type=4, content="test")
+        # Act
+        result = rules_of_behavior_api.upsert(rules_of_behavior_page)
+
+        # Assert
+        self.assertEqual(result, rules_of_behavior_page)
+        mock_upsert.assert_not_called()
+        mock_invalidate.assert_not_called()
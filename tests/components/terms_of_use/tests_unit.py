@@ -38,8 +38,14 @@ class TestTermsOfUseUpsert(TestCase):
         with self.assertRaises(exceptions.ApiError):
             terms_of_use_api.upsert(term_of_use_page)
 
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=False,
+    )
     @patch("core_main_app.components.web_page.api.upsert")
-    def test_terms_of_use_upsert_returns_correct_page(self, mock_upsert):
+    def test_terms_of_use_upsert_returns_correct_page(
+        self, mock_upsert, mock_is_unchanged
+    ):
         """test_terms_of_use_upsert_returns_correct_page"""
 
         # Arrange
@@ -50,3 +56,24 @@ class TestTermsOfUseUpsert(TestCase):
 
         # Assert
         self.assertEqual(result.type, 0)
+
+    @patch("core_website_app.utils.web_page_cache.invalidate")
+    @patch(
+        "core_website_app.components.web_page.api.is_unchanged",
+        return_value=True,
+    )
+    @patch("core_main_app.components.web_page.api.upsert")
+    def test_terms_of_use_upsert_skips_unchanged_page(
+        self, mock_upsert, mock_is_unchanged, mock_invalidate
+    ):
+        """test_terms_of_use_upsert_skips_unchanged_page"""
+
+        # Arrange
+        term_of_use_page = Mock(spec=WebPage, type=0, content="test")
+        # Act
+        result = terms_of_use_api.upsert(term_of_use_page)
+
+        # Assert
+        self.assertEqual(result, term_of_use_page)
+        mock_upsert.assert_not_called()
+        mock_invalidate.assert_not_called()
@@ -0,0 +1,204 @@
+"""Integration tests of the rendered web page API"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+import core_website_app.components.help.api as help_api
+from core_main_app.components.web_page.models import WebPage
+from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.components.web_page import api as web_page_api
+from core_website_app.components.web_page.models import RenderedWebPage
+from core_website_app.utils import web_page_cache
+
+
+class TestRenderedWebPage(TestCase):
+    """Test Rendered Web Page"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.help_page = WebPage.objects.create(
+            type=WEB_PAGE_TYPES["help"], content="# Help"
+        )
+
+    def test_save_stores_rendered_html(self):
+        """test_save_stores_rendered_html"""
+
+        # Act
+        rendered_web_page = RenderedWebPage.get_by_web_page_id(
+            self.help_page.id
+        )
+
+        # Assert
+        self.assertIn("<h1>Help</h1>", rendered_web_page.html)
+        self.assertEqual(
+            rendered_web_page.content_hash,
+            RenderedWebPage.get_content_hash("# Help"),
+        )
+
+    def test_upsert_renders_new_content(self):
+        """test_upsert_renders_new_content"""
+
+        # Arrange
+        self.help_page.content = "# New help"
+
+        # Act
+        help_api.upsert(self.help_page)
+
+        # Assert
+        self.assertIn(
+            "<h1>New help</h1>",
+            RenderedWebPage.get_by_web_page_id(self.help_page.id).html,
+        )
+        self.assertEqual(RenderedWebPage.objects.count(), 1)
+
+    @patch("core_website_app.utils.static_export.export_page_on_commit")
+    def test_save_other_page_type_is_not_rendered(self, mock_export):
+        """test_save_other_page_type_is_not_rendered"""
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            login_page = WebPage.objects.create(
+                type=WEB_PAGE_TYPES["login"], content="# Login"
+            )
+
+        # Assert
+        self.assertFalse(
+            RenderedWebPage.objects.filter(web_page_id=login_page.id).exists()
+        )
+        mock_export.assert_not_called()
+
+    @patch("core_website_app.components.web_page.api.parse")
+    def test_get_rendered_returns_stored_html(self, mock_parse):
+        """test_get_rendered_returns_stored_html"""
+
+        # Act
+        with self.assertNumQueries(1):
+            rendered_web_page = web_page_api.get_rendered(self.help_page)
+
+        # Assert
+        self.assertIn("<h1>Help</h1>", rendered_web_page.html)
+        mock_parse.assert_not_called()
+
+    def test_get_rendered_renders_page_saved_without_signals(self):
+        """test_get_rendered_renders_page_saved_without_signals"""
+
+        # Arrange
+        WebPage.objects.filter(id=self.help_page.id).update(
+            content="# Updated"
+        )
+        self.help_page.refresh_from_db()
+
+        # Act
+        rendered_web_page = web_page_api.get_rendered(self.help_page)
+
+        # Assert
+        self.assertIn("<h1>Updated</h1>", rendered_web_page.html)
+        self.assertEqual(
+            RenderedWebPage.get_by_web_page_id(self.help_page.id).content_hash,
+            RenderedWebPage.get_content_hash("# Updated"),
+        )
+
+    def test_delete_web_page_deletes_rendered_html(self):
+        """test_delete_web_page_deletes_rendered_html"""
+
+        # Act
+        self.help_page.delete()
+
+        # Assert
+        self.assertEqual(RenderedWebPage.objects.count(), 0)
+
+
+class TestUnchangedWebPage(TestCase):
+    """Test Unchanged Web Page"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.help_page = WebPage.objects.create(
+            type=WEB_PAGE_TYPES["help"], content="# Help"
+        )
+
+    def test_is_unchanged_returns_true_if_content_is_saved(self):
+        """test_is_unchanged_returns_true_if_content_is_saved"""
+
+        # Act # Assert
+        self.assertTrue(web_page_api.is_unchanged(self.help_page))
+
+    def test_is_unchanged_returns_false_if_content_changed(self):
+        """test_is_unchanged_returns_false_if_content_changed"""
+
+        # Arrange
+        self.help_page.content = "# New help"
+
+        # Act # Assert
+        self.assertFalse(web_page_api.is_unchanged(self.help_page))
+
+    def test_is_unchanged_compares_with_the_stored_content(self):
+        """test_is_unchanged_compares_with_the_stored_content"""
+
+        # Arrange
+        RenderedWebPage.objects.filter(web_page=self.help_page).update(
+            content_hash=RenderedWebPage.get_content_hash("# Old help")
+        )
+        self.help_page.content = "# Old help"
+
+        # Act # Assert
+        self.assertFalse(web_page_api.is_unchanged(self.help_page))
+
+    def test_upsert_saves_changed_content(self):
+        """test_upsert_saves_changed_content"""
+
+        # Arrange
+        self.help_page.content = "# New help"
+
+        # Act
+        help_api.upsert(self.help_page)
+
+        # Assert
+        self.assertEqual(
+            WebPage.objects.get(id=self.help_page.id).content, "# New help"
+        )
+
+    def test_is_unchanged_returns_false_if_page_is_new(self):
+        """test_is_unchanged_returns_false_if_page_is_new"""
+
+        # Arrange
+        web_page = WebPage(type=WEB_PAGE_TYPES["terms_of_use"], content="")
+
+        # Act # Assert
+        with self.assertNumQueries(0):
+            self.assertFalse(web_page_api.is_unchanged(web_page))
+
+    def test_upsert_unchanged_page_keeps_cached_version(self):
+        """test_upsert_unchanged_page_keeps_cached_version"""
+
+        # Arrange
+        web_page_cache.get_rendered_page(help_api.HELP_PAGE_NAME)
+        version = web_page_cache._get_version(
+            web_page_cache._get_cache(), help_api.HELP_PAGE_NAME
+        )
+        rendering_date = RenderedWebPage.get_by_web_page_id(
+            self.help_page.id
+        ).rendering_date
+
+        # Act
+        with self.captureOnCommitCallbacks() as callbacks:
+            result = help_api.upsert(self.help_page)
+
+        # Assert
+        self.assertEqual(
+            web_page_cache._get_version(
+                web_page_cache._get_cache(), help_api.HELP_PAGE_NAME
+            ),
+            version,
+        )
+        self.assertEqual(
+            RenderedWebPage.get_by_web_page_id(
+                self.help_page.id
+            ).rendering_date,
+            rendering_date,
+        )
+        self.assertEqual(callbacks, [])
+        self.assertEqual(result, self.help_page)
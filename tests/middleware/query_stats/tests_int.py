@@ -0,0 +1,87 @@
+"""Integration tests of the query statistics middleware"""
+
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from core_website_app import settings
+from core_website_app.middleware.query_stats import QueryStatsMiddleware
+
+
+def _get_response(request):
+    """View sending two queries
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    User.objects.count()
+    User.objects.count()
+    return HttpResponse()
+
+
+@patch.object(settings, "QUERY_STATS_ENABLED", True)
+class TestQueryStatsMiddleware(TestCase):
+    """Test Query Stats Middleware"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.request = RequestFactory().get("/help/")
+        self.request.resolver_match = None
+
+    @patch.object(settings, "QUERY_STATS_HEADERS", True)
+    def test_middleware_adds_headers(self):
+        """test_middleware_adds_headers"""
+
+        # Act
+        response = QueryStatsMiddleware(_get_response)(self.request)
+
+        # Assert
+        self.assertEqual(response["X-Query-Count"], "2")
+        self.assertEqual(response["X-Query-Duplicates"], "1")
+        self.assertIn("X-Query-Time", response)
+
+    def test_middleware_without_headers_setting_adds_no_header(self):
+        """test_middleware_without_headers_setting_adds_no_header"""
+
+        # Act
+        response = QueryStatsMiddleware(_get_response)(self.request)
+
+        # Assert
+        self.assertNotIn("X-Query-Count", response)
+
+    @patch.object(settings, "QUERY_BUDGETS", {"view": 1})
+    def test_middleware_warns_when_over_budget(self):
+        """test_middleware_warns_when_over_budget"""
+
+        # Arrange
+        self.request.resolver_match = type(
+            "ResolverMatch", (), {"view_name": "view"}
+        )()
+
+        # Act
+        with self.assertLogs(
+            "core_website_app.middleware.query_stats", level="WARNING"
+        ) as logs:
+            QueryStatsMiddleware(_get_response)(self.request)
+
+        # Assert
+        self.assertIn("over its budget of 1", logs.output[0])
+
+
+class TestQueryStatsMiddlewareDisabled(TestCase):
+    """Test Query Stats Middleware Disabled"""
+
+    @patch.object(settings, "QUERY_STATS_ENABLED", False)
+    def test_middleware_is_not_used_when_disabled(self):
+        """test_middleware_is_not_used_when_disabled"""
+
+        # Act # Assert
+        with self.assertRaises(MiddlewareNotUsed):
+            QueryStatsMiddleware(_get_response)
@@ -1,12 +1,15 @@
 """Authentication tests for Account Request REST API"""
 
+from django.core.cache import cache
 from django.test import SimpleTestCase
 from unittest.mock import patch
 from rest_framework import status
+from rest_framework.test import APIRequestFactory
 
 
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
+from core_website_app import settings
 from core_website_app.components.account_request.models import AccountRequest
 from core_website_app.rest.account_request.serializers import (
     AccountRequestSerializer,
@@ -59,6 +62,7 @@ class TestAccountRequestListPostPermission(SimpleTestCase):
     def setUp(self):
         """setUp"""
 
+        cache.clear()
         self.mock_data = {
             "username": "username",
             "first_name": "first_name",
@@ -239,3 +243,211 @@ class TestAccountRequestAcceptGetPermission(SimpleTestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestAccountRequestBulkDenyPatchPermission(SimpleTestCase):
+    """Test Account Request Bulk Deny Patch Permission"""
+
+    def test_anonymous_returns_http_403(self):
+        """test_anonymous_returns_http_403"""
+
+        response = RequestMock.do_request_patch(
+            account_request_views.AccountRequestBulkDeny.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_is_authenticated_returns_http_403(self):
+        """test_is_authenticated_returns_http_403"""
+
+        response = RequestMock.do_request_patch(
+            account_request_views.AccountRequestBulkDeny.as_view(),
+            create_mock_user("1", is_anonymous=False),
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("core_website_app.components.account_request.api.deny_all")
+    def test_is_staff_returns_http_200(self, account_deny_all):
+        """test_is_staff_returns_http_200"""
+
+        account_deny_all.return_value = (1, [])
+
+        response = RequestMock.do_request_patch(
+            account_request_views.AccountRequestBulkDeny.as_view(),
+            create_mock_user("1", is_staff=True),
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_is_staff_without_ids_returns_http_400(self):
+        """test_is_staff_without_ids_returns_http_400"""
+
+        response = RequestMock.do_request_patch(
+            account_request_views.AccountRequestBulkDeny.as_view(),
+            create_mock_user("1", is_staff=True),
+            data={"ids": []},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestAccountRequestBulkAcceptPatchPermission(SimpleTestCase):
+    """Test Account Request Bulk Accept Patch Permission"""
+
+    def test_anonymous_returns_http_403(self):
+        """test_anonymous_returns_http_403"""
+
+        response = RequestMock.do_request_patch(
+            account_request_views.AccountRequestBulkAccept.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_is_authenticated_returns_http_403(self):
+        """test_is_authenticated_returns_http_403"""
+
+        response = RequestMock.do_request_patch(
+            account_request_views.AccountRequestBulkAccept.as_view(),
+            create_mock_user("1", is_anonymous=False),
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("core_website_app.components.account_request.api.accept_all")
+    def test_is_staff_returns_http_200(self, account_accept_all):
+        """test_is_staff_returns_http_200"""
+
+        account_accept_all.return_value = (1, [])
+
+        response = RequestMock.do_request_patch(
+            account_request_views.AccountRequestBulkAccept.as_view(),
+            create_mock_user("1", is_staff=True),
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestAccountRequestAcceptIdempotencyKey(SimpleTestCase):
+    """Test Account Request Accept Idempotency Key"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+
+    @patch.object(AccountRequest, "get_by_id")
+    @patch("core_website_app.components.account_request.api.accept")
+    def test_retry_with_same_key_accepts_once(
+        self, account_api, account_get_by_id
+    ):
+        """test_retry_with_same_key_accepts_once"""
+
+        # Arrange
+        view = account_request_views.AccountRequestAccept.as_view()
+        user = create_mock_user("1", is_staff=True)
+
+        # Act
+        responses = []
+        for _ in range(2):
+            request = APIRequestFactory().patch(
+                "/dummy_url", headers={"Idempotency-Key": "key"}
+            )
+            request.user = user
+            responses.append(view(request, pk="1"))
+
+        # Assert
+        self.assertEqual(
+            [response.status_code for response in responses],
+            [status.HTTP_200_OK, status.HTTP_200_OK],
+        )
+        self.assertEqual(account_api.call_count, 1)
+
+
+@patch.object(settings, "RATE_LIMITS", {"account_request": (1, 3600)})
+class TestAccountRequestListPostThrottle(SimpleTestCase):
+    """Test Account Request List Post Throttle"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.mock_data = {"username": "username", "email": "user@test.com"}
+
+    @patch.object(UserSerializer, "is_valid")
+    @patch.object(UserSerializer, "save")
+    def test_too_many_requests_returns_http_429(
+        self, user_serializer_save, user_serializer_is_valid
+    ):
+        """test_too_many_requests_returns_http_429"""
+
+        # Arrange
+        RequestMock.do_request_post(
+            account_request_views.AccountRequestList.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data=self.mock_data,
+        )
+        user_serializer_is_valid.reset_mock()
+
+        # Act
+        response = RequestMock.do_request_post(
+            account_request_views.AccountRequestList.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data=self.mock_data,
+        )
+
+        # Assert
+        self.assertEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+        )
+        self.assertIn("Retry-After", response)
+        user_serializer_is_valid.assert_not_called()
+
+    def test_list_body_is_throttled_by_ip(self):
+        """test_list_body_is_throttled_by_ip"""
+
+        # Arrange
+        RequestMock.do_request_post(
+            account_request_views.AccountRequestList.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data=[self.mock_data],
+        )
+
+        # Act
+        response = RequestMock.do_request_post(
+            account_request_views.AccountRequestList.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data=[self.mock_data],
+        )
+
+        # Assert
+        self.assertEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+        )
+
+    @patch("core_website_app.components.account_request.api.get_all")
+    def test_get_is_not_throttled(self, mock_get_all):
+        """test_get_is_not_throttled"""
+
+        # Arrange
+        mock_get_all.return_value = AccountRequest.objects.none()
+
+        # Act
+        for _ in range(2):
+            response = RequestMock.do_request_get(
+                account_request_views.AccountRequestList.as_view(),
+                create_mock_user("1", is_staff=True),
+            )
+
+        # Assert
+        self.assertNotEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+        )
@@ -1,5 +1,6 @@
 """Authentication tests for contact Message REST API"""
 
+from django.core.cache import cache
 from django.test import SimpleTestCase
 from unittest.mock import patch
 from rest_framework import status
@@ -7,11 +8,13 @@ from rest_framework import status
 
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
+from core_website_app import settings
 from core_website_app.components.contact_message.models import ContactMessage
 from core_website_app.rest.contact_message.serializers import (
     ContactMessageSerializer,
 )
 import core_website_app.rest.contact_message.views as contact_message_views
+from core_website_app.utils.pagination import KeysetPage
 
 
 class TestContactMessageListGetPermission(SimpleTestCase):
@@ -37,14 +40,16 @@ class TestContactMessageListGetPermission(SimpleTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-    @patch.object(ContactMessage, "get_all")
+    @patch(
+        "core_website_app.components.contact_message.api.get_page",
+        return_value=KeysetPage([]),
+    )
     @patch.object(ContactMessageSerializer, "data")
     def test_is_staff_returns_http_200(
-        self, account_serializer_data, account_get_all
+        self, account_serializer_data, contact_get_page
     ):
         """test_is_staff_returns_http_200"""
 
-        account_get_all.return_value = {}
         account_serializer_data.return_value = True
 
         response = RequestMock.do_request_get(
@@ -54,6 +59,22 @@ class TestContactMessageListGetPermission(SimpleTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    @patch(
+        "core_website_app.components.contact_message.api.get_page",
+        return_value=KeysetPage([]),
+    )
+    def test_search_query_is_passed_to_api(self, contact_get_page):
+        """test_search_query_is_passed_to_api"""
+
+        response = RequestMock.do_request_get(
+            contact_message_views.ContactMessageList.as_view(),
+            create_mock_user("1", is_staff=True),
+            data={"q": "dataset"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(contact_get_page.call_args.kwargs["query"], "dataset")
+
 
 class TestContactMessageListPostPermission(SimpleTestCase):
     """Test Contact Message List Post Permission"""
@@ -61,6 +82,7 @@ class TestContactMessageListPostPermission(SimpleTestCase):
     def setUp(self):
         """setUp"""
 
+        cache.clear()
         self.mock_account_request = ContactMessage(
             name="mock", content="mock", email="mock@mock.com"
         )
@@ -215,3 +237,123 @@ class TestContactMessageDetailDeletePermission(SimpleTestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class TestContactMessageExportGetPermission(SimpleTestCase):
+    """Test Contact Message Export Get Permission"""
+
+    def test_anonymous_returns_http_403(self):
+        """test_anonymous_returns_http_403"""
+
+        response = RequestMock.do_request_get(
+            contact_message_views.ContactMessageExport.as_view(),
+            create_mock_user("1", is_anonymous=True),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_is_authenticated_returns_http_403(self):
+        """test_is_authenticated_returns_http_403"""
+
+        response = RequestMock.do_request_get(
+            contact_message_views.ContactMessageExport.as_view(),
+            create_mock_user("1", is_anonymous=False),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch(
+        "core_website_app.components.contact_message.api.iter_export_rows",
+        return_value=iter([]),
+    )
+    def test_is_staff_returns_http_200(self, mock_iter_export_rows):
+        """test_is_staff_returns_http_200"""
+
+        response = RequestMock.do_request_get(
+            contact_message_views.ContactMessageExport.as_view(),
+            create_mock_user("1", is_staff=True),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            b"".join(response.streaming_content),
+            b"id,name,email,content,duplicate_count\r\n",
+        )
+
+    @patch(
+        "core_website_app.components.contact_message.api.iter_export_rows",
+        return_value=iter([]),
+    )
+    def test_invalid_format_returns_http_400(self, mock_iter_export_rows):
+        """test_invalid_format_returns_http_400"""
+
+        response = RequestMock.do_request_get(
+            contact_message_views.ContactMessageExport.as_view(),
+            create_mock_user("1", is_staff=True),
+            data={"export_format": "xml"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch(
+        "core_website_app.components.contact_message.api.iter_export_rows",
+        return_value=iter([]),
+    )
+    def test_invalid_gzip_returns_http_400(self, mock_iter_export_rows):
+        """test_invalid_gzip_returns_http_400"""
+
+        response = RequestMock.do_request_get(
+            contact_message_views.ContactMessageExport.as_view(),
+            create_mock_user("1", is_staff=True),
+            data={"gzip": "maybe"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@patch.object(settings, "RATE_LIMITS", {"contact": (1, 3600)})
+class TestContactMessageListPostThrottle(SimpleTestCase):
+    """Test Contact Message List Post Throttle"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.mock_data = {
+            "name": "name",
+            "content": "message",
+            "email": "user@test.com",
+        }
+
+    @patch.object(ContactMessageSerializer, "is_valid")
+    @patch.object(ContactMessageSerializer, "save")
+    @patch.object(ContactMessageSerializer, "data")
+    def test_too_many_requests_returns_http_429(
+        self,
+        contact_serializer_data,
+        contact_serializer_save,
+        contact_serializer_is_valid,
+    ):
+        """test_too_many_requests_returns_http_429"""
+
+        # Arrange
+        RequestMock.do_request_post(
+            contact_message_views.ContactMessageList.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data=self.mock_data,
+        )
+        contact_serializer_is_valid.reset_mock()
+
+        # Act
+        response = RequestMock.do_request_post(
+            contact_message_views.ContactMessageList.as_view(),
+            create_mock_user("1", is_anonymous=True),
+            data=self.mock_data,
+        )
+
+        # Assert
+        self.assertEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+        )
+        self.assertIn("Retry-After", response)
+        contact_serializer_is_valid.assert_not_called()
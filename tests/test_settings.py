@@ -15,6 +15,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     # Extra apps
     "captcha",
+    "menu",
     # Local app
     "tests",
     "core_main_app",
@@ -0,0 +1,222 @@
+"""Integration tests for admin events utils"""
+
+import json
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import Http404
+from django.test import RequestFactory, TestCase
+
+from core_website_app import settings
+from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.components.contact_message.models import ContactMessage
+from core_website_app.utils import admin_events, badge_counts
+from core_website_app.utils.pubsub import broker
+from core_website_app.views.admin import ajax as admin_ajax
+
+
+def _parse_event(chunk):
+    """Parse a server-sent event
+
+    Args:
+        chunk:
+
+    Returns:
+        (event type, data)
+    """
+    lines = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+    return lines["event"], json.loads(lines["data"])
+
+
+class TestIterEvents(TestCase):
+    """Test Iter Events"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.events = admin_events.iter_events(heartbeat=0.01, max_duration=5)
+        self.addCleanup(self.events.close)
+
+    def _start(self):
+        """Read the reconnection delay and the initial counts
+
+        Returns:
+            initial counts
+        """
+        self.assertEqual(next(self.events), "retry: 3000\n\n")
+        return _parse_event(next(self.events))
+
+    def test_stream_starts_with_counts(self):
+        """test_stream_starts_with_counts"""
+
+        # Arrange
+        AccountRequest.objects.create(username="user", email="user@test.com")
+
+        # Act
+        event_type, counts = self._start()
+
+        # Assert
+        self.assertEqual(event_type, admin_events.COUNTS)
+        self.assertEqual(
+            counts[badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME], 1
+        )
+
+    def test_created_message_is_pushed_with_new_counts(self):
+        """test_created_message_is_pushed_with_new_counts"""
+
+        # Arrange
+        self._start()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            contact_message = ContactMessage.objects.create(
+                name="name", email="email@test.com", content="message"
+            )
+
+        # Assert
+        self.assertEqual(
+            _parse_event(next(self.events)),
+            (
+                admin_events.CONTACT_MESSAGE_CREATED,
+                {
+                    "id": contact_message.id,
+                    "name": "name",
+                    "email": "email@test.com",
+                },
+            ),
+        )
+        event_type, counts = _parse_event(next(self.events))
+        self.assertEqual(event_type, admin_events.COUNTS)
+        self.assertEqual(
+            counts[badge_counts.CONTACT_MESSAGE_COUNT_URL_NAME], 1
+        )
+
+    def test_deleted_request_is_pushed_with_new_counts(self):
+        """test_deleted_request_is_pushed_with_new_counts"""
+
+        # Arrange
+        account_request = AccountRequest.objects.create(
+            username="user", email="user@test.com"
+        )
+        account_request_id = account_request.id
+        self._start()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            account_request.delete()
+
+        # Assert
+        self.assertEqual(
+            _parse_event(next(self.events)),
+            (
+                admin_events.ACCOUNT_REQUEST_DELETED,
+                {"id": account_request_id},
+            ),
+        )
+        event_type, counts = _parse_event(next(self.events))
+        self.assertEqual(event_type, admin_events.COUNTS)
+        self.assertEqual(
+            counts[badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME], 0
+        )
+
+    def test_event_is_not_published_before_commit(self):
+        """test_event_is_not_published_before_commit"""
+
+        # Arrange
+        with broker.subscribe(
+            admin_events.ADMIN_EVENTS_CHANNEL
+        ) as subscription:
+            # Act
+            with self.captureOnCommitCallbacks() as callbacks:
+                AccountRequest.objects.create(
+                    username="user", email="user@test.com"
+                )
+            message = subscription.get(timeout=0.01)
+            for callback in callbacks:
+                callback()
+
+            # Assert
+            self.assertIsNone(message)
+            event_type, data = subscription.get(timeout=0.01)
+            self.assertEqual(event_type, admin_events.ACCOUNT_REQUEST_CREATED)
+            self.assertEqual(data["username"], "user")
+
+    def test_counts_changed_elsewhere_are_pushed_at_heartbeat(self):
+        """test_counts_changed_elsewhere_are_pushed_at_heartbeat"""
+
+        # Arrange
+        self._start()
+        AccountRequest.objects.bulk_create(
+            [AccountRequest(username="user", email="user@test.com")]
+        )
+        badge_counts.clear_cache()
+
+        # Act
+        event_type, counts = _parse_event(next(self.events))
+
+        # Assert
+        self.assertEqual(event_type, admin_events.COUNTS)
+        self.assertEqual(
+            counts[badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME], 1
+        )
+
+    def test_closed_stream_unsubscribes(self):
+        """test_closed_stream_unsubscribes"""
+
+        # Arrange
+        self._start()
+        subscription_count = broker.get_subscription_count(
+            admin_events.ADMIN_EVENTS_CHANNEL
+        )
+
+        # Act
+        self.events.close()
+
+        # Assert
+        self.assertEqual(
+            broker.get_subscription_count(admin_events.ADMIN_EVENTS_CHANNEL),
+            subscription_count - 1,
+        )
+
+    def test_stream_ends_after_max_duration(self):
+        """test_stream_ends_after_max_duration"""
+
+        # Arrange
+        events = admin_events.iter_events(heartbeat=0.01, max_duration=0.02)
+
+        # Act # Assert
+        self.assertLessEqual(len(list(events)), 5)
+
+
+class TestAdminEventsStream(TestCase):
+    """Test Admin Events Stream"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.request = RequestFactory().get("/")
+        self.request.user = User.objects.create(
+            username="staff", is_staff=True
+        )
+
+    def test_admin_events_returns_404_if_disabled(self):
+        """test_admin_events_returns_404_if_disabled"""
+
+        # Act # Assert
+        with self.assertRaises(Http404):
+            admin_ajax.admin_events_stream(self.request)
+
+    @patch.object(settings, "ADMIN_EVENTS_ENABLED", True)
+    def test_admin_events_returns_event_stream(self):
+        """test_admin_events_returns_event_stream"""
+
+        # Act
+        response = admin_ajax.admin_events_stream(self.request)
+
+        # Assert
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        response.close()
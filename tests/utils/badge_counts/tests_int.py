@@ -0,0 +1,147 @@
+"""Integration tests for admin menu badge counts utils"""
+
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.components.contact_message.models import ContactMessage
+from core_website_app.utils import badge_counts
+from core_website_app.views.admin import ajax as admin_ajax
+
+
+class TestGetCounts(TestCase):
+    """Test Get Counts"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.account_request = AccountRequest.objects.create(
+            username="user", email="user@test.com"
+        )
+        ContactMessage.objects.create(
+            name="name", email="email@test.com", content="message"
+        )
+
+    def test_get_counts_returns_counts_by_url_name(self):
+        """test_get_counts_returns_counts_by_url_name"""
+
+        # Act # Assert
+        self.assertEqual(
+            badge_counts.get_counts(),
+            {
+                badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME: 1,
+                badge_counts.CONTACT_MESSAGE_COUNT_URL_NAME: 1,
+            },
+        )
+
+    def test_get_counts_is_cached(self):
+        """test_get_counts_is_cached"""
+
+        # Arrange
+        badge_counts.get_counts()
+
+        # Act # Assert
+        with self.assertNumQueries(0):
+            badge_counts.get_counts()
+
+    def test_cache_is_cleared_when_account_request_is_created(self):
+        """test_cache_is_cleared_when_account_request_is_created"""
+
+        # Arrange
+        badge_counts.get_counts()
+
+        # Act
+        AccountRequest.objects.create(username="other", email="o@test.com")
+
+        # Assert
+        self.assertEqual(
+            badge_counts.get_counts()[
+                badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME
+            ],
+            2,
+        )
+
+    def test_cache_is_cleared_when_account_request_is_deleted(self):
+        """test_cache_is_cleared_when_account_request_is_deleted"""
+
+        # Arrange
+        badge_counts.get_counts()
+
+        # Act
+        self.account_request.delete()
+
+        # Assert
+        self.assertEqual(
+            badge_counts.get_counts()[
+                badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME
+            ],
+            0,
+        )
+
+    def test_cache_is_cleared_when_contact_message_is_created(self):
+        """test_cache_is_cleared_when_contact_message_is_created"""
+
+        # Arrange
+        badge_counts.get_counts()
+
+        # Act
+        ContactMessage.objects.create(
+            name="name", email="email@test.com", content="other message"
+        )
+
+        # Assert
+        self.assertEqual(
+            badge_counts.get_counts()[
+                badge_counts.CONTACT_MESSAGE_COUNT_URL_NAME
+            ],
+            2,
+        )
+
+
+class TestBadgeCountsView(TestCase):
+    """Test Badge Counts View"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        AccountRequest.objects.create(username="user", email="user@test.com")
+        self.request = RequestFactory().post("/")
+        self.request.user = User.objects.create(
+            username="staff", is_staff=True
+        )
+
+    def test_badge_counts_returns_all_counts(self):
+        """test_badge_counts_returns_all_counts"""
+
+        # Act
+        response = admin_ajax.badge_counts_view(self.request)
+
+        # Assert
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "count": 1,
+                "counts": {
+                    badge_counts.ACCOUNT_REQUEST_COUNT_URL_NAME: 1,
+                    badge_counts.CONTACT_MESSAGE_COUNT_URL_NAME: 0,
+                },
+            },
+        )
+
+    def test_item_counts_share_the_cached_counts(self):
+        """test_item_counts_share_the_cached_counts"""
+
+        # Arrange
+        admin_ajax.account_request_count(self.request)
+
+        # Act
+        with self.assertNumQueries(0):
+            response = admin_ajax.contact_message_count(self.request)
+
+        # Assert
+        self.assertEqual(json.loads(response.content), {"count": 0})
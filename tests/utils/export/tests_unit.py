@@ -0,0 +1,158 @@
+"""Unit tests for streaming export utils"""
+
+import gzip
+import json
+from unittest.case import TestCase
+
+from core_main_app.commons.exceptions import ApiError
+from core_website_app.utils import export
+
+FIELDS = ("id", "name")
+ROWS = [{"id": 1, "name": "a, b"}, {"id": 2, "name": 'say "hi"'}]
+
+
+class TestGetExportFormat(TestCase):
+    """Test Get Export Format"""
+
+    def test_get_export_format_returns_format(self):
+        """test_get_export_format_returns_format"""
+
+        self.assertEqual(export.get_export_format("ndjson"), export.NDJSON)
+
+    def test_get_export_format_raises_api_error_if_unknown(self):
+        """test_get_export_format_raises_api_error_if_unknown"""
+
+        with self.assertRaises(ApiError):
+            export.get_export_format("xml")
+
+
+class TestIterExport(TestCase):
+    """Test Iter Export"""
+
+    def test_csv_starts_with_header_and_quotes_values(self):
+        """test_csv_starts_with_header_and_quotes_values"""
+
+        # Act
+        content = b"".join(export.iter_export(ROWS, FIELDS, export.CSV))
+
+        # Assert
+        self.assertEqual(
+            content.decode("utf-8"),
+            'id,name\r\n1,"a, b"\r\n2,"say ""hi"""\r\n',
+        )
+
+    def test_csv_escapes_formulas(self):
+        """test_csv_escapes_formulas"""
+
+        # Arrange
+        rows = [
+            {"id": -1, "name": '=HYPERLINK("http://test.com")'},
+            {"id": 2, "name": "+1"},
+            {"id": 3, "name": "-1"},
+            {"id": 4, "name": "@SUM(A1)"},
+            {"id": 5, "name": "\tname"},
+            {"id": 6, "name": "\rname"},
+            {"id": 7, "name": "name=1"},
+        ]
+
+        # Act
+        content = b"".join(export.iter_export(rows, FIELDS, export.CSV))
+
+        # Assert
+        self.assertEqual(
+            content.decode("utf-8"),
+            "id,name\r\n"
+            '-1,"\'=HYPERLINK(""http://test.com"")"\r\n'
+            "2,'+1\r\n"
+            "3,'-1\r\n"
+            "4,'@SUM(A1)\r\n"
+            "5,'\tname\r\n"
+            '6,"\'\rname"\r\n'
+            "7,name=1\r\n",
+        )
+
+    def test_ndjson_writes_one_object_per_line(self):
+        """test_ndjson_writes_one_object_per_line"""
+
+        # Act
+        content = b"".join(export.iter_export(ROWS, FIELDS, export.NDJSON))
+
+        # Assert
+        self.assertEqual(
+            [json.loads(line) for line in content.decode().splitlines()],
+            ROWS,
+        )
+
+    def test_compressed_export_is_gzip(self):
+        """test_compressed_export_is_gzip"""
+
+        # Act
+        content = b"".join(
+            export.iter_export(ROWS, FIELDS, export.NDJSON, compress=True)
+        )
+
+        # Assert
+        self.assertEqual(
+            gzip.decompress(content),
+            b"".join(export.iter_export(ROWS, FIELDS, export.NDJSON)),
+        )
+
+    def test_rows_are_consumed_lazily(self):
+        """test_rows_are_consumed_lazily"""
+
+        # Arrange
+        consumed = []
+
+        def rows():
+            for row in ROWS:
+                consumed.append(row)
+                yield row
+
+        # Act
+        chunks = export.iter_export(rows(), FIELDS, export.CSV)
+        next(chunks)
+        next(chunks)
+
+        # Assert
+        self.assertEqual(consumed, ROWS[:1])
+
+    def test_unknown_format_raises_api_error(self):
+        """test_unknown_format_raises_api_error"""
+
+        with self.assertRaises(ApiError):
+            export.iter_export(ROWS, FIELDS, "xml")
+
+
+class TestStreamingExportResponse(TestCase):
+    """Test Streaming Export Response"""
+
+    def test_response_is_an_attachment(self):
+        """test_response_is_an_attachment"""
+
+        # Act
+        response = export.streaming_export_response(
+            ROWS, FIELDS, export.CSV, "messages"
+        )
+
+        # Assert
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="messages.csv"',
+        )
+
+    def test_compressed_response_is_a_gzip_file(self):
+        """test_compressed_response_is_a_gzip_file"""
+
+        # Act
+        response = export.streaming_export_response(
+            ROWS, FIELDS, export.NDJSON, "messages", compress=True
+        )
+
+        # Assert
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="messages.ndjson.gz"',
+        )
@@ -0,0 +1,106 @@
+"""Unit tests of the idempotency key utils"""
+
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase
+
+from core_main_app.commons.exceptions import ApiError
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_website_app.utils import idempotency
+
+
+class TestRunOnce(SimpleTestCase):
+    """Test Run Once"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _get_request(self, idempotency_key=None, user_id="1"):
+        """Build a PATCH request sending an idempotency key
+
+        Args:
+            idempotency_key:
+            user_id:
+
+        Returns:
+
+        """
+        headers = {}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        request = self.factory.patch(
+            "/user-requests/1/accept/", headers=headers
+        )
+        request.user = create_mock_user(user_id, is_staff=True)
+        return request
+
+    def test_run_once_without_key_runs_action_each_time(self):
+        """test_run_once_without_key_runs_action_each_time"""
+
+        # Arrange
+        action = Mock(return_value=1)
+
+        # Act
+        idempotency.run_once(self._get_request(), action)
+        idempotency.run_once(self._get_request(), action)
+
+        # Assert
+        self.assertEqual(action.call_count, 2)
+
+    def test_run_once_with_same_key_returns_first_result(self):
+        """test_run_once_with_same_key_returns_first_result"""
+
+        # Arrange
+        action = Mock(side_effect=[1, 2])
+
+        # Act
+        first_result = idempotency.run_once(self._get_request("key"), action)
+        second_result = idempotency.run_once(self._get_request("key"), action)
+
+        # Assert
+        self.assertEqual(action.call_count, 1)
+        self.assertEqual(first_result, second_result)
+
+    def test_run_once_with_same_key_and_other_user_runs_action(self):
+        """test_run_once_with_same_key_and_other_user_runs_action"""
+
+        # Arrange
+        action = Mock(return_value=None)
+
+        # Act
+        idempotency.run_once(self._get_request("key", user_id="1"), action)
+        idempotency.run_once(self._get_request("key", user_id="2"), action)
+
+        # Assert
+        self.assertEqual(action.call_count, 2)
+
+    def test_run_once_failed_action_can_be_retried(self):
+        """test_run_once_failed_action_can_be_retried"""
+
+        # Arrange
+        action = Mock(side_effect=[ApiError("error"), 1])
+
+        # Act
+        with self.assertRaises(ApiError):
+            idempotency.run_once(self._get_request("key"), action)
+        result = idempotency.run_once(self._get_request("key"), action)
+
+        # Assert
+        self.assertEqual(result, 1)
+
+    def test_run_once_with_key_already_running_raises_api_error(self):
+        """test_run_once_with_key_already_running_raises_api_error"""
+
+        # Arrange
+        request = self._get_request("key")
+        cache.add(idempotency.get_cache_key(request, "key") + ":lock", True)
+        action = Mock()
+
+        # Act # Assert
+        with self.assertRaises(ApiError):
+            idempotency.run_once(request, action)
+        action.assert_not_called()
@@ -0,0 +1,219 @@
+"""Integration tests of the mailing util"""
+
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.test import TestCase, override_settings
+
+import core_website_app.components.account_request.api as account_request_api
+import core_website_app.utils.notifications.mail as send_mail_api
+from core_website_app.components.account_request.models import AccountRequest
+
+REJECTING_EMAIL_BACKEND = (
+    "tests.utils.notifications.mail.tests_int.RejectingEmailBackend"
+)
+
+
+class RejectingEmailBackend(locmem.EmailBackend):
+    """Email backend counting its connections and refusing the recipients
+    starting with 'rejected'"""
+
+    open_count = 0
+    is_down = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_open = False
+
+    def open(self):
+        if self.is_down:
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
+        if self.is_open:
+            return False
+        RejectingEmailBackend.open_count += 1
+        self.is_open = True
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def send_messages(self, messages):
+        for message in messages:
+            refused = {
+                recipient: (550, b"Mailbox unavailable")
+                for recipient in message.recipients()
+                if recipient.startswith("rejected")
+            }
+            if refused:
+                raise SMTPRecipientsRefused(refused)
+        return super().send_messages(messages)
+
+
+@override_settings(EMAIL_BACKEND=REJECTING_EMAIL_BACKEND)
+class TestSendMassMail(TestCase):
+    """Test Send Mass Mail"""
+
+    def setUp(self):
+        """setUp"""
+        RejectingEmailBackend.open_count = 0
+        RejectingEmailBackend.is_down = False
+
+    def test_send_mass_mail_uses_one_connection(self):
+        """test_send_mass_mail_uses_one_connection"""
+
+        # Act
+        failed_recipients = send_mail_api.send_mass_mail(
+            [
+                {
+                    "recipient_list": ["user%d@test.com" % index],
+                    "subject": "subject",
+                    "body": "<p>body %d</p>" % index,
+                }
+                for index in range(5)
+            ]
+        )
+
+        # Assert
+        self.assertEqual(failed_recipients, [])
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(RejectingEmailBackend.open_count, 1)
+
+    def test_send_mass_mail_renders_templates_as_html(self):
+        """test_send_mass_mail_renders_templates_as_html"""
+
+        # Act
+        send_mail_api.send_mass_mail(
+            [
+                {
+                    "recipient_list": ["user@test.com"],
+                    "subject": "Account approved",
+                    "path_to_template": "core_website_app/admin/email"
+                    "/request_account_approved.html",
+                    "context": {"firstname": "First", "lastname": "Last"},
+                }
+            ]
+        )
+
+        # Assert
+        self.assertEqual(mail.outbox[0].subject, "[Django] Account approved")
+        html, content_type = mail.outbox[0].alternatives[0]
+        self.assertEqual(content_type, "text/html")
+        self.assertIn("Dear First Last", html)
+
+    def test_send_mass_mail_returns_failed_recipients(self):
+        """test_send_mass_mail_returns_failed_recipients"""
+
+        # Act
+        failed_recipients = send_mail_api.send_mass_mail(
+            [
+                {
+                    "recipient_list": [recipient],
+                    "subject": "subject",
+                    "body": "body",
+                }
+                for recipient in (
+                    "user1@test.com",
+                    "rejected@test.com",
+                    "user2@test.com",
+                )
+            ]
+        )
+
+        # Assert
+        self.assertEqual(failed_recipients, ["rejected@test.com"])
+        self.assertEqual(
+            [email.to for email in mail.outbox],
+            [["user1@test.com"], ["user2@test.com"]],
+        )
+        # the connection is opened again after the error
+        self.assertEqual(RejectingEmailBackend.open_count, 2)
+
+    def test_send_mass_mail_returns_all_recipients_when_server_is_down(self):
+        """test_send_mass_mail_returns_all_recipients_when_server_is_down"""
+
+        # Arrange
+        RejectingEmailBackend.is_down = True
+
+        # Act
+        failed_recipients = send_mail_api.send_mass_mail(
+            [
+                {
+                    "recipient_list": ["user%d@test.com" % index],
+                    "subject": "subject",
+                    "body": "body",
+                }
+                for index in range(2)
+            ]
+        )
+
+        # Assert
+        self.assertEqual(
+            failed_recipients, ["user0@test.com", "user1@test.com"]
+        )
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_send_mass_mail_raises_error_if_not_fail_silently(self):
+        """test_send_mass_mail_raises_error_if_not_fail_silently"""
+
+        # Act # Assert
+        with self.assertRaises(SMTPRecipientsRefused):
+            send_mail_api.send_mass_mail(
+                [
+                    {
+                        "recipient_list": ["rejected@test.com"],
+                        "subject": "subject",
+                        "body": "body",
+                    }
+                ],
+                fail_silently=False,
+            )
+
+    @override_settings(SEND_EMAIL_WHEN_ACCOUNT_REQUEST_IS_ACCEPTED=True)
+    def test_accept_all_sends_emails_over_one_connection(self):
+        """test_accept_all_sends_emails_over_one_connection"""
+
+        # Arrange
+        account_request_ids = []
+        for index in range(3):
+            User.objects.create(username="user%d" % index, is_active=False)
+            account_request_ids.append(
+                AccountRequest.objects.create(
+                    username="user%d" % index,
+                    first_name="first",
+                    last_name="last",
+                    email="user%d@test.com" % index,
+                ).id
+            )
+
+        # Act
+        account_request_api.accept_all(account_request_ids)
+
+        # Assert
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(RejectingEmailBackend.open_count, 1)
+
+    @patch("core_website_app.utils.notifications.mail.SEND_EMAIL_ASYNC", True)
+    @patch("core_main_app.utils.notifications.mail.send_mail")
+    def test_send_mass_mail_async_sends_each_email_to_workers(
+        self, mock_send_mail
+    ):
+        """test_send_mass_mail_async_sends_each_email_to_workers"""
+
+        # Act
+        send_mail_api.send_mass_mail(
+            [
+                {
+                    "recipient_list": ["user%d@test.com" % index],
+                    "subject": "subject",
+                    "body": "body",
+                }
+                for index in range(2)
+            ]
+        )
+
+        # Assert
+        self.assertEqual(mock_send_mail.call_count, 2)
+        self.assertEqual(RejectingEmailBackend.open_count, 0)
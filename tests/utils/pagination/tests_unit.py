@@ -0,0 +1,53 @@
+"""Unit tests for keyset pagination utils"""
+
+from unittest.case import TestCase
+
+from core_main_app.commons.exceptions import ApiError
+from core_website_app.utils import pagination
+
+
+class TestGetCursor(TestCase):
+    """Test Get Cursor"""
+
+    def test_get_cursor_returns_none_if_not_set(self):
+        """test_get_cursor_returns_none_if_not_set"""
+
+        self.assertIsNone(pagination.get_cursor(None))
+        self.assertIsNone(pagination.get_cursor(""))
+
+    def test_get_cursor_returns_int(self):
+        """test_get_cursor_returns_int"""
+
+        self.assertEqual(pagination.get_cursor("12"), 12)
+
+    def test_get_cursor_raises_api_error_if_invalid(self):
+        """test_get_cursor_raises_api_error_if_invalid"""
+
+        with self.assertRaises(ApiError):
+            pagination.get_cursor("abc")
+
+        with self.assertRaises(ApiError):
+            pagination.get_cursor("-1")
+
+
+class TestGetPageSize(TestCase):
+    """Test Get Page Size"""
+
+    def test_get_page_size_returns_default_if_not_set(self):
+        """test_get_page_size_returns_default_if_not_set"""
+
+        self.assertEqual(pagination.get_page_size(None, 20, 100), 20)
+
+    def test_get_page_size_is_bounded_by_max(self):
+        """test_get_page_size_is_bounded_by_max"""
+
+        self.assertEqual(pagination.get_page_size("1000", 20, 100), 100)
+
+    def test_get_page_size_raises_api_error_if_invalid(self):
+        """test_get_page_size_raises_api_error_if_invalid"""
+
+        with self.assertRaises(ApiError):
+            pagination.get_page_size("0", 20, 100)
+
+        with self.assertRaises(ApiError):
+            pagination.get_page_size("abc", 20, 100)
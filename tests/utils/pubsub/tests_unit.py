@@ -0,0 +1,62 @@
+"""Unit tests for publish/subscribe utils"""
+
+from unittest.case import TestCase
+
+from core_website_app.utils.pubsub import Broker
+
+
+class TestBroker(TestCase):
+    """Test Broker"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.broker = Broker()
+
+    def test_publish_delivers_to_subscriptions_of_channel(self):
+        """test_publish_delivers_to_subscriptions_of_channel"""
+
+        # Arrange
+        first = self.broker.subscribe("channel")
+        second = self.broker.subscribe("channel")
+        other = self.broker.subscribe("other")
+
+        # Act
+        delivered = self.broker.publish("channel", "message")
+
+        # Assert
+        self.assertEqual(delivered, 2)
+        self.assertEqual(first.get(timeout=0), "message")
+        self.assertEqual(second.get(timeout=0), "message")
+        self.assertIsNone(other.get(timeout=0))
+
+    def test_closed_subscription_receives_nothing(self):
+        """test_closed_subscription_receives_nothing"""
+
+        # Arrange
+        with self.broker.subscribe("channel") as subscription:
+            pass
+
+        # Act
+        delivered = self.broker.publish("channel", "message")
+
+        # Assert
+        self.assertEqual(delivered, 0)
+        self.assertIsNone(subscription.get(timeout=0))
+        self.assertEqual(self.broker.get_subscription_count("channel"), 0)
+
+    def test_messages_are_dropped_when_queue_is_full(self):
+        """test_messages_are_dropped_when_queue_is_full"""
+
+        # Arrange
+        subscription = self.broker.subscribe("channel", max_size=1)
+
+        # Act
+        delivered = [
+            self.broker.publish("channel", message) for message in (1, 2)
+        ]
+
+        # Assert
+        self.assertEqual(delivered, [1, 0])
+        self.assertEqual(subscription.get(timeout=0), 1)
+        self.assertIsNone(subscription.get(timeout=0))
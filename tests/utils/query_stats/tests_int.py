@@ -0,0 +1,92 @@
+"""Integration tests of the query statistics utils"""
+
+import types
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core_website_app.utils import query_stats
+
+
+class TestTrackQueries(TestCase):
+    """Test Track Queries"""
+
+    def test_track_queries_counts_queries(self):
+        """test_track_queries_counts_queries"""
+
+        # Act
+        with query_stats.track_queries() as stats:
+            User.objects.count()
+            User.objects.filter(username="user").exists()
+
+        # Assert
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.duplicates, 0)
+        self.assertGreater(stats.duration_ms, 0)
+
+    def test_track_queries_counts_duplicates(self):
+        """test_track_queries_counts_duplicates"""
+
+        # Act
+        with query_stats.track_queries() as stats:
+            for _ in range(3):
+                User.objects.filter(username="user").exists()
+
+        # Assert
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.duplicates, 2)
+
+    def test_track_queries_does_not_count_outside_block(self):
+        """test_track_queries_does_not_count_outside_block"""
+
+        # Arrange
+        with query_stats.track_queries() as stats:
+            User.objects.count()
+
+        # Act
+        User.objects.count()
+
+        # Assert
+        self.assertEqual(stats.count, 1)
+
+
+class TestInstrument(TestCase):
+    """Test Instrument"""
+
+    def test_instrument_logs_query_stats(self):
+        """test_instrument_logs_query_stats"""
+
+        # Arrange
+        instrumented = query_stats.instrument(User.objects.count, "count")
+
+        # Act
+        with self.assertLogs(
+            "core_website_app.utils.query_stats", level="DEBUG"
+        ) as logs:
+            result = instrumented()
+
+        # Assert
+        self.assertEqual(result, 0)
+        self.assertIn("count: 1 queries", logs.output[0])
+
+    def test_instrument_module_wraps_public_functions_once(self):
+        """test_instrument_module_wraps_public_functions_once"""
+
+        # Arrange
+        module = types.ModuleType("fake_api")
+        exec(
+            "def get():\n    return 1\n\ndef _private():\n    return 2\n",
+            module.__dict__,
+        )
+        private = module._private
+
+        # Act
+        query_stats.instrument_module(module)
+        instrumented_get = module.get
+        query_stats.instrument_module(module)
+
+        # Assert
+        self.assertTrue(module.get.query_stats_instrumented)
+        self.assertIs(module.get, instrumented_get)
+        self.assertIs(module._private, private)
+        self.assertEqual(module.get(), 1)
@@ -0,0 +1,158 @@
+"""Unit tests for rate limit utils"""
+
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from core_website_app import settings
+from core_website_app.utils import rate_limit
+
+
+@patch.object(rate_limit.time, "time", return_value=1000.0)
+class TestTakeToken(TestCase):
+    """Test Take Token"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+
+    def test_bucket_allows_capacity_then_returns_wait_time(self, mock_time):
+        """test_bucket_allows_capacity_then_returns_wait_time"""
+
+        # Act
+        wait_times = [rate_limit.take_token("key", 3, 60) for _ in range(4)]
+
+        # Assert
+        self.assertEqual(wait_times[:3], [0, 0, 0])
+        self.assertAlmostEqual(wait_times[3], 20)
+
+    def test_bucket_is_refilled_over_time(self, mock_time):
+        """test_bucket_is_refilled_over_time"""
+
+        # Arrange
+        for _ in range(3):
+            rate_limit.take_token("key", 3, 60)
+
+        # Act
+        mock_time.return_value = 1020.0
+        wait_times = [rate_limit.take_token("key", 3, 60) for _ in range(2)]
+
+        # Assert
+        self.assertEqual(wait_times[0], 0)
+        self.assertGreater(wait_times[1], 0)
+
+    def test_buckets_are_independent(self, mock_time):
+        """test_buckets_are_independent"""
+
+        # Arrange
+        rate_limit.take_token("key", 1, 60)
+
+        # Act # Assert
+        self.assertEqual(rate_limit.take_token("other key", 1, 60), 0)
+
+
+class TestGetWaitTime(TestCase):
+    """Test Get Wait Time"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _post(self, remote_addr="10.0.0.1", **headers):
+        """Build a POST request
+
+        Args:
+            remote_addr:
+            headers:
+
+        Returns:
+
+        """
+        return self.factory.post("/", REMOTE_ADDR=remote_addr, **headers)
+
+    @patch.object(settings, "RATE_LIMITS", {"contact": (1, 3600)})
+    def test_same_ip_is_limited(self):
+        """test_same_ip_is_limited"""
+
+        # Act
+        rate_limit.get_wait_time(self._post(), "contact")
+
+        # Assert
+        self.assertGreater(
+            rate_limit.get_wait_time(self._post(), "contact"), 0
+        )
+        self.assertEqual(
+            rate_limit.get_wait_time(self._post("10.0.0.2"), "contact"), 0
+        )
+
+    @patch.object(settings, "RATE_LIMITS", {"contact": (1, 3600)})
+    def test_same_email_from_other_ip_is_limited(self):
+        """test_same_email_from_other_ip_is_limited"""
+
+        # Act
+        rate_limit.get_wait_time(
+            self._post(), "contact", email="user@test.com"
+        )
+
+        # Assert
+        self.assertGreater(
+            rate_limit.get_wait_time(
+                self._post("10.0.0.2"), "contact", email=" USER@test.com"
+            ),
+            0,
+        )
+
+    @patch.object(settings, "RATE_LIMITS", {"contact": (1, 3600)})
+    def test_rejected_submission_does_not_take_email_token(self):
+        """test_rejected_submission_does_not_take_email_token"""
+
+        # Arrange
+        rate_limit.get_wait_time(self._post(), "contact")
+
+        # Act
+        rate_limit.get_wait_time(
+            self._post(), "contact", email="user@test.com"
+        )
+
+        # Assert
+        self.assertEqual(
+            rate_limit.get_wait_time(
+                self._post("10.0.0.2"), "contact", email="user@test.com"
+            ),
+            0,
+        )
+
+    @patch.object(settings, "RATE_LIMITS", {})
+    def test_scope_without_limit_is_allowed(self):
+        """test_scope_without_limit_is_allowed"""
+
+        # Act # Assert
+        for _ in range(3):
+            self.assertEqual(rate_limit.get_wait_time(self._post(), "x"), 0)
+
+    @patch.object(settings, "RATE_LIMIT_NUM_PROXIES", 1)
+    def test_client_ip_is_read_from_proxy_header(self):
+        """test_client_ip_is_read_from_proxy_header"""
+
+        # Arrange
+        request = self._post(
+            remote_addr="10.0.0.254",
+            HTTP_X_FORWARDED_FOR="1.2.3.4, 10.0.0.1",
+        )
+
+        # Act # Assert
+        self.assertEqual(rate_limit.get_client_ip(request), "10.0.0.1")
+
+    def test_proxy_header_is_ignored_without_proxies(self):
+        """test_proxy_header_is_ignored_without_proxies"""
+
+        # Arrange
+        request = self._post(HTTP_X_FORWARDED_FOR="1.2.3.4")
+
+        # Act # Assert
+        self.assertEqual(rate_limit.get_client_ip(request), "10.0.0.1")
@@ -0,0 +1,177 @@
+"""Integration tests of the static export of the website pages"""
+
+import gzip
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+import core_website_app.components.help.api as help_api
+from core_main_app.components.web_page.models import WebPage
+from core_website_app import settings
+from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.utils import static_export
+
+
+@override_settings(CUSTOM_NAME="Curator")
+class TestExportPages(TestCase):
+    """Test Export Pages"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+        self.help_page = WebPage.objects.create(
+            type=WEB_PAGE_TYPES["help"], content="# Help"
+        )
+
+    def test_export_pages_writes_html_and_gzip_files(self):
+        """test_export_pages_writes_html_and_gzip_files"""
+
+        # Act
+        static_export.export_pages(self.output_dir, ["help"])
+
+        # Assert
+        with open(os.path.join(self.output_dir, "help.html"), "rb") as file:
+            html = file.read()
+        self.assertIn(b"<h1>Help</h1>", html)
+        with gzip.open(
+            os.path.join(self.output_dir, "help.html.gz"), "rb"
+        ) as file:
+            self.assertEqual(file.read(), html)
+
+    def test_export_pages_writes_all_pages(self):
+        """test_export_pages_writes_all_pages"""
+
+        # Act
+        static_export.export_pages(self.output_dir)
+
+        # Assert
+        for _, file_name in static_export.STATIC_PAGES.values():
+            self.assertTrue(
+                os.path.exists(os.path.join(self.output_dir, file_name))
+            )
+            self.assertTrue(
+                os.path.exists(
+                    os.path.join(self.output_dir, file_name + ".gz")
+                )
+            )
+
+    def test_export_pages_leaves_no_temporary_file(self):
+        """test_export_pages_leaves_no_temporary_file"""
+
+        # Act
+        paths = static_export.export_pages(self.output_dir, ["help"])
+
+        # Assert
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)),
+            sorted(os.path.basename(path) for path in paths),
+        )
+
+    def test_export_pages_writes_brotli_file_if_installed(self):
+        """test_export_pages_writes_brotli_file_if_installed"""
+
+        # Arrange
+        mock_brotli = Mock()
+        mock_brotli.compress.return_value = b"compressed"
+
+        # Act
+        with patch.object(static_export, "brotli", mock_brotli):
+            static_export.export_pages(self.output_dir, ["help"])
+
+        # Assert
+        with open(os.path.join(self.output_dir, "help.html.br"), "rb") as file:
+            self.assertEqual(file.read(), b"compressed")
+
+    @patch("core_website_app.views.user.views.DISPLAY_NIST_HEADERS", True)
+    def test_export_pages_skips_redirected_page(self):
+        """test_export_pages_skips_redirected_page"""
+
+        # Act
+        paths = static_export.export_pages(self.output_dir, ["privacy_policy"])
+
+        # Assert
+        self.assertEqual(paths, [])
+
+    def test_export_pages_deletes_previous_export_of_redirected_page(self):
+        """test_export_pages_deletes_previous_export_of_redirected_page"""
+
+        # Arrange
+        mock_brotli = Mock()
+        mock_brotli.compress.return_value = b"compressed"
+        with patch.object(static_export, "brotli", mock_brotli):
+            static_export.export_pages(self.output_dir, ["privacy_policy"])
+
+        # Act
+        with patch(
+            "core_website_app.views.user.views.DISPLAY_NIST_HEADERS", True
+        ):
+            static_export.export_pages(self.output_dir, ["privacy_policy"])
+
+        # Assert
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    def test_upsert_exports_page_again(self):
+        """test_upsert_exports_page_again"""
+
+        # Arrange
+        self.help_page.content = "# New help"
+
+        # Act
+        with patch.object(
+            settings, "STATIC_EXPORT_DIR", self.output_dir
+        ), patch.object(settings, "STATIC_EXPORT_ON_UPSERT", True):
+            with self.captureOnCommitCallbacks(execute=True):
+                help_api.upsert(self.help_page)
+
+        # Assert
+        with open(os.path.join(self.output_dir, "help.html"), "rb") as file:
+            self.assertIn(b"<h1>New help</h1>", file.read())
+
+    def test_upsert_does_not_export_page_by_default(self):
+        """test_upsert_does_not_export_page_by_default"""
+
+        # Act
+        with patch.object(settings, "STATIC_EXPORT_DIR", self.output_dir):
+            with self.captureOnCommitCallbacks(execute=True):
+                help_api.upsert(self.help_page)
+
+        # Assert
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    def test_command_exports_pages(self):
+        """test_command_exports_pages"""
+
+        # Arrange
+        stdout = StringIO()
+
+        # Act
+        call_command(
+            "export_static_pages",
+            "--output",
+            self.output_dir,
+            "--page",
+            "help",
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+
+        # Assert
+        self.assertIn(
+            os.path.join(self.output_dir, "help.html"), stdout.getvalue()
+        )
+
+    def test_command_without_output_raises_error(self):
+        """test_command_without_output_raises_error"""
+
+        # Act # Assert
+        with self.assertRaises(CommandError):
+            call_command("export_static_pages", stderr=StringIO())
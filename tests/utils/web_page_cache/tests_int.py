@@ -0,0 +1,299 @@
+"""Integration tests of the web page cache"""
+
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+import core_website_app.components.help.api as help_api
+from core_main_app.components.web_page.models import WebPage
+from core_website_app import settings
+from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.components.web_page.models import RenderedWebPage
+from core_website_app.utils import web_page_cache, web_page_registry
+
+
+class TestGetRenderedPage(TestCase):
+    """Test Get Rendered Page"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.help_page = WebPage.objects.create(
+            type=WEB_PAGE_TYPES["help"], content="# Help"
+        )
+
+    def test_get_rendered_page_returns_html(self):
+        """test_get_rendered_page_returns_html"""
+
+        # Act
+        result = web_page_cache.get_rendered_page("help", help_api.get)
+
+        # Assert
+        self.assertIn("<h1>Help</h1>", result["content"])
+        self.assertEqual(
+            result["content_hash"], web_page_cache.get_content_hash("# Help")
+        )
+
+    def test_get_rendered_page_returns_rendering_date(self):
+        """test_get_rendered_page_returns_rendering_date"""
+
+        # Arrange
+        rendering_date = RenderedWebPage.get_by_web_page_id(
+            self.help_page.id
+        ).rendering_date
+
+        # Act
+        result = web_page_cache.get_rendered_page("help", help_api.get)
+
+        # Assert
+        self.assertEqual(
+            result["last_modified"], rendering_date.replace(microsecond=0)
+        )
+
+    def test_get_rendered_page_returns_none_if_page_does_not_exist(self):
+        """test_get_rendered_page_returns_none_if_page_does_not_exist"""
+
+        # Act
+        result = web_page_cache.get_rendered_page("terms_of_use", lambda: None)
+
+        # Assert
+        self.assertIsNone(result)
+
+    @patch("core_website_app.components.web_page.api.parse")
+    def test_get_rendered_page_does_not_parse_markdown(self, mock_parse):
+        """test_get_rendered_page_does_not_parse_markdown"""
+
+        # Act
+        web_page_cache.get_rendered_page("help", help_api.get)
+        with self.assertNumQueries(0):
+            web_page_cache.get_rendered_page("help", help_api.get)
+
+        # Assert
+        mock_parse.assert_not_called()
+
+    def test_upsert_invalidates_rendered_page(self):
+        """test_upsert_invalidates_rendered_page"""
+
+        # Arrange
+        web_page_cache.get_rendered_page("help", help_api.get)
+        self.help_page.content = "# New help"
+
+        # Act
+        help_api.upsert(self.help_page)
+
+        # Assert
+        self.assertIn(
+            "<h1>New help</h1>",
+            web_page_cache.get_rendered_page("help", help_api.get)["content"],
+        )
+
+    def test_delete_invalidates_rendered_page(self):
+        """test_delete_invalidates_rendered_page"""
+
+        # Arrange
+        web_page_cache.get_rendered_page("help", help_api.get)
+
+        # Act
+        self.help_page.delete()
+
+        # Assert
+        self.assertIsNone(
+            web_page_cache.get_rendered_page("help", help_api.get)
+        )
+
+    @patch("core_website_app.components.web_page.api.parse")
+    def test_page_is_not_parsed_again_after_cache_clear(self, mock_parse):
+        """test_page_is_not_parsed_again_after_cache_clear"""
+
+        # Arrange
+        web_page_cache.get_rendered_page("help", help_api.get)
+
+        # Act
+        cache.clear()
+        result = web_page_cache.get_rendered_page("help", help_api.get)
+
+        # Assert
+        self.assertIn("<h1>Help</h1>", result["content"])
+        mock_parse.assert_not_called()
+
+
+class TestTwoTierCache(TestCase):
+    """Test Two Tier Cache"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.get_page = Mock(
+            return_value=WebPage.objects.create(
+                type=WEB_PAGE_TYPES["help"], content="# Help"
+            )
+        )
+
+    def _get_entry_key(self):
+        """Get the cache key of the current version of the help page
+
+        Returns:
+
+        """
+        return web_page_cache._get_entry_key(
+            "help", web_page_cache._get_version(cache, "help")
+        )
+
+    def _hold_lock(self):
+        """Lock the entry of the help page, as another process would
+
+        Returns:
+
+        """
+        web_page_cache._acquire_lock(cache, self._get_entry_key())
+
+    def test_local_cache_serves_page_without_shared_cache_entry(self):
+        """test_local_cache_serves_page_without_shared_cache_entry"""
+
+        # Arrange
+        web_page_cache.get_page_entry("help", self.get_page)
+        cache.delete(self._get_entry_key())
+
+        # Act
+        result = web_page_cache.get_page_entry("help", self.get_page)
+
+        # Assert
+        self.assertIn("<h1>Help</h1>", result["content"])
+        self.get_page.assert_called_once()
+
+    def test_invalidate_changes_version(self):
+        """test_invalidate_changes_version"""
+
+        # Arrange
+        entry_key = self._get_entry_key()
+
+        # Act
+        web_page_cache.invalidate("help")
+
+        # Assert
+        self.assertNotEqual(self._get_entry_key(), entry_key)
+
+    def test_invalidate_changes_version_again_on_commit(self):
+        """test_invalidate_changes_version_again_on_commit"""
+
+        # Arrange
+        with self.captureOnCommitCallbacks(execute=True):
+            web_page_cache.invalidate("help")
+            # a process reading the page before the commit caches this key
+            entry_key = self._get_entry_key()
+
+        # Act
+        result = self._get_entry_key()
+
+        # Assert
+        self.assertNotEqual(result, entry_key)
+
+    @patch.object(settings, "WEB_PAGE_CACHE_TIMEOUT", 0)
+    def test_stale_page_is_refreshed_from_database(self):
+        """test_stale_page_is_refreshed_from_database"""
+
+        # Arrange
+        help_page = self.get_page.return_value
+        web_page_cache.get_page_entry("help")
+        # updated without signals: the version does not change
+        WebPage.objects.filter(id=help_page.id).update(content="# New")
+
+        # Act
+        with patch.object(
+            web_page_registry, "get_page", return_value=help_page
+        ):
+            result = web_page_cache.get_page_entry("help")
+
+        # Assert
+        self.assertIn("<h1>New</h1>", result["content"])
+
+    @patch.object(settings, "WEB_PAGE_CACHE_TIMEOUT", 0)
+    def test_stale_page_is_served_while_another_process_refreshes_it(self):
+        """test_stale_page_is_served_while_another_process_refreshes_it"""
+
+        # Arrange
+        stale_entry = web_page_cache.get_page_entry("help", self.get_page)
+        self._hold_lock()
+
+        # Act
+        result = web_page_cache.get_page_entry("help", self.get_page)
+
+        # Assert
+        self.assertEqual(result, stale_entry)
+        self.get_page.assert_called_once()
+
+    @patch.object(settings, "WEB_PAGE_CACHE_TIMEOUT", 0)
+    def test_stale_page_is_refreshed_with_same_last_modified(self):
+        """test_stale_page_is_refreshed_with_same_last_modified"""
+
+        # Arrange
+        stale_entry = web_page_cache.get_page_entry("help", self.get_page)
+
+        # Act
+        result = web_page_cache.get_page_entry("help", self.get_page)
+
+        # Assert
+        self.assertIsNot(result, stale_entry)
+        self.assertEqual(self.get_page.call_count, 2)
+        self.assertEqual(result["last_modified"], stale_entry["last_modified"])
+
+    def test_missing_page_waits_for_process_building_it(self):
+        """test_missing_page_waits_for_process_building_it"""
+
+        # Arrange
+        self._hold_lock()
+        entry = {"content": "<p>built</p>", "content_hash": "hash"}
+
+        def build_in_other_process(seconds):
+            """Store the entry, as the process holding the lock would"""
+            cache.set(self._get_entry_key(), entry)
+
+        # Act
+        with patch(
+            "core_website_app.utils.web_page_cache.time.sleep",
+            side_effect=build_in_other_process,
+        ):
+            result = web_page_cache.get_page_entry("help", self.get_page)
+
+        # Assert
+        self.assertEqual(result, entry)
+        self.get_page.assert_not_called()
+
+    @patch.object(settings, "WEB_PAGE_CACHE_LOCK_TIMEOUT", 0)
+    def test_missing_page_is_built_if_lock_times_out(self):
+        """test_missing_page_is_built_if_lock_times_out"""
+
+        # Arrange
+        self._hold_lock()
+
+        # Act
+        result = web_page_cache.get_page_entry("help", self.get_page)
+
+        # Assert
+        self.assertIn("<h1>Help</h1>", result["content"])
+        self.get_page.assert_called_once()
+
+
+class TestLocalCache(TestCase):
+    """Test Local Cache"""
+
+    def test_set_removes_least_recently_used_entry(self):
+        """test_set_removes_least_recently_used_entry"""
+
+        # Arrange
+        local_cache = web_page_cache.LocalCache(2)
+        local_cache.set("a", 1)
+        local_cache.set("b", 2)
+        local_cache.get("a")
+
+        # Act
+        local_cache.set("c", 3)
+
+        # Assert
+        self.assertEqual(len(local_cache), 2)
+        self.assertEqual(local_cache.get("a"), 1)
+        self.assertIsNone(local_cache.get("b"))
+        self.assertEqual(local_cache.get("c"), 3)
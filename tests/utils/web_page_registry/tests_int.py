@@ -0,0 +1,162 @@
+"""Integration tests of the web page registry"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+import core_website_app.components.help.api as help_api
+from core_main_app.components.web_page.models import WebPage
+from core_website_app import settings
+from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.utils import web_page_registry
+from core_website_app.utils.custom_context_processors import (
+    domain_context_processor,
+)
+
+
+class TestWebPageRegistry(TestCase):
+    """Test Web Page Registry"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        web_page_registry.invalidate()
+        self.help_page = WebPage.objects.create(
+            type=WEB_PAGE_TYPES["help"], content="# Help"
+        )
+        WebPage.objects.create(
+            type=WEB_PAGE_TYPES["terms_of_use"], content="# Terms"
+        )
+
+    def test_get_snapshot_loads_all_pages_in_one_query(self):
+        """test_get_snapshot_loads_all_pages_in_one_query"""
+
+        # Act
+        with self.assertNumQueries(1):
+            web_page_registry.get_snapshot()
+
+        # Assert
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                web_page_registry.get_page("help").content, "# Help"
+            )
+            self.assertTrue(web_page_registry.exists("terms_of_use"))
+            self.assertFalse(web_page_registry.exists("privacy_policy"))
+
+    def test_get_page_loads_rendered_html(self):
+        """test_get_page_loads_rendered_html"""
+
+        # Arrange
+        web_page_registry.get_snapshot()
+
+        # Act
+        with self.assertNumQueries(0):
+            html = web_page_registry.get_page("help").rendered.html
+
+        # Assert
+        self.assertIn("<h1>Help</h1>", html)
+
+    def test_get_existing_pages_returns_all_page_names(self):
+        """test_get_existing_pages_returns_all_page_names"""
+
+        # Act
+        result = web_page_registry.get_existing_pages()
+
+        # Assert
+        self.assertTrue(result["help"])
+        self.assertTrue(result["terms_of_use"])
+        self.assertFalse(result["privacy_policy"])
+        self.assertFalse(result["rules_of_behavior"])
+
+    def test_upsert_invalidates_snapshot(self):
+        """test_upsert_invalidates_snapshot"""
+
+        # Arrange
+        web_page_registry.get_snapshot()
+        self.help_page.content = "# New help"
+
+        # Act
+        help_api.upsert(self.help_page)
+
+        # Assert
+        self.assertEqual(
+            web_page_registry.get_page("help").content, "# New help"
+        )
+
+    def test_delete_invalidates_snapshot(self):
+        """test_delete_invalidates_snapshot"""
+
+        # Arrange
+        web_page_registry.get_snapshot()
+
+        # Act
+        self.help_page.delete()
+
+        # Assert
+        self.assertFalse(web_page_registry.exists("help"))
+        self.assertIsNone(web_page_registry.get_page("help"))
+
+    def test_snapshot_is_loaded_again_when_version_changes(self):
+        """test_snapshot_is_loaded_again_when_version_changes"""
+
+        # Arrange
+        web_page_registry.get_snapshot()
+        # saved by another process, without the signals of this one
+        WebPage.objects.filter(id=self.help_page.id).update(content="# New")
+
+        # Act
+        cache.set(web_page_registry.VERSION_CACHE_KEY, "other version")
+
+        # Assert
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                web_page_registry.get_page("help").content, "# New"
+            )
+
+    def test_snapshot_is_loaded_again_when_expired(self):
+        """test_snapshot_is_loaded_again_when_expired"""
+
+        # Arrange
+        web_page_registry.get_snapshot()
+        # saved by another process, with a version cache not shared
+        WebPage.objects.filter(id=self.help_page.id).update(content="# New")
+
+        # Act
+        with patch.object(settings, "WEB_PAGE_CACHE_TIMEOUT", 0):
+            page = web_page_registry.get_page("help")
+
+        # Assert
+        self.assertEqual(page.content, "# New")
+
+    def test_get_request_pages_reads_version_once_per_request(self):
+        """test_get_request_pages_reads_version_once_per_request"""
+
+        # Arrange
+        request = RequestFactory().get("/")
+        web_page_registry.get_snapshot()
+
+        # Act
+        with patch.object(
+            web_page_registry, "_get_version", return_value=None
+        ) as mock_get_version:
+            for _ in range(3):
+                pages = web_page_registry.get_request_pages(request)
+
+        # Assert
+        mock_get_version.assert_called_once()
+        self.assertTrue(pages["help"])
+
+    def test_context_processor_exposes_existing_pages(self):
+        """test_context_processor_exposes_existing_pages"""
+
+        # Arrange
+        request = RequestFactory().get("/")
+
+        # Act
+        context = domain_context_processor(request)
+
+        # Assert
+        self.assertTrue(context["WEBSITE_PAGES"]["help"])
+        self.assertFalse(context["WEBSITE_PAGES"]["privacy_policy"])
@@ -1,22 +1,21 @@
 """Unit test for `views.admin.views` package."""
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.test import RequestFactory, SimpleTestCase
 
-from core_main_app.utils.tests_tools.MockUser import create_mock_user
-from core_website_app.views.admin.views import _build_requests_context
+from core_main_app.components.web_page.models import WebPage
+from core_website_app.views.admin import ajax as admin_ajax
+from core_website_app.views.admin.views import (
+    WebsitePageView,
+    _build_requests_context,
+)
 
 
 class TestBuildRequestsContext(SimpleTestCase):
     """Test Build Requests Context"""
 
-    @patch(
-        "core_website_app.components.account_request.api._get_user_by_username"
-    )
-    def test_build_requests_context_returns_list(
-        self, mock_get_user_by_username
-    ):
+    def test_build_requests_context_returns_list(self):
         """test_build_requests_context_returns_list
 
         Returns:
@@ -25,7 +24,7 @@ class TestBuildRequestsContext(SimpleTestCase):
         # Arrange
         mock_request = MagicMock()
         mock_request_list = [mock_request]
-        mock_get_user_by_username.return_value = create_mock_user(2)
+        mock_request.user_id = 2
         # Act
         request_context = _build_requests_context(
             request_list=mock_request_list
@@ -33,11 +32,8 @@ class TestBuildRequestsContext(SimpleTestCase):
         # Assert
         self.assertTrue(isinstance(request_context, list))
 
-    @patch(
-        "core_website_app.components.account_request.api._get_user_by_username"
-    )
     def test_build_requests_context_contains_requests_fields_and_edit_url(
-        self, mock_get_user_by_username
+        self,
     ):
         """test_build_requests_context_contains_requests_fields_and_edit_url
 
@@ -47,7 +43,7 @@ class TestBuildRequestsContext(SimpleTestCase):
         # Arrange
         mock_request = MagicMock()
         mock_request_list = [mock_request]
-        mock_get_user_by_username.return_value = create_mock_user(2)
+        mock_request.user_id = 2
         # Act
         request_context = _build_requests_context(
             request_list=mock_request_list
@@ -61,11 +57,8 @@ class TestBuildRequestsContext(SimpleTestCase):
         self.assertTrue("date" in request_context[0])
         self.assertTrue("edit_url" in request_context[0])
 
-    @patch(
-        "core_website_app.components.account_request.api._get_user_by_username"
-    )
     def test_build_requests_context_edit_url_redirects_to_admin_user_page(
-        self, mock_get_user_by_username
+        self,
     ):
         """test_build_requests_context_edit_url_redirects_to_admin_user_page
 
@@ -76,7 +69,7 @@ class TestBuildRequestsContext(SimpleTestCase):
         mock_request = MagicMock()
         mock_request_list = [mock_request]
         mock_user_id = 2
-        mock_get_user_by_username.return_value = create_mock_user(mock_user_id)
+        mock_request.user_id = mock_user_id
         # Act
         request_context = _build_requests_context(
             request_list=mock_request_list
@@ -86,3 +79,115 @@ class TestBuildRequestsContext(SimpleTestCase):
             f"admin/auth/user/{str(mock_user_id)}/change"
             in request_context[0]["edit_url"]
         )
+
+    def test_build_requests_context_edit_url_is_none_if_user_not_found(self):
+        """test_build_requests_context_edit_url_is_none_if_user_not_found
+
+        Returns:
+
+        """
+        # Arrange
+        mock_request = MagicMock()
+        mock_request.user_id = None
+        # Act
+        request_context = _build_requests_context(request_list=[mock_request])
+        # Assert
+        self.assertIsNone(request_context[0]["edit_url"])
+
+
+class TestWebsitePageViewPost(SimpleTestCase):
+    """Test Website Page View Post"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.request = RequestFactory().post(
+            "/admin/help", {"content": "# Help"}
+        )
+        self.request.user = MagicMock(is_active=True, is_staff=True)
+        self.api = MagicMock()
+        self.view = WebsitePageView.as_view(
+            api=self.api,
+            get_redirect="core_website_app/admin/help.html",
+            post_redirect="core-admin:core_website_app_help",
+            web_page_type=2,
+        )
+
+    @patch("core_website_app.views.admin.views.reverse", return_value="/help")
+    @patch("core_website_app.views.admin.views.messages")
+    @patch("core_main_app.views.admin.views.WebPageView.post")
+    def test_post_unchanged_page_reports_no_changes(
+        self, mock_post, mock_messages, mock_reverse
+    ):
+        """test_post_unchanged_page_reports_no_changes"""
+
+        # Arrange
+        self.api.get.return_value = WebPage(type=2, content="# Help")
+
+        # Act
+        response = self.view(self.request)
+
+        # Assert
+        self.assertEqual(response.status_code, 302)
+        mock_post.assert_not_called()
+        self.api.upsert.assert_not_called()
+        mock_messages.add_message.assert_called_once_with(
+            self.request, mock_messages.INFO, "No changes to save."
+        )
+
+    @patch("core_main_app.views.admin.views.WebPageView.post")
+    def test_post_changed_page_is_saved_by_core_view(self, mock_post):
+        """test_post_changed_page_is_saved_by_core_view"""
+
+        # Arrange
+        self.api.get.return_value = WebPage(type=2, content="# Old help")
+
+        # Act
+        self.view(self.request)
+
+        # Assert
+        mock_post.assert_called_once_with(self.request)
+
+    @patch("core_main_app.views.admin.views.WebPageView.post")
+    def test_post_new_page_is_saved_by_core_view(self, mock_post):
+        """test_post_new_page_is_saved_by_core_view"""
+
+        # Arrange
+        self.api.get.return_value = None
+
+        # Act
+        self.view(self.request)
+
+        # Assert
+        mock_post.assert_called_once_with(self.request)
+
+
+class TestBulkAcceptRequests(SimpleTestCase):
+    """Test Bulk Accept Requests"""
+
+    @patch("core_website_app.views.admin.ajax.messages")
+    @patch(
+        "core_website_app.components.account_request.api.accept_all",
+        return_value=(2, ["rejected@test.com"]),
+    )
+    def test_bulk_accept_requests_reports_failed_recipients(
+        self, mock_accept_all, mock_messages
+    ):
+        """test_bulk_accept_requests_reports_failed_recipients"""
+
+        # Arrange
+        request = RequestFactory().post(
+            "/admin/bulk_accept", {"requestids[]": ["1", "2"]}
+        )
+        request.user = MagicMock(is_active=True, is_staff=True)
+
+        # Act
+        response = admin_ajax.bulk_accept_requests(request)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        mock_messages.add_message.assert_called_once_with(
+            request,
+            mock_messages.WARNING,
+            "The email could not be sent to: rejected@test.com",
+        )
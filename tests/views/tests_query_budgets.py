@@ -0,0 +1,389 @@
+"""Query budgets of the views
+
+Each view is called with several rows in the database, and must not send
+more queries than its budget, declared in the QUERY_BUDGETS setting. The
+templates are rendered, so their queries and the queries of the context
+processors are counted.
+"""
+
+from unittest.mock import patch
+
+from captcha.conf import settings as captcha_settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from core_main_app.components.web_page.models import WebPage
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+from core_website_app import settings
+from core_website_app.commons.enums import WEB_PAGE_TYPES
+from core_website_app.components.account_request.models import AccountRequest
+from core_website_app.components.contact_message.models import ContactMessage
+from core_website_app.rest.account_request import (
+    views as account_request_views,
+)
+from core_website_app.rest.contact_message import (
+    views as contact_message_views,
+)
+from core_website_app.utils import query_stats
+from core_website_app.views.admin import ajax as admin_ajax
+from core_website_app.views.admin import views as admin_views
+from core_website_app.views.user import views as user_views
+
+ROW_COUNT = 10
+
+
+# the templates need the core context and the core and admin urls
+@override_settings(CUSTOM_NAME="Curator", ROOT_URLCONF="tests.views.urls")
+class QueryBudgetTestCase(TestCase):
+    """Seed the database and check the query budgets"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.factory = RequestFactory()
+        self.staff_user = User.objects.create(
+            username="staff", is_staff=True, is_superuser=True
+        )
+        self.account_requests = []
+        for index in range(ROW_COUNT):
+            User.objects.create(
+                username="user%d" % index,
+                email="user%d@example.com" % index,
+                is_active=False,
+            )
+            self.account_requests.append(
+                AccountRequest.objects.create(
+                    username="user%d" % index,
+                    email="user%d@example.com" % index,
+                )
+            )
+            ContactMessage.objects.create(
+                name="name", email="contact@example.com", content="message"
+            )
+        for web_page_type in WEB_PAGE_TYPES.values():
+            WebPage.objects.create(type=web_page_type, content="# Page")
+
+    def assertWithinBudget(self, view_name, call):
+        """Check that a call sends no more queries than the budget of the
+        view
+
+        Args:
+            view_name: name of the view in the QUERY_BUDGETS setting
+            call: function calling the view
+
+        Returns:
+            response
+        """
+        with query_stats.track_queries() as stats:
+            response = call()
+        self.assertLessEqual(
+            stats.count,
+            settings.QUERY_BUDGETS[view_name],
+            "%s: %s" % (view_name, str(stats)),
+        )
+        return response
+
+    def _get_request(self, method="get", data=None, user=None):
+        """Build a request with a session and messages
+
+        Args:
+            method:
+            data:
+            user:
+
+        Returns:
+
+        """
+        request = getattr(self.factory, method)("/", data=data)
+        request.user = user or AnonymousUser()
+        request.session = SessionBase()
+        request._messages = FallbackStorage(request)
+        return request
+
+
+class TestUserViewsQueryBudgets(QueryBudgetTestCase):
+    """Test User Views Query Budgets"""
+
+    def test_request_new_account_get(self):
+        """test_request_new_account_get"""
+
+        self.assertWithinBudget(
+            "core_website_app_account_request",
+            lambda: user_views.request_new_account(self._get_request()),
+        )
+
+    @patch.object(captcha_settings, "CAPTCHA_TEST_MODE", True)
+    @patch.object(user_views, "reverse", return_value="/")
+    def test_request_new_account_post(self, mock_reverse):
+        """test_request_new_account_post"""
+
+        response = self.assertWithinBudget(
+            "core_website_app_account_request",
+            lambda: user_views.request_new_account(
+                self._get_request(
+                    "post",
+                    {
+                        "username": "new_user",
+                        "firstname": "first",
+                        "lastname": "last",
+                        "email": "new_user@example.com",
+                        "password1": "Budget-password-1",
+                        "password2": "Budget-password-1",
+                        "captcha_0": "key",
+                        "captcha_1": "PASSED",
+                    },
+                )
+            ),
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_contact_get(self):
+        """test_contact_get"""
+
+        self.assertWithinBudget(
+            "core_website_app_contact",
+            lambda: user_views.contact(self._get_request()),
+        )
+
+    @patch.object(captcha_settings, "CAPTCHA_TEST_MODE", True)
+    @patch.object(user_views, "reverse", return_value="/")
+    def test_contact_post(self, mock_reverse):
+        """test_contact_post"""
+
+        response = self.assertWithinBudget(
+            "core_website_app_contact",
+            lambda: user_views.contact(
+                self._get_request(
+                    "post",
+                    {
+                        "name": "name",
+                        "email": "contact@example.com",
+                        "message": "message",
+                        "captcha_0": "key",
+                        "captcha_1": "PASSED",
+                    },
+                )
+            ),
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_web_pages(self):
+        """test_web_pages"""
+
+        for view_name, view in (
+            ("core_website_app_help", user_views.help_page),
+            ("core_website_app_privacy", user_views.privacy_policy),
+            ("core_website_app_terms", user_views.terms_of_use),
+            (
+                "core_website_app_rules_of_behavior",
+                user_views.rules_of_behavior,
+            ),
+        ):
+            self.assertWithinBudget(
+                view_name, lambda: view(self._get_request())
+            )
+
+
+class TestAdminViewsQueryBudgets(QueryBudgetTestCase):
+    """Test Admin Views Query Budgets"""
+
+    def test_user_requests(self):
+        """test_user_requests"""
+
+        self.assertWithinBudget(
+            "core-admin:core_website_app_user_requests",
+            lambda: admin_views.user_requests(
+                self._get_request(user=self.staff_user)
+            ),
+        )
+
+    def test_contact_messages(self):
+        """test_contact_messages"""
+
+        self.assertWithinBudget(
+            "core-admin:core_website_app_contact_messages",
+            lambda: admin_views.contact_messages(
+                self._get_request(user=self.staff_user)
+            ),
+        )
+
+    def test_counts(self):
+        """test_counts"""
+
+        for view_name, view in (
+            (
+                "core-admin:core_website_app_request_count",
+                admin_ajax.account_request_count,
+            ),
+            (
+                "core-admin:core_website_app_message_count",
+                admin_ajax.contact_message_count,
+            ),
+            (
+                "core-admin:core_website_app_badge_counts",
+                admin_ajax.badge_counts_view,
+            ),
+        ):
+            self.assertWithinBudget(
+                view_name,
+                lambda: view(self._get_request("post", user=self.staff_user)),
+            )
+
+    def test_accept_and_deny_requests(self):
+        """test_accept_and_deny_requests"""
+
+        self.assertWithinBudget(
+            "core-admin:core_website_app_accept_user_request",
+            lambda: admin_ajax.accept_request(
+                self._get_request(
+                    "post",
+                    {"requestid": self.account_requests[0].id},
+                    user=self.staff_user,
+                )
+            ),
+        )
+        self.assertWithinBudget(
+            "core-admin:core_website_app_deny_user_request",
+            lambda: admin_ajax.deny_request(
+                self._get_request(
+                    "post",
+                    {"requestid": self.account_requests[1].id},
+                    user=self.staff_user,
+                )
+            ),
+        )
+
+    def test_bulk_accept_and_deny_requests(self):
+        """test_bulk_accept_and_deny_requests"""
+
+        ids = [account_request.id for account_request in self.account_requests]
+        self.assertWithinBudget(
+            "core-admin:core_website_app_bulk_accept_user_requests",
+            lambda: admin_ajax.bulk_accept_requests(
+                self._get_request(
+                    "post", {"requestids[]": ids[:5]}, user=self.staff_user
+                )
+            ),
+        )
+        self.assertWithinBudget(
+            "core-admin:core_website_app_bulk_deny_user_requests",
+            lambda: admin_ajax.bulk_deny_requests(
+                self._get_request(
+                    "post", {"requestids[]": ids[5:]}, user=self.staff_user
+                )
+            ),
+        )
+
+
+class TestRestViewsQueryBudgets(QueryBudgetTestCase):
+    """Test Rest Views Query Budgets"""
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+        self.user = create_mock_user("1", is_staff=True)
+
+    def test_account_request_list_and_detail(self):
+        """test_account_request_list_and_detail"""
+
+        self.assertWithinBudget(
+            "core_website_app_rest_account_request_list",
+            lambda: RequestMock.do_request_get(
+                account_request_views.AccountRequestList.as_view(), self.user
+            ),
+        )
+        self.assertWithinBudget(
+            "core_website_app_rest_account_request_detail",
+            lambda: RequestMock.do_request_get(
+                account_request_views.AccountRequestDetail.as_view(),
+                self.user,
+                param={"pk": self.account_requests[0].id},
+            ),
+        )
+
+    def test_account_request_accept_and_deny(self):
+        """test_account_request_accept_and_deny"""
+
+        for view_name, view, account_request in (
+            (
+                "core_website_app_rest_account_request_accept",
+                account_request_views.AccountRequestAccept,
+                self.account_requests[0],
+            ),
+            (
+                "core_website_app_rest_account_request_deny",
+                account_request_views.AccountRequestDeny,
+                self.account_requests[1],
+            ),
+        ):
+            response = self.assertWithinBudget(
+                view_name,
+                lambda: RequestMock.do_request_patch(
+                    view.as_view(),
+                    self.user,
+                    param={"pk": account_request.id},
+                ),
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_account_request_bulk_accept_and_deny(self):
+        """test_account_request_bulk_accept_and_deny"""
+
+        ids = [account_request.id for account_request in self.account_requests]
+        for view_name, view, id_list in (
+            (
+                "core_website_app_rest_account_request_bulk_accept",
+                account_request_views.AccountRequestBulkAccept,
+                ids[:5],
+            ),
+            (
+                "core_website_app_rest_account_request_bulk_deny",
+                account_request_views.AccountRequestBulkDeny,
+                ids[5:],
+            ),
+        ):
+            response = self.assertWithinBudget(
+                view_name,
+                lambda: RequestMock.do_request_patch(
+                    view.as_view(), self.user, data={"ids": id_list}
+                ),
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_contact_message_list_and_detail(self):
+        """test_contact_message_list_and_detail"""
+
+        self.assertWithinBudget(
+            "core_website_app_rest_message_list",
+            lambda: RequestMock.do_request_get(
+                contact_message_views.ContactMessageList.as_view(), self.user
+            ),
+        )
+        self.assertWithinBudget(
+            "core_website_app_rest_message_detail",
+            lambda: RequestMock.do_request_get(
+                contact_message_views.ContactMessageDetail.as_view(),
+                self.user,
+                param={"pk": ContactMessage.objects.first().id},
+            ),
+        )
+
+    def test_contact_message_export(self):
+        """test_contact_message_export"""
+
+        response = self.assertWithinBudget(
+            "core_website_app_rest_message_export",
+            lambda: b"".join(
+                RequestMock.do_request_get(
+                    contact_message_views.ContactMessageExport.as_view(),
+                    self.user,
+                ).streaming_content
+            ),
+        )
+        self.assertEqual(len(response.splitlines()), ROW_COUNT + 1)
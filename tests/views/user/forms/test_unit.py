@@ -1,57 +1,36 @@
 """Unit tests for forms"""
 
 from unittest import TestCase
-from unittest.mock import patch, Mock
-
-from django.contrib.auth.models import User
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from unittest.mock import patch
 
+from core_website_app.components.account_request.models import AccountRequest
 from core_website_app.views.user.forms import RequestAccountForm
 
 
 class TestRequestAccountForm(TestCase):
-    @patch(
-        "core_website_app.components.account_request.api" "._get_user_by_email"
-    )
-    def test_request_account_form_clean_email_raises_validation_error_if_email_exists(
-        self, mock_get_user_by_email
-    ):
-        """test_request_account_form_clean_email_raises_validation_error_if_email_exists
-
-        Returns:
-
-        """
-        # Arrange
-        mock_user = Mock(spec=User)
-        mock_user.username = "username"
-        mock_get_user_by_email.return_value = mock_user
-        form = RequestAccountForm()
-        form.cleaned_data = {"email": "email"}
-
-        # Act + Arrange
-        with self.assertRaises(ValidationError):
-            form.clean_email()
-
-    @patch(
-        "core_website_app.components.account_request.api" "._get_user_by_email"
-    )
-    def test_request_account_form_clean_email_returns_email_if_email_does_not_exist(
-        self, mock_get_user_by_email
+    @patch.object(AccountRequest, "get_conflicts")
+    def test_request_account_form_does_not_check_email_conflicts(
+        self, mock_get_conflicts
     ):
-        """test_request_account_form_clean_email_returns_email_if_email_does_not_exist
+        """test_request_account_form_does_not_check_email_conflicts
 
         Returns:
 
         """
         # Arrange
-        mock_get_user_by_email.side_effect = ObjectDoesNotExist()
-        input_email = "email"
-
-        form = RequestAccountForm()
-        form.cleaned_data = {"email": input_email}
+        form = RequestAccountForm(
+            data={
+                "username": "username",
+                "firstname": "firstname",
+                "lastname": "lastname",
+                "email": "user@test.com",
+            }
+        )
 
         # Act
-        output_email = form.clean_email()
+        form.is_valid()
 
         # Assert
-        self.assertEqual(input_email, output_email)
+        # conflicts are checked once, by the API, when the request is saved
+        mock_get_conflicts.assert_not_called()
+        self.assertNotIn("email", form.errors)
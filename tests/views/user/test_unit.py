@@ -0,0 +1,232 @@
+"""Unit test for `views.user.views` package."""
+
+import datetime
+from unittest.mock import patch, Mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import SimpleTestCase, RequestFactory
+from django.utils.http import http_date
+
+from core_main_app.components.web_page.models import WebPage
+from core_website_app import settings
+from core_website_app.components.web_page.models import RenderedWebPage
+from core_website_app.views.user import views as user_views
+
+RENDERING_DATE = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _get_rendered(web_page):
+    """Render a web page without storing it
+
+    Args:
+        web_page:
+
+    Returns:
+
+    """
+    return RenderedWebPage(
+        content_hash=RenderedWebPage.get_content_hash(web_page.content),
+        html=web_page.content,
+        rendering_date=RENDERING_DATE,
+    )
+
+
+@patch("core_website_app.components.web_page.api.get_rendered", _get_rendered)
+@patch.object(
+    user_views, "render", side_effect=lambda *args, **kwargs: HttpResponse()
+)
+@patch("core_website_app.utils.web_page_registry.get_page")
+class TestHelpPageConditionalGet(SimpleTestCase):
+    """Test Help Page Conditional Get"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _get(self, **headers):
+        """Send a GET request to the help page
+
+        Args:
+            headers:
+
+        Returns:
+
+        """
+        request = self.factory.get("/help/", **headers)
+        request.user = AnonymousUser()
+        return user_views.help_page(request)
+
+    def test_help_page_returns_etag_and_last_modified(
+        self, mock_get, mock_render
+    ):
+        """test_help_page_returns_etag_and_last_modified"""
+
+        # Arrange
+        mock_get.return_value = Mock(spec=WebPage, content="# Help")
+
+        # Act
+        response = self._get()
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.has_header("ETag"))
+        self.assertEqual(
+            response["Last-Modified"], http_date(RENDERING_DATE.timestamp())
+        )
+
+    def test_help_page_returns_304_if_etag_matches(
+        self, mock_get, mock_render
+    ):
+        """test_help_page_returns_304_if_etag_matches"""
+
+        # Arrange
+        mock_get.return_value = Mock(spec=WebPage, content="# Help")
+        etag = self._get()["ETag"]
+        mock_render.reset_mock()
+
+        # Act
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        mock_render.assert_not_called()
+        mock_get.assert_called_once()
+
+    def test_help_page_returns_304_if_not_modified_since(
+        self, mock_get, mock_render
+    ):
+        """test_help_page_returns_304_if_not_modified_since"""
+
+        # Arrange
+        mock_get.return_value = Mock(spec=WebPage, content="# Help")
+        last_modified = self._get()["Last-Modified"]
+
+        # Act
+        response = self._get(HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+
+    def test_help_page_returns_200_if_content_changed(
+        self, mock_get, mock_render
+    ):
+        """test_help_page_returns_200_if_content_changed"""
+
+        # Arrange
+        mock_get.return_value = Mock(spec=WebPage, content="# Help")
+        etag = self._get()["ETag"]
+        mock_get.return_value = Mock(spec=WebPage, content="# New help")
+        cache.clear()
+
+        # Act
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+@patch("core_website_app.components.web_page.api.get_rendered", _get_rendered)
+@patch.object(
+    user_views, "render", side_effect=lambda *args, **kwargs: HttpResponse()
+)
+@patch("core_website_app.utils.web_page_registry.get_page")
+class TestRulesOfBehaviorPage(SimpleTestCase):
+    """Test Rules Of Behavior Page"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+
+    @patch("core_website_app.components.rules_of_behavior.api.get")
+    def test_rules_of_behavior_reads_page_from_registry(
+        self, mock_api_get, mock_get_page, mock_render
+    ):
+        """test_rules_of_behavior_reads_page_from_registry"""
+
+        # Arrange
+        mock_get_page.return_value = Mock(spec=WebPage, content="# Rules")
+        request = RequestFactory().get("/rules-of-behavior/")
+        request.user = AnonymousUser()
+
+        # Act
+        response = user_views.rules_of_behavior(request)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        mock_get_page.assert_called_once_with("rules_of_behavior")
+        mock_api_get.assert_not_called()
+
+
+@patch.object(
+    user_views, "render", side_effect=lambda *args, **kwargs: HttpResponse()
+)
+@patch.object(
+    settings,
+    "RATE_LIMITS",
+    {"contact": (1, 3600), "account_request": (1, 3600)},
+)
+class TestFormsRateLimit(SimpleTestCase):
+    """Test Forms Rate Limit"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _post(self, view):
+        """Send a POST request to a form
+
+        Args:
+            view:
+
+        Returns:
+
+        """
+        request = self.factory.post("/", data={"email": "user@test.com"})
+        request.user = AnonymousUser()
+        return view(request)
+
+    @patch.object(user_views, "ContactForm")
+    def test_contact_returns_429_before_validating_form(
+        self, mock_contact_form, mock_render
+    ):
+        """test_contact_returns_429_before_validating_form"""
+
+        # Arrange
+        mock_contact_form.return_value.is_valid.return_value = False
+        self._post(user_views.contact)
+        mock_contact_form.reset_mock()
+
+        # Act
+        response = self._post(user_views.contact)
+
+        # Assert
+        self.assertEqual(response.status_code, 429)
+        mock_contact_form.return_value.is_valid.assert_not_called()
+
+    @patch.object(user_views, "make_password")
+    @patch.object(user_views, "RequestAccountForm")
+    def test_request_new_account_returns_429_before_hashing_password(
+        self, mock_request_account_form, mock_make_password, mock_render
+    ):
+        """test_request_new_account_returns_429_before_hashing_password"""
+
+        # Arrange
+        mock_request_account_form.return_value.is_valid.return_value = False
+        self._post(user_views.request_new_account)
+        mock_request_account_form.reset_mock()
+
+        # Act
+        response = self._post(user_views.request_new_account)
+
+        # Assert
+        self.assertEqual(response.status_code, 429)
+        mock_request_account_form.return_value.is_valid.assert_not_called()
+        mock_make_password.assert_not_called()